@@ -0,0 +1,48 @@
+"""add composite and partial indexes for the public queries
+
+Revision ID: 4c8e0a2d6f57
+Revises: e2a4c6f8b391
+Create Date: 2025-08-28 10:41:03.662894
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c8e0a2d6f57'
+down_revision: Union[str, Sequence[str], None] = 'e2a4c6f8b391'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same predicate as app.models.ACTIVE_ROWS_ONLY
+ACTIVE_ROWS_ONLY = {'postgresql_where': sa.text('is_active = true'), 'sqlite_where': sa.text('is_active = 1')}
+
+# (name, table, columns, partial on active rows)
+INDEXES = (
+    ('ix_kagyur_texts_sub_category_order', 'kagyur_texts', ['sub_category_id', 'order_index', 'id'], False),
+    ('ix_kagyur_texts_sub_category_tibetan', 'kagyur_texts', ['sub_category_id', 'tibetan_sort_key', 'id'], False),
+    ('ix_kagyur_texts_active_sub_category', 'kagyur_texts', ['sub_category_id'], True),
+    ('ix_sub_categories_active_main_category', 'sub_categories', ['main_category_id', 'order_index'], True),
+    ('ix_text_summaries_text_id', 'text_summaries', ['text_id'], False),
+    ('ix_yeshe_de_spans_text_id', 'yeshe_de_spans', ['text_id'], False),
+    ('ix_volumes_yeshe_de_span_id', 'volumes', ['yeshe_de_span_id'], False),
+    ('ix_kagyur_audio_text_id', 'kagyur_audio', ['text_id'], False),
+    ('ix_kagyur_audio_active_text_order', 'kagyur_audio', ['text_id', 'order_index'], True),
+    ('ix_kagyur_news_active_published', 'kagyur_news', ['publication_status', 'published_date'], True),
+    ('ix_kangyur_video_active_published', 'kangyur_video', ['publication_status', 'published_date'], True),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table_name, columns, active_only in INDEXES:
+        op.create_index(name, table_name, columns, unique=False, **(ACTIVE_ROWS_ONLY if active_only else {}))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table_name, columns, active_only in reversed(INDEXES):
+        op.drop_index(name, table_name=table_name)
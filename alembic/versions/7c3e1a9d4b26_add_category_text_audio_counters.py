@@ -0,0 +1,59 @@
+"""add text_count/audio_count counters to categories
+
+Revision ID: 7c3e1a9d4b26
+Revises: df155954f118
+Create Date: 2025-08-04 09:12:31.204517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3e1a9d4b26'
+down_revision: Union[str, Sequence[str], None] = 'df155954f118'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ('main_categories', 'sub_categories'):
+        op.add_column(table, sa.Column('text_count', sa.Integer(), nullable=False, server_default='0'))
+        op.add_column(table, sa.Column('audio_count', sa.Integer(), nullable=False, server_default='0'))
+
+    # Backfill from the current data
+    op.execute("""
+        UPDATE sub_categories SET
+            text_count = (
+                SELECT COUNT(*) FROM kagyur_texts
+                WHERE kagyur_texts.sub_category_id = sub_categories.id
+                  AND kagyur_texts.is_active = true
+            ),
+            audio_count = (
+                SELECT COUNT(*) FROM kagyur_audio
+                JOIN kagyur_texts ON kagyur_texts.id = kagyur_audio.text_id
+                WHERE kagyur_texts.sub_category_id = sub_categories.id
+                  AND kagyur_audio.is_active = true
+            )
+    """)
+    op.execute("""
+        UPDATE main_categories SET
+            text_count = (
+                SELECT COALESCE(SUM(text_count), 0) FROM sub_categories
+                WHERE sub_categories.main_category_id = main_categories.id
+            ),
+            audio_count = (
+                SELECT COALESCE(SUM(audio_count), 0) FROM sub_categories
+                WHERE sub_categories.main_category_id = main_categories.id
+            )
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('main_categories', 'sub_categories'):
+        op.drop_column(table, 'audio_count')
+        op.drop_column(table, 'text_count')
@@ -0,0 +1,56 @@
+"""add normalized volume/folio positions to volumes
+
+Revision ID: 8d4e6f2a9b13
+Revises: 3f8b2d61c0a4
+Create Date: 2025-08-21 14:03:52.880412
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.folios import parse_volume, folio_position
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d4e6f2a9b13'
+down_revision: Union[str, Sequence[str], None] = '3f8b2d61c0a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('volumes', sa.Column('volume_no', sa.Integer(), nullable=True))
+    op.add_column('volumes', sa.Column('start_position', sa.Integer(), nullable=True))
+    op.add_column('volumes', sa.Column('end_position', sa.Integer(), nullable=True))
+
+    # Backfill with the same parser the model uses on write
+    conn = op.get_bind()
+    volumes = sa.table(
+        'volumes',
+        sa.column('id', sa.Integer), sa.column('volume_number', sa.String),
+        sa.column('start_page', sa.String), sa.column('end_page', sa.String),
+        sa.column('volume_no', sa.Integer), sa.column('start_position', sa.Integer),
+        sa.column('end_position', sa.Integer)
+    )
+    rows = conn.execute(sa.select(volumes.c.id, volumes.c.volume_number, volumes.c.start_page, volumes.c.end_page)).all()
+    for row in rows:
+        conn.execute(
+            volumes.update().where(volumes.c.id == row.id).values(
+                volume_no=parse_volume(row.volume_number),
+                start_position=folio_position(row.start_page),
+                end_position=folio_position(row.end_page, end=True)
+            )
+        )
+
+    op.create_index('ix_volumes_volume_no_start_position', 'volumes', ['volume_no', 'start_position', 'end_position'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_volumes_volume_no_start_position', table_name='volumes')
+    op.drop_column('volumes', 'end_position')
+    op.drop_column('volumes', 'start_position')
+    op.drop_column('volumes', 'volume_no')
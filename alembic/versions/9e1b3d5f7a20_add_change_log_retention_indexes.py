@@ -0,0 +1,30 @@
+"""add change_log indexes for retention
+
+Revision ID: 9e1b3d5f7a20
+Revises: 4c8e0a2d6f57
+Create Date: 2025-09-02 09:12:44.381075
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e1b3d5f7a20'
+down_revision: Union[str, Sequence[str], None] = '4c8e0a2d6f57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_change_log_changed_at', 'change_log', ['changed_at'], unique=False)
+    op.create_index('ix_change_log_record', 'change_log', ['table_name', 'record_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_change_log_record', table_name='change_log')
+    op.drop_index('ix_change_log_changed_at', table_name='change_log')
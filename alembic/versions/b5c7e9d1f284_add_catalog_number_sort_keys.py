@@ -0,0 +1,60 @@
+"""add natural-sort keys for derge_id and yeshe_de_id
+
+Revision ID: b5c7e9d1f284
+Revises: 8d4e6f2a9b13
+Create Date: 2025-08-25 09:27:40.116305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.catalog_numbers import parse_catalog_number
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5c7e9d1f284'
+down_revision: Union[str, Sequence[str], None] = '8d4e6f2a9b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CATALOGS = ('derge', 'yeshe_de')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for catalog in CATALOGS:
+        op.add_column('kagyur_texts', sa.Column(f'{catalog}_no', sa.Integer(), nullable=True))
+        op.add_column('kagyur_texts', sa.Column(f'{catalog}_suffix', sa.String(), nullable=True))
+        op.add_column('kagyur_texts', sa.Column(f'{catalog}_end_no', sa.Integer(), nullable=True))
+
+    # Backfill with the same parser the model uses on write
+    conn = op.get_bind()
+    texts = sa.table(
+        'kagyur_texts',
+        sa.column('id', sa.Integer), sa.column('derge_id', sa.String), sa.column('yeshe_de_id', sa.String),
+        *[sa.column(f'{catalog}_{part}') for catalog in CATALOGS for part in ('no', 'suffix', 'end_no')]
+    )
+    rows = conn.execute(sa.select(texts.c.id, texts.c.derge_id, texts.c.yeshe_de_id)).all()
+    for row in rows:
+        values = {}
+        for catalog, raw in (('derge', row.derge_id), ('yeshe_de', row.yeshe_de_id)):
+            parsed = parse_catalog_number(raw)
+            values[f'{catalog}_no'] = parsed.number if parsed else None
+            values[f'{catalog}_suffix'] = parsed.suffix if parsed else None
+            values[f'{catalog}_end_no'] = parsed.end if parsed else None
+        conn.execute(texts.update().where(texts.c.id == row.id).values(**values))
+
+    op.create_index('ix_kagyur_texts_derge_key', 'kagyur_texts', ['derge_no', 'derge_suffix'], unique=False)
+    op.create_index('ix_kagyur_texts_yeshe_de_key', 'kagyur_texts', ['yeshe_de_no', 'yeshe_de_suffix'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_kagyur_texts_yeshe_de_key', table_name='kagyur_texts')
+    op.drop_index('ix_kagyur_texts_derge_key', table_name='kagyur_texts')
+    for catalog in reversed(CATALOGS):
+        op.drop_column('kagyur_texts', f'{catalog}_end_no')
+        op.drop_column('kagyur_texts', f'{catalog}_suffix')
+        op.drop_column('kagyur_texts', f'{catalog}_no')
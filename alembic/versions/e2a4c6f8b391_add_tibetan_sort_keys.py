@@ -0,0 +1,54 @@
+"""add tibetan sort keys
+
+Revision ID: e2a4c6f8b391
+Revises: b5c7e9d1f284
+Create Date: 2025-08-27 14:05:12.480217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.tibetan_collation import tibetan_sort_key
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a4c6f8b391'
+down_revision: Union[str, Sequence[str], None] = 'b5c7e9d1f284'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Table -> the Tibetan column its key is computed from
+SOURCES = {
+    'kagyur_texts': 'tibetan_title',
+    'main_categories': 'name_tibetan',
+    'sub_categories': 'name_tibetan',
+    'sermons': 'name_tibetan',
+    'yanas': 'name_tibetan',
+    'translation_types': 'name_tibetan',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    for table_name, source in SOURCES.items():
+        op.add_column(table_name, sa.Column('tibetan_sort_key', sa.LargeBinary(), nullable=True))
+
+        # Backfill with the same collation the models use on write
+        table = sa.table(
+            table_name,
+            sa.column('id', sa.Integer), sa.column(source, sa.String), sa.column('tibetan_sort_key', sa.LargeBinary)
+        )
+        for record_id, value in conn.execute(sa.select(table.c.id, table.c[source])).all():
+            conn.execute(table.update().where(table.c.id == record_id).values(tibetan_sort_key=tibetan_sort_key(value)))
+
+        op.create_index(op.f(f'ix_{table_name}_tibetan_sort_key'), table_name, ['tibetan_sort_key'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name in reversed(list(SOURCES)):
+        op.drop_index(op.f(f'ix_{table_name}_tibetan_sort_key'), table_name=table_name)
+        op.drop_column(table_name, 'tibetan_sort_key')
@@ -9,6 +9,83 @@ class Settings:
     REFRESH_TOKEN_EXPIRE_DAYS: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
     
     
+    # Schema handling at startup: "check" fails startup unless the database is at the
+    # Alembic head, "create" runs create_all (local SQLite), "skip" does neither;
+    # "auto" is "create" for SQLite and "check" for any other database
+    SCHEMA_STARTUP_MODE: str = os.getenv("SCHEMA_STARTUP_MODE", "auto")
+    
+    # Dashboard Settings
+    DASHBOARD_STATS_MAX_AGE_SECONDS: int = int(os.getenv("DASHBOARD_STATS_MAX_AGE_SECONDS", "30"))
+    
+    # Request coalescing: how long a waiting request shares an in-flight computation
+    SINGLE_FLIGHT_TIMEOUT_SECONDS: float = float(os.getenv("SINGLE_FLIGHT_TIMEOUT_SECONDS", "10"))
+    
+    # Lookup registry (categories, sermons, yanas, translation types) in-memory snapshot
+    LOOKUP_REGISTRY_MAX_AGE_SECONDS: int = int(os.getenv("LOOKUP_REGISTRY_MAX_AGE_SECONDS", "300"))
+    
+    # Rendered public responses (per language); dropped on writes, bounded for other workers' writes
+    RESPONSE_CACHE_MAX_AGE_SECONDS: int = int(os.getenv("RESPONSE_CACHE_MAX_AGE_SECONDS", "60"))
+    RESPONSE_CACHE_MAX_ENTRIES: int = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512"))
+    
+    # In-memory volume/folio interval index behind GET /locate; dropped on writes
+    FOLIO_INDEX_MAX_AGE_SECONDS: int = int(os.getenv("FOLIO_INDEX_MAX_AGE_SECONDS", "300"))
+    
+    # Response compression (gzip/brotli): bodies smaller than this are sent as-is
+    COMPRESSION_MIN_SIZE: int = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+    COMPRESSION_GZIP_LEVEL: int = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+    COMPRESSION_BROTLI_QUALITY: int = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+    
+    # Delta sync (GET /changes): entries younger than this are held back so that
+    # transactions still committing cannot land behind a token already handed out.
+    # Entry times come from the app servers' clocks, which must agree to well
+    # within this window (keep them NTP-synced, or raise it)
+    CHANGES_SETTLE_SECONDS: float = float(os.getenv("CHANGES_SETTLE_SECONDS", "2"))
+    # Change-log retention: entries older than this are compacted to the latest one
+    # per record (old tombstones dropped) at most every CHANGES_COMPACT_INTERVAL_SECONDS
+    # after writes; sync tokens from before it get 410 Gone and must resync
+    CHANGES_RETENTION_DAYS: float = float(os.getenv("CHANGES_RETENTION_DAYS", "30"))
+    CHANGES_COMPACT_INTERVAL_SECONDS: float = float(os.getenv("CHANGES_COMPACT_INTERVAL_SECONDS", "3600"))
+    
+    # Offline catalog bundle (GET /export/bundle): where it is written, and how long
+    # after a catalog write it is rebuilt (later writes join the same rebuild)
+    EXPORT_BUNDLE_DIR: str = os.getenv("EXPORT_BUNDLE_DIR", "exports")
+    EXPORT_BUNDLE_REBUILD_DELAY_SECONDS: float = float(os.getenv("EXPORT_BUNDLE_REBUILD_DELAY_SECONDS", "30"))
+    
+    # Static pre-rendered catalog: JSON files for the public catalog written to
+    # PRERENDER_DIR, served under /prerendered and refreshed after catalog writes
+    PRERENDER_ENABLED: bool = os.getenv("PRERENDER_ENABLED", "false").lower() == "true"
+    PRERENDER_DIR: str = os.getenv("PRERENDER_DIR", "prerendered")
+    PRERENDER_TEXT_PAGE_SIZE: int = int(os.getenv("PRERENDER_TEXT_PAGE_SIZE", "100"))
+    PRERENDER_REBUILD_DELAY_SECONDS: float = float(os.getenv("PRERENDER_REBUILD_DELAY_SECONDS", "5"))
+    
+    # OpenAPI document generated once, stored with gzip/brotli copies and served
+    # from there; rebuilt when the application source changes
+    OPENAPI_CACHE_DIR: str = os.getenv("OPENAPI_CACHE_DIR", "openapi_cache")
+    
+    # Prometheus metrics at GET /metrics (set PROMETHEUS_MULTIPROC_DIR to merge workers)
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    
+    # Request profiling (pyinstrument): a random fraction of requests, plus any request
+    # with a valid X-Profile-Token from POST /profiles/token; stored in PROFILING_DIR
+    PROFILING_SAMPLE_RATE: float = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+    PROFILING_INTERVAL_SECONDS: float = float(os.getenv("PROFILING_INTERVAL_SECONDS", "0.001"))
+    PROFILING_DIR: str = os.getenv("PROFILING_DIR", "profiles")
+    PROFILING_MAX_FILES: int = int(os.getenv("PROFILING_MAX_FILES", "200"))
+    PROFILING_TOKEN_MAX_AGE_SECONDS: int = int(os.getenv("PROFILING_TOKEN_MAX_AGE_SECONDS", "3600"))
+    
+    # Slow-query log: statements at or over the threshold are kept (per worker, newest
+    # SLOW_QUERY_LOG_SIZE) with their plan; GET /dashboard/slow-queries. 0 turns it off.
+    # EXPLAIN ANALYZE re-runs the read on Postgres, so it is opt-in.
+    SLOW_QUERY_THRESHOLD_MS: float = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+    SLOW_QUERY_LOG_SIZE: int = int(os.getenv("SLOW_QUERY_LOG_SIZE", "200"))
+    SLOW_QUERY_EXPLAIN_ANALYZE: bool = os.getenv("SLOW_QUERY_EXPLAIN_ANALYZE", "false").lower() == "true"
+    SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS: float = float(os.getenv("SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS", "60"))
+    
+    # Readiness probe (GET /health/ready): the database check's time limit, and how long a
+    # result is reused so frequent probes from load balancers don't add load
+    HEALTH_DB_TIMEOUT_SECONDS: float = float(os.getenv("HEALTH_DB_TIMEOUT_SECONDS", "1"))
+    HEALTH_READY_CACHE_SECONDS: float = float(os.getenv("HEALTH_READY_CACHE_SECONDS", "2"))
+    
     # API Settings
     API_V1_STR: str = "/api"
     PROJECT_NAME: str = "Kangyur API"
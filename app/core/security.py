@@ -1,24 +1,30 @@
 from datetime import datetime, timedelta
 from typing import Optional
-from passlib.context import CryptContext
-from jose import JWTError, jwt
 from fastapi import HTTPException, status
+import functools
 
 from .config import settings
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# passlib and jose are imported on first use rather than at startup: every
+# worker imports this module through the auth dependency, most never hash
+
+@functools.lru_cache(maxsize=None)
+def _password_context():
+    """Password hashing context"""
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt"""
-    return pwd_context.hash(password)
+    return _password_context().hash(password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    return _password_context().verify(plain_password, hashed_password)
 
 def create_access_token(user_data: dict) -> str:
     """Create JWT access token"""
+    from jose import jwt
     to_encode = {
         "sub": str(user_data["id"]),
         "username": user_data["username"],
@@ -34,6 +40,7 @@ def create_access_token(user_data: dict) -> str:
 
 def create_refresh_token(user_data: dict) -> str:
     """Create JWT refresh token"""
+    from jose import jwt
     to_encode = {
         "sub": str(user_data["id"]),
         "username": user_data["username"],
@@ -47,6 +54,7 @@ def create_refresh_token(user_data: dict) -> str:
 
 def verify_token(token: str, token_type: str = "access") -> dict:
     """Verify JWT token and return payload"""
+    from jose import JWTError, jwt
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -1,8 +1,15 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Enum as SQLEnum
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index, LargeBinary, Enum as SQLEnum
+from sqlalchemy.orm import relationship, validates
+from sqlalchemy.sql import func, text as sql_text
 from enum import Enum
 from app.database import Base
+from app.utils.catalog_numbers import parse_catalog_number
+from app.utils.folios import parse_volume, folio_position
+from app.utils.tibetan_collation import tibetan_sort_key, MISSING_KEY
+
+# Predicate of the partial indexes over active rows, spelled the way each
+# dialect renders ``is_active == True`` so the planner matches it to queries
+ACTIVE_ROWS_ONLY = {"postgresql_where": sql_text("is_active = true"), "sqlite_where": sql_text("is_active = 1")}
 
 class MainCategory(Base):
     __tablename__ = "main_categories"
@@ -10,15 +17,23 @@ class MainCategory(Base):
     id = Column(Integer, primary_key=True, index=True)
     name_english = Column(String, nullable=False)
     name_tibetan = Column(String)
+    tibetan_sort_key = Column(LargeBinary, default=MISSING_KEY, index=True)  # Traditional Tibetan order of name_tibetan, set on write
     description_english = Column(Text)
     description_tibetan = Column(Text)
     order_index = Column(Integer, default=0)
     is_active = Column(Boolean, default=True)
+    text_count = Column(Integer, default=0, nullable=False)  # Active texts, maintained by text services
+    audio_count = Column(Integer, default=0, nullable=False)  # Active audio, maintained by audio services
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     
     sub_categories = relationship("SubCategory", back_populates="main_category")
 
+    @validates("name_tibetan")
+    def _set_tibetan_sort_key(self, key, value):
+        self.tibetan_sort_key = tibetan_sort_key(value)
+        return value
+
 class SubCategory(Base):
     __tablename__ = "sub_categories"
     
@@ -26,15 +41,28 @@ class SubCategory(Base):
     main_category_id = Column(Integer, ForeignKey("main_categories.id"))
     name_english = Column(String, nullable=False)
     name_tibetan = Column(String)
+    tibetan_sort_key = Column(LargeBinary, default=MISSING_KEY, index=True)  # Traditional Tibetan order of name_tibetan, set on write
     description_english = Column(Text)
     description_tibetan = Column(Text)
     order_index = Column(Integer, default=0)
     is_active = Column(Boolean, default=True)
+    text_count = Column(Integer, default=0, nullable=False)  # Active texts, maintained by text services
+    audio_count = Column(Integer, default=0, nullable=False)  # Active audio, maintained by audio services
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     
     main_category = relationship("MainCategory", back_populates="sub_categories")
     texts = relationship("KagyurText", back_populates="sub_category")
+    
+    __table_args__ = (
+        # Sub-category lists and the active sub-categories joined into the category tree
+        Index("ix_sub_categories_active_main_category", "main_category_id", "order_index", **ACTIVE_ROWS_ONLY),
+    )
+
+    @validates("name_tibetan")
+    def _set_tibetan_sort_key(self, key, value):
+        self.tibetan_sort_key = tibetan_sort_key(value)
+        return value
 
 class Sermon(Base):
     __tablename__ = "sermons"
@@ -42,33 +70,51 @@ class Sermon(Base):
     id = Column(Integer, primary_key=True, index=True)
     name_english = Column(String, nullable=False)
     name_tibetan = Column(String)
+    tibetan_sort_key = Column(LargeBinary, default=MISSING_KEY, index=True)  # Traditional Tibetan order of name_tibetan, set on write
     order_index = Column(Integer, default=0)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
+    @validates("name_tibetan")
+    def _set_tibetan_sort_key(self, key, value):
+        self.tibetan_sort_key = tibetan_sort_key(value)
+        return value
+
 class Yana(Base):
     __tablename__ = "yanas"
     
     id = Column(Integer, primary_key=True, index=True)
     name_english = Column(String, nullable=False)
     name_tibetan = Column(String)
+    tibetan_sort_key = Column(LargeBinary, default=MISSING_KEY, index=True)  # Traditional Tibetan order of name_tibetan, set on write
     order_index = Column(Integer, default=0)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
+    @validates("name_tibetan")
+    def _set_tibetan_sort_key(self, key, value):
+        self.tibetan_sort_key = tibetan_sort_key(value)
+        return value
+
 class TranslationType(Base):
     __tablename__ = "translation_types"
     
     id = Column(Integer, primary_key=True, index=True)
     name_english = Column(String, nullable=False)
     name_tibetan = Column(String)
+    tibetan_sort_key = Column(LargeBinary, default=MISSING_KEY, index=True)  # Traditional Tibetan order of name_tibetan, set on write
     order_index = Column(Integer, default=0)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
+    @validates("name_tibetan")
+    def _set_tibetan_sort_key(self, key, value):
+        self.tibetan_sort_key = tibetan_sort_key(value)
+        return value
+
 class KagyurText(Base):
     __tablename__ = "kagyur_texts"
     
@@ -77,6 +123,7 @@ class KagyurText(Base):
     derge_id = Column(String)
     yeshe_de_id = Column(String)
     tibetan_title = Column(String)
+    tibetan_sort_key = Column(LargeBinary, default=MISSING_KEY, index=True)  # Traditional Tibetan order of tibetan_title, set on write
     chinese_title = Column(String)
     sanskrit_title = Column(String)
     english_title = Column(String)
@@ -85,6 +132,13 @@ class KagyurText(Base):
     translation_type_id = Column(Integer, ForeignKey("translation_types.id"), nullable=True)
     order_index = Column(Integer, default=0)
     is_active = Column(Boolean, default=True)
+    # Natural-sort keys parsed from derge_id / yeshe_de_id on write: D340a -> (340, "a", None), D1-3 -> (1, "", 3)
+    derge_no = Column(Integer)
+    derge_suffix = Column(String)
+    derge_end_no = Column(Integer)
+    yeshe_de_no = Column(Integer)
+    yeshe_de_suffix = Column(String)
+    yeshe_de_end_no = Column(Integer)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     
@@ -95,12 +149,36 @@ class KagyurText(Base):
     translation_type = relationship("TranslationType")
     yeshe_de_spans = relationship("YesheDESpan", back_populates="text", cascade="all, delete-orphan", lazy="select")
     audio_files = relationship("KagyurAudio", back_populates="text", cascade="all, delete-orphan", lazy="select")
+    
+    __table_args__ = (
+        Index("ix_kagyur_texts_derge_key", "derge_no", "derge_suffix"),
+        Index("ix_kagyur_texts_yeshe_de_key", "yeshe_de_no", "yeshe_de_suffix"),
+        # Sub-category text listings in display and Tibetan order (page and count from the index)
+        Index("ix_kagyur_texts_sub_category_order", "sub_category_id", "order_index", "id"),
+        Index("ix_kagyur_texts_sub_category_tibetan", "sub_category_id", "tibetan_sort_key", "id"),
+        # Active-text counts per sub-category
+        Index("ix_kagyur_texts_active_sub_category", "sub_category_id", **ACTIVE_ROWS_ONLY),
+    )
+    
+    @validates("derge_id", "yeshe_de_id")
+    def _normalize_catalog_number(self, key, value):
+        prefix = key[:-len("_id")]
+        parsed = parse_catalog_number(value)
+        setattr(self, f"{prefix}_no", parsed.number if parsed else None)
+        setattr(self, f"{prefix}_suffix", parsed.suffix if parsed else None)
+        setattr(self, f"{prefix}_end_no", parsed.end if parsed else None)
+        return value
+
+    @validates("tibetan_title")
+    def _set_tibetan_sort_key(self, key, value):
+        self.tibetan_sort_key = tibetan_sort_key(value)
+        return value
 
 class TextSummary(Base):
     __tablename__ = "text_summaries"
     
     id = Column(Integer, primary_key=True, index=True)
-    text_id = Column(Integer, ForeignKey("kagyur_texts.id"))
+    text_id = Column(Integer, ForeignKey("kagyur_texts.id"), index=True)
     translator_homage_english = Column(Text)
     translator_homage_tibetan = Column(Text)
     purpose_english = Column(Text)
@@ -124,7 +202,7 @@ class YesheDESpan(Base):
     __tablename__ = "yeshe_de_spans"
     
     id = Column(Integer, primary_key=True, index=True)
-    text_id = Column(Integer, ForeignKey("kagyur_texts.id"))
+    text_id = Column(Integer, ForeignKey("kagyur_texts.id"), index=True)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     
@@ -135,21 +213,39 @@ class Volume(Base):
     __tablename__ = "volumes"
     
     id = Column(Integer, primary_key=True, index=True)
-    yeshe_de_span_id = Column(Integer, ForeignKey("yeshe_de_spans.id"))
+    yeshe_de_span_id = Column(Integer, ForeignKey("yeshe_de_spans.id"), index=True)
     volume_number = Column(String)
     start_page = Column(String)
     end_page = Column(String)
+    # Normalized from the strings above on write; positions are folio * 2 + side (a=0, b=1)
+    volume_no = Column(Integer)
+    start_position = Column(Integer)
+    end_position = Column(Integer)
     order_index = Column(Integer, default=0)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     
     yeshe_de_span = relationship("YesheDESpan", back_populates="volumes")
+    
+    __table_args__ = (
+        Index("ix_volumes_volume_no_start_position", "volume_no", "start_position", "end_position"),
+    )
+    
+    @validates("volume_number", "start_page", "end_page")
+    def _normalize_location(self, key, value):
+        if key == "volume_number":
+            self.volume_no = parse_volume(value)
+        elif key == "start_page":
+            self.start_position = folio_position(value)
+        else:
+            self.end_position = folio_position(value, end=True)
+        return value
 
 class KagyurAudio(Base):
     __tablename__ = "kagyur_audio"
     
     id = Column(Integer, primary_key=True, index=True)
-    text_id = Column(Integer, ForeignKey("kagyur_texts.id"))
+    text_id = Column(Integer, ForeignKey("kagyur_texts.id"), index=True)
     audio_url = Column(String)
     file_name = Column(String)
     file_size = Column(Integer)
@@ -164,6 +260,11 @@ class KagyurAudio(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     text = relationship("KagyurText", back_populates="audio_files")
+    
+    __table_args__ = (
+        # Active audio of a text in display order
+        Index("ix_kagyur_audio_active_text_order", "text_id", "order_index", **ACTIVE_ROWS_ONLY),
+    )
 
 class PublicationStatus(str, Enum):
     DRAFT = "draft"
@@ -183,6 +284,11 @@ class KagyurNews(Base):
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    __table_args__ = (
+        # Published news, newest first
+        Index("ix_kagyur_news_active_published", "publication_status", "published_date", **ACTIVE_ROWS_ONLY),
+    )
 
 class KagyurVideo(Base):
     __tablename__ = "kangyur_video"
@@ -198,6 +304,11 @@ class KagyurVideo(Base):
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    __table_args__ = (
+        # Published videos, newest first
+        Index("ix_kangyur_video_active_published", "publication_status", "published_date", **ACTIVE_ROWS_ONLY),
+    )
 
 class User(Base):
     __tablename__ = "users"
@@ -225,6 +336,21 @@ class AuditLog(Base):
     timestamp = Column(DateTime, default=func.now())
     ip_address = Column(String)
 
+class ChangeLog(Base):
+    __tablename__ = "change_log"
+    
+    id = Column(Integer, primary_key=True, index=True)  # Monotonic sync token
+    table_name = Column(String, nullable=False)
+    record_id = Column(Integer, nullable=False)
+    action = Column(String, nullable=False)  # "upsert" or "delete"
+    changed_at = Column(DateTime, nullable=False)
+    
+    __table_args__ = (
+        # Retention: the first entry past the horizon, and later entries of a record
+        Index("ix_change_log_changed_at", "changed_at"),
+        Index("ix_change_log_record", "table_name", "record_id", "id"),
+    )
+
 class Edition(Base):
     __tablename__ = "editions"
     
@@ -0,0 +1,28 @@
+from typing import Iterable
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+from starlette.routing import request_response
+
+def mount_routers(app: FastAPI, routers: Iterable[APIRouter]) -> None:
+    """
+    Add the routes of fully configured routers to ``app``.
+
+    Every router here declares its own prefix, tags, dependencies and route
+    class, so its routes are complete when the module is imported.
+    ``app.include_router`` would build each of them again (dependency and
+    response-model analysis), the largest single cost of importing main;
+    appending them is equivalent, once each route's request handler is
+    rebuilt to resolve dependencies through ``app``, so that
+    ``app.dependency_overrides`` applies to them (cheap: the analysis is
+    kept). Routers with their own event handlers are still included the
+    regular way.
+    """
+    for router in routers:
+        if router.on_startup or router.on_shutdown:
+            app.include_router(router)
+            continue
+        for route in router.routes:
+            if isinstance(route, APIRoute):
+                route.dependency_overrides_provider = app
+                route.app = request_response(route.get_route_handler())
+            app.router.routes.append(route)
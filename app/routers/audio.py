@@ -12,8 +12,9 @@ from app.services.audio_service.handleCreateAudio import handle_create_audio
 from app.services.audio_service.handleUpdateAudio import handle_update_audio
 from app.services.audio_service.handleUpdateAudioFile import handle_update_audio_file
 from app.services.audio_service.handleDeleteAudio import handle_delete_audio
+from app.utils.fast_json import FastJSONRoute
 
-router = APIRouter(tags=["audio"])
+router = APIRouter(tags=["audio"], route_class=FastJSONRoute)
 
 # GET /audio
 @router.get("/audio")
@@ -57,7 +58,7 @@ async def list_audio_categories(lang: Optional[str] = Query("en", regex="^(en|tb
 
 # GET /audio/{audio_id}
 @router.get("/audio/{audio_id}")
-async def get_audio(audio_id: int, lang: Optional[str] = Query("en", regex="^(en|tb)$"), db: Session = Depends(get_db)):
+async def get_audio(audio_id: int, lang: Optional[str] = Query(None, regex="^(en|tb)$", description="Language preference: en or tb; omit for both languages"), db: Session = Depends(get_db)):
     """Get audio file details (public)"""
     return await handle_get_audio_details(audio_id=audio_id, lang=lang, db=db)
 
@@ -67,7 +68,7 @@ async def get_text_audio(
     category_id: int,
     sub_category_id: int,
     text_id: int,
-    lang: Optional[str] = Query("en", regex="^(en|tb)$"),
+    lang: Optional[str] = Query(None, regex="^(en|tb)$", description="Language preference: en or tb; omit for both languages"),
     quality: Optional[str] = Query(None, regex="^(128kbps|320kbps)$"),
     db: Session = Depends(get_db)
 ):
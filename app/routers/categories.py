@@ -11,20 +11,22 @@ from app.services.category_service.handleGetCategory import handle_get_category
 from app.services.category_service.handleCreateCategory import handle_create_category
 from app.services.category_service.handleUpdateCategory import handle_update_category
 from app.services.category_service.handleDeleteCategory import handle_delete_category
+from app.utils.fast_json import FastJSONRoute
 import logging
 
 
-router = APIRouter(prefix="/categories", tags=["Categories"])
+router = APIRouter(prefix="/categories", tags=["Categories"], route_class=FastJSONRoute)
 logger = logging.getLogger(__name__)
 
 # GET Endpoints
 @router.get("/", response_model=List[MainCategoryLanguageResponse], tags=["Categories"])
 async def get_categories(
     lang: Optional[str] = Query(None, regex="^(en|tb)$", description="Language preference: en or tb"),
+    sort: Optional[str] = Query(None, regex="^tibetan$", description="tibetan: traditional Tibetan alphabetical order; omit for display order"),
     db: Session = Depends(get_db)
 ):
     
-    return await handle_get_categories(lang, db)
+    return await handle_get_categories(lang, db, sort)
 
 @router.get("/all", response_model=List[MainCategoryLanguageResponse])  # Changed path to avoid conflict
 async def get_all_categories(
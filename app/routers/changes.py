@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.schemas import ChangesResponse
+from app.services.sync_service.handleGetChanges import handle_get_changes
+from app.utils.fast_json import FastJSONRoute
+
+router = APIRouter(tags=["Sync"], route_class=FastJSONRoute)
+
+@router.get("/changes", response_model=ChangesResponse)
+async def get_changes(
+    since: int = Query(0, ge=0, description="Sync token from the previous response's next_token; 0 for a full sync"),
+    limit: int = Query(500, ge=1, le=2000, description="Maximum change-log entries to read"),
+    db: Session = Depends(get_db)
+):
+    """
+    Incremental catalog sync for offline clients.
+
+    Returns the inserts, updates and deletes since ``since``. Keep calling
+    with ``next_token`` while ``has_more`` is true, then store it for the
+    next sync. A 410 means the token has outlived the change log's retention:
+    drop local data and sync again from 0.
+    """
+    return await handle_get_changes(since=since, limit=limit, db=db)
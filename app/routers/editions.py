@@ -12,8 +12,9 @@ from app.services.edition_service.handleGetEditionDetailAdmin import handle_get_
 from app.services.edition_service.handleCreateEdition import handle_create_edition
 from app.services.edition_service.handleUpdateEdition import handle_update_edition
 from app.services.edition_service.handleDeleteEdition import handle_delete_edition
+from app.utils.fast_json import FastJSONRoute
 
-router = APIRouter(tags=["editions"])
+router = APIRouter(tags=["editions"], route_class=FastJSONRoute)
 
 # ==================== SPECIFIC ROUTES (must come before parameterized routes) ====================
 
@@ -29,7 +30,7 @@ async def get_all_editions_admin(
 
 @router.get("/editions", response_model=List[EditionResponse])
 async def get_editions(
-    lang: Optional[str] = Query("en", regex="^(en|tb)$"),
+    lang: Optional[str] = Query(None, regex="^(en|tb)$", description="Language preference: en or tb; omit for both languages"),
     db: Session = Depends(get_db)
 ):
     """🌍 Get all active editions"""
@@ -38,7 +39,7 @@ async def get_editions(
 @router.get("/editions/{edition_id}", response_model=EditionResponse)
 async def get_edition_detail(
     edition_id: int,
-    lang: Optional[str] = Query("en", regex="^(en|tb)$"),
+    lang: Optional[str] = Query(None, regex="^(en|tb)$", description="Language preference: en or tb; omit for both languages"),
     db: Session = Depends(get_db)
 ):
     """🌍 Get specific edition detail"""
@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.services.export_service.handleGetBundle import handle_get_bundle
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+@router.get("/bundle")
+async def get_catalog_bundle(request: Request, db: Session = Depends(get_db)):
+    """
+    Download the whole public catalog as one gzip-compressed SQLite file.
+
+    The bundle is rebuilt in the background shortly after catalog writes.
+    Revalidate with If-None-Match; after importing, pass the bundle's
+    ``change_token`` (also sent as X-Change-Token) to ``GET /changes``.
+    """
+    return await handle_get_bundle(request=request, db=db)
@@ -1,9 +1,11 @@
 from fastapi import APIRouter
 from .sermons import router as sermons_router
+from .yanas import router as yanas_router
 from .translation_types import router as translation_types_router
 
 router = APIRouter(prefix="/lookups", tags=["Lookups"])
 
-# Include sub-routers
-router.include_router(sermons_router, prefix="/sermons", tags=["Sermons"])
-router.include_router(translation_types_router, prefix="/translation-types", tags=["Translation Types"])
+# Include sub-routers (each already carries its own prefix)
+router.include_router(sermons_router)
+router.include_router(yanas_router)
+router.include_router(translation_types_router)
@@ -0,0 +1,177 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from typing import Optional, List, Type
+from pydantic import BaseModel
+from app.database import get_db, Base
+from app.models import User
+from app.schemas import LookupReorderRequest
+from app.dependencies.auth import require_admin
+from app.utils.compression import CachedJSONResponse
+from app.utils.lookup_registry import get_lookup_registry
+from app.utils.fast_json import FastJSONRoute
+
+def build_lookup_router(
+    kind: str,
+    model: Type[Base],
+    create_schema: Type[BaseModel],
+    response_schema: Type[BaseModel],
+    prefix: str,
+    label: str,
+    list_key: str,
+    tags: List[str],
+    management_tag: Optional[str] = None
+) -> APIRouter:
+    """
+    Build the public and admin endpoints for one lookup table.
+
+    Public reads are served from the lookup registry's pre-rendered JSON and
+    never open a database session; admin writes go through the session and
+    the registry is rebuilt on commit.
+
+    Args:
+        kind: Lookup registry kind ("sermon", "yana", "translation_type")
+        model: SQLAlchemy model of the table
+        create_schema: Request body for create/update
+        response_schema: Response model of a single row
+        prefix: URL prefix, e.g. "/sermons"
+        label: Human readable singular, e.g. "Sermon"
+        list_key: Key of the admin list payload, e.g. "sermons"
+        tags: OpenAPI tags of the public endpoints
+        management_tag: OpenAPI tag of the admin endpoints (default "<label> Management")
+    """
+    router = APIRouter(prefix=prefix, tags=tags, route_class=FastJSONRoute)
+    management_tag = management_tag or f"{label} Management"
+    not_found = f"{label} not found"
+
+    def get_or_404(db: Session, record_id: int):
+        record = db.query(model).filter(model.id == record_id).first()
+        if not record:
+            raise HTTPException(status_code=404, detail=not_found)
+        return record
+
+    # ==================== PUBLIC ENDPOINTS ====================
+
+    @router.get("", response_model=List[response_schema], name=f"get_{list_key}", description=f"Get all active {list_key.replace('_', ' ')}")
+    async def get_lookup_list(
+        lang: Optional[str] = Query("en", regex="^(en|tb)$"),
+        sort: Optional[str] = Query(None, regex="^tibetan$", description="tibetan: traditional Tibetan alphabetical order; omit for display order")
+    ):
+        return CachedJSONResponse(get_lookup_registry().list_json(kind, lang, sort))
+
+    # ==================== ADMIN ENDPOINTS ====================
+
+    @router.get("/all", tags=[management_tag], name=f"get_all_{list_key}_admin", description=f"Get all {list_key.replace('_', ' ')} (including inactive) - Admin only")
+    async def get_all_admin(
+        current_user: User = Depends(require_admin),  # Admin only
+        db: Session = Depends(get_db)
+    ):
+        records = db.query(model).order_by(model.order_index).all()
+        return {list_key: records}
+
+    @router.post("/bulk", response_model=List[response_schema], status_code=status.HTTP_201_CREATED,
+                 tags=[management_tag], name=f"bulk_create_{list_key}", description=f"Create several {list_key.replace('_', ' ')} in one transaction - Admin only")
+    async def bulk_create(
+        items: List[create_schema],
+        current_user: User = Depends(require_admin),  # Admin only
+        db: Session = Depends(get_db)
+    ):
+        # New rows are appended after the current last position
+        next_index = (db.query(func.max(model.order_index)).scalar() or 0) + 1
+        records = []
+        for offset, item in enumerate(items):
+            record = model(**item.model_dump(), order_index=next_index + offset)
+            db.add(record)
+            records.append(record)
+        
+        db.commit()
+        for record in records:
+            db.refresh(record)
+        
+        return records
+
+    @router.put("/reorder", response_model=List[response_schema], tags=[management_tag], name=f"reorder_{list_key}",
+                 description=f"Set the display order of {list_key.replace('_', ' ')} from a list of ids - Admin only")
+    async def reorder(
+        reorder_data: LookupReorderRequest,
+        current_user: User = Depends(require_admin),  # Admin only
+        db: Session = Depends(get_db)
+    ):
+        records = {r.id: r for r in db.query(model).filter(model.id.in_(reorder_data.ids)).all()}
+        missing = [record_id for record_id in reorder_data.ids if record_id not in records]
+        if missing:
+            raise HTTPException(status_code=404, detail=f"{label} not found: {missing}")
+        
+        for position, record_id in enumerate(reorder_data.ids):
+            records[record_id].order_index = position
+        
+        db.commit()
+        return db.query(model).filter(model.id.in_(reorder_data.ids)).order_by(model.order_index).all()
+
+    @router.get("/{lookup_id}/details", tags=[management_tag], name=f"get_{kind}_detail_admin",
+                 description=f"Get specific {label.lower()} detail for editing - Admin only")
+    async def get_detail_admin(
+        lookup_id: int,
+        current_user: User = Depends(require_admin),  # Admin only
+        db: Session = Depends(get_db)
+    ):
+        return get_or_404(db, lookup_id)
+
+    @router.get("/{lookup_id}", response_model=response_schema, name=f"get_{kind}_detail", description=f"Get specific {label.lower()} detail")
+    async def get_detail(
+        lookup_id: int,
+        lang: Optional[str] = Query("en", regex="^(en|tb)$")
+    ):
+        content = get_lookup_registry().detail_json(kind, lookup_id, lang)
+        if content is None:
+            raise HTTPException(status_code=404, detail=not_found)
+        return CachedJSONResponse(content)
+
+    @router.post("", response_model=response_schema, status_code=status.HTTP_201_CREATED,
+                 tags=[management_tag], name=f"create_{kind}", description=f"Create new {label.lower()} - Admin only")
+    async def create(
+        data: create_schema,
+        current_user: User = Depends(require_admin),  # Admin only
+        db: Session = Depends(get_db)
+    ):
+        record = model(**data.model_dump())
+        
+        db.add(record)
+        db.commit()
+        db.refresh(record)
+        
+        return record
+
+    @router.put("/{lookup_id}", response_model=response_schema, tags=[management_tag], name=f"update_{kind}",
+                 description=f"Update {label.lower()} - Admin only")
+    async def update(
+        lookup_id: int,
+        data: create_schema,
+        current_user: User = Depends(require_admin),  # Admin only
+        db: Session = Depends(get_db)
+    ):
+        record = get_or_404(db, lookup_id)
+        
+        # Update fields
+        for field, value in data.model_dump(exclude_unset=True).items():
+            setattr(record, field, value)
+        
+        db.commit()
+        db.refresh(record)
+        
+        return record
+
+    @router.delete("/{lookup_id}", tags=[management_tag], name=f"delete_{kind}", description=f"Delete {label.lower()} - Admin only")
+    async def delete(
+        lookup_id: int,
+        current_user: User = Depends(require_admin),  # Admin only
+        db: Session = Depends(get_db)
+    ):
+        record = get_or_404(db, lookup_id)
+        
+        db.delete(record)
+        db.commit()
+        
+        return {"message": f"{label} deleted successfully"}
+
+    return router
@@ -15,15 +15,16 @@ from app.services.news_service.handleUpdateNews import handle_update_news
 from app.services.news_service.handleDeleteNews import handle_delete_news
 from app.services.news_service.handlePublishNews import handle_publish_news
 from app.services.news_service.handleUnpublishNews import handle_unpublish_news
+from app.utils.fast_json import FastJSONRoute
 
-router = APIRouter(tags=["news"])
+router = APIRouter(tags=["news"], route_class=FastJSONRoute)
 
 
 @router.get("/news")
 async def get_news(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
-    lang: Optional[str] = Query("en", regex="^(en|tb)$"),
+    lang: Optional[str] = Query(None, regex="^(en|tb)$", description="Language preference: en or tb; omit for both languages"),
     db: Session = Depends(get_db)
 ):
     """Get all active news with pagination"""
@@ -32,7 +33,7 @@ async def get_news(
 @router.get("/news/latest", response_model=List[NewsResponse])
 async def get_latest_news(
     limit: int = Query(5, ge=1, le=20),
-    lang: Optional[str] = Query("en", regex="^(en|tb)$"),
+    lang: Optional[str] = Query(None, regex="^(en|tb)$", description="Language preference: en or tb; omit for both languages"),
     db: Session = Depends(get_db)
 ):
     """Get latest news articles"""
@@ -41,7 +42,7 @@ async def get_latest_news(
 @router.get("/news/{news_id}", response_model=NewsResponse)
 async def get_news_detail(
     news_id: int,
-    lang: Optional[str] = Query("en", regex="^(en|tb)$"),
+    lang: Optional[str] = Query(None, regex="^(en|tb)$", description="Language preference: en or tb; omit for both languages"),
     db: Session = Depends(get_db)
 ):
     """Get specific news detail"""
@@ -7,9 +7,11 @@ from app.schemas import ( SubCategoryUpdate,SubCategoryLanguageResponse,SubCateg
 from app.dependencies.auth import require_admin
 from app.services.subcategory_service.handleGetSubcategories import handle_get_subcategories
 from app.services.subcategory_service.handleGetSubCategory import handle_get_subcategory
+from app.utils.change_log import record_changes
+from app.utils.fast_json import FastJSONRoute
 import logging
 
-router = APIRouter( tags=["Sub-Categories"])
+router = APIRouter( tags=["Sub-Categories"], route_class=FastJSONRoute)
 logger = logging.getLogger(__name__)
 
     
@@ -17,9 +19,10 @@ logger = logging.getLogger(__name__)
 async def get_subcategories(
     category_id: int,
     lang: Optional[str] = Query(None, regex="^(en|tb)$", description="Language preference: en or tb"),
+    sort: Optional[str] = Query(None, regex="^tibetan$", description="tibetan: traditional Tibetan alphabetical order; omit for display order"),
     db: Session = Depends(get_db)
 ):
-    return await handle_get_subcategories(category_id, lang, db)
+    return await handle_get_subcategories(category_id, lang, db, sort)
     
 @router.get("/categories/{category_id}/subcategories/{subcategory_id}", response_model=SubCategoryLanguageResponse)
 async def get_subcategory(
@@ -92,6 +95,13 @@ async def delete_subcategory(
     if not db_subcategory:
         raise HTTPException(status_code=404, detail="Sub-category not found")
     
+    # Remove its share from the parent category counters
+    db.query(MainCategory).filter(MainCategory.id == category_id).update({
+        MainCategory.text_count: MainCategory.text_count - db_subcategory.text_count,
+        MainCategory.audio_count: MainCategory.audio_count - db_subcategory.audio_count
+    }, synchronize_session=False)
+    record_changes(db, MainCategory, [category_id])
+    
     db.delete(db_subcategory)
     db.commit()
     return {"message": "Sub-category deleted successfully"}
@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status, UploadFile, File
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 from sqlalchemy import func, or_
 from typing import  Optional
 from app.database import get_db
-from app.models import KagyurText,  YesheDESpan, User, SubCategory
+from app.models import KagyurText, User, SubCategory
 from app.schemas import (
-    KagyurTextResponse,  KagyurTextUpdate,KagyurTextCreateRequest,TextsListResponse, 
+    KagyurTextResponse,  KagyurTextUpdate,KagyurTextCreateRequest,TextsListResponse, LocateResponse,
 )
 from app.dependencies.auth import require_admin
 from app.services.text_service.handleGetAllTexts import handle_get_all_texts
@@ -14,35 +14,88 @@ from app.services.text_service.handleCreateText import handle_create_text
 from app.services.text_service.handlePutText import handle_put_text
 from app.services.text_service.handleDeleteText import handle_delete_text
 from app.services.text_service.handleBulkImportTexts import handle_bulk_import_texts
+from app.services.text_service.handleLocateText import handle_locate_text
+from app.services.text_service.handleGetTextsByCatalogNumber import (
+    handle_get_text_by_catalog_number, handle_get_texts_by_catalog_range
+)
+from app.services.text_service.loadingProfiles import text_loading_options, text_selection_options
+from app.utils.field_selection import parse_field_selection
+from app.utils.fast_json import FastJSONRoute, FastJSONResponse
 
-router = APIRouter( prefix="", tags=[" Texts"])
+router = APIRouter( prefix="", tags=[" Texts"], route_class=FastJSONRoute)
 
 @router.get("/texts", response_model=TextsListResponse)
 async def get_all_texts(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
     search: Optional[str] = Query(None, description="Search in titles"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,english_title,order_index"),
+    include: Optional[str] = Query(None, description="Comma-separated relationships to embed: text_summary, yeshe_de_spans"),
+    sort: Optional[str] = Query(None, regex="^tibetan$", description="tibetan: traditional Tibetan alphabetical order; omit for display order"),
     db: Session = Depends(get_db),
     admin_user: User = Depends(require_admin)  # Admin only
 ):
-    return await handle_get_all_texts(admin_user=admin_user, page=page, limit=limit, search=search, db=db)
+    return await handle_get_all_texts(admin_user=admin_user, page=page, limit=limit, search=search, fields=fields, include=include, sort=sort, db=db)
+
+@router.get("/locate", response_model=LocateResponse)
+async def locate_text(
+    volume: int = Query(..., ge=1, description="Yeshe De volume number"),
+    page: str = Query(..., description="Folio, e.g. 12a or 12b; 12 matches either side"),
+    db: Session = Depends(get_db)
+):
+    """Find the text(s) at a volume and folio"""
+    return await handle_locate_text(volume=volume, page=page, db=db)
+
+@router.get("/texts/by-derge", response_model=TextsListResponse)
+async def get_texts_by_derge_range(
+    start: str = Query(..., description="First Derge number, e.g. D100, or a range such as D100-200"),
+    end: Optional[str] = Query(None, description="Last Derge number (inclusive), e.g. D200"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    db: Session = Depends(get_db)
+):
+    """Texts in a Derge number range, in natural catalog order"""
+    return await handle_get_texts_by_catalog_range("derge", start=start, end=end, page=page, limit=limit, db=db)
+
+@router.get("/texts/by-derge/{derge_id}", response_model=KagyurTextResponse)
+async def get_text_by_derge(derge_id: str, db: Session = Depends(get_db)):
+    """Get a text by its Derge number, e.g. D340a"""
+    return await handle_get_text_by_catalog_number("derge", derge_id, db=db)
+
+@router.get("/texts/by-yeshe-de", response_model=TextsListResponse)
+async def get_texts_by_yeshe_de_range(
+    start: str = Query(..., description="First Yeshe De number, or a range such as 100-200"),
+    end: Optional[str] = Query(None, description="Last Yeshe De number (inclusive)"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    db: Session = Depends(get_db)
+):
+    """Texts in a Yeshe De number range, in natural catalog order"""
+    return await handle_get_texts_by_catalog_range("yeshe_de", start=start, end=end, page=page, limit=limit, db=db)
+
+@router.get("/texts/by-yeshe-de/{yeshe_de_id}", response_model=KagyurTextResponse)
+async def get_text_by_yeshe_de(yeshe_de_id: str, db: Session = Depends(get_db)):
+    """Get a text by its Yeshe De number"""
+    return await handle_get_text_by_catalog_number("yeshe_de", yeshe_de_id, db=db)
 
 @router.get("/texts/{text_id}", response_model=KagyurTextResponse)
-async def get_text(text_id: int, db: Session = Depends(get_db)):
+async def get_text(
+    text_id: int,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,english_title,text_summary.purpose_english"),
+    db: Session = Depends(get_db)
+):
     """Get complete text data for editing"""
+    selection = parse_field_selection(KagyurTextResponse, fields)
+    options = text_selection_options(selection) if selection is not None else text_loading_options("detail")
     
-    text = db.query(KagyurText).options(
-        joinedload(KagyurText.text_summary),
-        joinedload(KagyurText.sermon),
-        joinedload(KagyurText.yana),
-        joinedload(KagyurText.translation_type),
-        joinedload(KagyurText.yeshe_de_spans).joinedload(YesheDESpan.volumes),
-        joinedload(KagyurText.sub_category)
-    ).filter(KagyurText.id == text_id).first()
+    text = db.query(KagyurText).options(*options).filter(KagyurText.id == text_id).first()
     
     if not text:
         raise HTTPException(status_code=404, detail="Text not found")
     
+    if selection is not None:
+        return FastJSONResponse(selection.extract(text))
+    
     return text
 
 @router.get("/categories/{category_id}/subcategories/{sub_category_id}/texts/",
@@ -50,10 +103,15 @@ async def get_text(text_id: int, db: Session = Depends(get_db)):
 async def fetch_text(
     category_id: int,
     sub_category_id: int,
-    lang: Optional[str] = Query(None, regex="^(en|tb)$", description="Language preference: en or tb"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    lang: Optional[str] = Query(None, regex="^(en|tb)$", description="Language preference: en or tb; omit for both languages"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,english_title,order_index"),
+    include: Optional[str] = Query(None, description="Comma-separated relationships to embed: text_summary, yeshe_de_spans"),
+    sort: Optional[str] = Query(None, regex="^tibetan$", description="tibetan: traditional Tibetan alphabetical order; omit for display order"),
     db: Session = Depends(get_db)
 ):
-    return await handle_fetch_texts(category_id=category_id, sub_category_id=sub_category_id, db=db)
+    return await handle_fetch_texts(category_id=category_id, sub_category_id=sub_category_id, page=page, limit=limit, lang=lang, fields=fields, include=include, sort=sort, db=db)
 
 
 @router.post(
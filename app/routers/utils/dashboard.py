@@ -1,11 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy.sql import func
 from typing import Optional
 from app.database import get_db
-from app.models import MainCategory, SubCategory, KagyurText, Yana, Sermon, TranslationType, AuditLog, User
+from app.models import AuditLog, User
 from app.schemas import KarchagStatsResponse
 from app.dependencies.auth import require_admin
+from app.services.dashboard_service.handleGetDashboardStats import handle_get_dashboard_stats
+from app.utils.single_flight import get_single_flight_stats
+from app.utils.slow_query_log import get_slow_queries, clear_slow_queries
+from app.core.config import settings
 import logging
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
@@ -19,37 +22,15 @@ async def get_dashboard_stats(
     """
     Get statistics for admin dashboard.
     
-    Returns comprehensive stats about the collection.
+    Returns comprehensive stats about the collection, served from an
+    in-memory snapshot (see ``generated_at`` for its age).
     """
     try:
-        # Get texts by main category
-        texts_by_category = db.query(MainCategory.name_english, func.count(KagyurText.id))\
-                             .join(SubCategory, MainCategory.id == SubCategory.main_category_id)\
-                             .join(KagyurText, SubCategory.id == KagyurText.sub_category_id)\
-                             .filter(KagyurText.is_active == True)\
-                             .group_by(MainCategory.id, MainCategory.name_english)\
-                             .all()
-        
-        # Get texts by yana
-        texts_by_yana = db.query(Yana.name_english, func.count(KagyurText.id))\
-                          .join(KagyurText, Yana.id == KagyurText.yana_id)\
-                          .filter(KagyurText.is_active == True)\
-                          .group_by(Yana.id, Yana.name_english)\
-                          .all()
-        
-        stats = KarchagStatsResponse(
-            total_texts=db.query(KagyurText).filter(KagyurText.is_active == True).count(),
-            total_categories=db.query(MainCategory).filter(MainCategory.is_active == True).count(),
-            total_sermons=db.query(Sermon).filter(Sermon.is_active == True).count(),
-            total_yanas=db.query(Yana).filter(Yana.is_active == True).count(),
-            total_translation_types=db.query(TranslationType).filter(TranslationType.is_active == True).count(),
-            texts_by_category=texts_by_category,
-            texts_by_yana=texts_by_yana
-        )
-        
-        logger.info(f"Admin {current_user.username} retrieved dashboard statistics")
-        return stats
-        
+        return await handle_get_dashboard_stats(current_user=current_user, db=db)
+
+    except HTTPException:
+        # Re-raise HTTP exceptions (504 when the shared snapshot build times out)
+        raise
     except Exception as e:
         logger.error(f"Error in get_dashboard_stats: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Dashboard stats error: {str(e)}")
@@ -95,3 +76,48 @@ async def get_dashboard_activity(
     except Exception as e:
         logger.error(f"Error in get_dashboard_activity: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Dashboard activity error: {str(e)}")
+
+
+@router.get("/coalescing")
+async def get_coalescing_stats(
+    current_user: User = Depends(require_admin)
+):
+    """
+    Get request-coalescing counters for this worker.
+    
+    For each coalesced read path: computations run, requests that shared an
+    in-flight computation, errors, waiters that timed out, and waiters that
+    took over after the leader was cancelled.
+    """
+    return {"flights": get_single_flight_stats()}
+
+
+@router.get("/slow-queries")
+async def get_slow_query_log(
+    current_user: User = Depends(require_admin),
+    limit: int = Query(50, ge=1, le=500)
+):
+    """
+    Get the slow-query log of this worker, newest first.
+    
+    Statements that took SLOW_QUERY_THRESHOLD_MS or longer, with their
+    normalized SQL, parameter types, duration, calling handler and plan.
+    """
+    entries = get_slow_queries()
+    return {
+        "threshold_ms": settings.SLOW_QUERY_THRESHOLD_MS,
+        "queries": entries[:limit],
+        "total": len(entries)
+    }
+
+
+@router.delete("/slow-queries")
+async def clear_slow_query_log(
+    current_user: User = Depends(require_admin)
+):
+    """
+    Clear the slow-query log of this worker.
+    """
+    clear_slow_queries()
+    logger.info(f"Admin {current_user.username} cleared the slow-query log")
+    return {"message": "Slow-query log cleared"}
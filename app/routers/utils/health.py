@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Request
+from app.database import engine
+from app.utils.fast_json import FastJSONResponse
+from app.utils.health import check_readiness
+
+router = APIRouter(prefix="/health", tags=["Monitoring"])
+
+@router.get("/live")
+async def liveness():
+    """
+    Liveness probe: the worker's event loop is answering. Touches nothing
+    else, so a database outage never gets the process restarted.
+    """
+    return {"status": "alive"}
+
+@router.get("/ready")
+async def readiness(request: Request):
+    """
+    Readiness probe: 200 when this worker can serve requests, 503 when not.
+
+    Reports the database round trip (a timed ``SELECT 1``), connection pool
+    saturation, the migration version against the code's head and whether
+    the in-memory caches are warm. The result is reused for
+    HEALTH_READY_CACHE_SECONDS, so frequent probes add no load.
+    """
+    status_code, report = await check_readiness(request.app, engine)
+    return FastJSONResponse(report, status_code=status_code, headers={"Cache-Control": "no-store"})
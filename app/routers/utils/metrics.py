@@ -0,0 +1,13 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST
+from app.utils.metrics import render_metrics
+
+router = APIRouter(tags=["Monitoring"])
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics():
+    """
+    Prometheus metrics: request latency per route and status, requests in
+    flight, SQL statement timings, connection pool state and cache hits.
+    """
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import FileResponse
+from app.models import User
+from app.dependencies.auth import require_admin
+from app.utils.profiling import create_profile_token, list_profiles, profile_file
+import logging
+
+router = APIRouter(prefix="/profiles", tags=["Profiling"])
+logger = logging.getLogger(__name__)
+
+@router.get("")
+async def get_profiles(
+    current_user: User = Depends(require_admin),
+    limit: int = Query(50, ge=1, le=200)
+):
+    """
+    List captured request profiles, newest first.
+    
+    Each entry has the request, its status, wall and CPU time, and how it
+    was triggered. Only the profiles stored by this instance are listed.
+    """
+    profiles = list_profiles()
+    return {"profiles": profiles[:limit], "total": len(profiles)}
+
+@router.post("/token")
+async def create_profiling_token(
+    current_user: User = Depends(require_admin),
+    max_age_seconds: int = Query(900, ge=1, description="Validity, capped by PROFILING_TOKEN_MAX_AGE_SECONDS")
+):
+    """
+    Get a signed token that profiles every request sending it.
+    
+    Send the token in the X-Profile-Token header; requests carrying it are
+    profiled until it expires.
+    """
+    logger.info(f"Admin {current_user.username} created a profiling token")
+    return create_profile_token(max_age_seconds)
+
+@router.get("/{profile_id}")
+async def download_profile(
+    profile_id: str,
+    current_user: User = Depends(require_admin)
+):
+    """
+    Download a profile as folded stacks.
+    
+    Open it in speedscope, or render it with flamegraph.pl or inferno.
+    """
+    path = profile_file(profile_id)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type="text/plain", filename=path.name)
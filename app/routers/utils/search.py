@@ -2,8 +2,9 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import Optional
 from app.database import get_db
-from app.models import MainCategory, SubCategory, KagyurText, Yana, Sermon, TranslationType
-from app.schemas import SearchSuggestionResponse, FilterOptionsResponse, MainCategoryBase, SermonBase, YanaBase, TranslationTypeBase
+from app.models import MainCategory, KagyurText
+from app.schemas import SearchSuggestionResponse, FilterOptionsResponse
+from app.services.search_service.handleGetFilterOptions import handle_get_filter_options
 import logging
 
 router = APIRouter(prefix="/search", tags=["Search"])
@@ -77,37 +78,7 @@ async def get_filter_options(
     Returns categories, sermons, yanas, and translation types.
     """
     try:
-        # Get active categories
-        categories = db.query(MainCategory)\
-                      .filter(MainCategory.is_active == True)\
-                      .order_by(MainCategory.order_index)\
-                      .all()
-        
-        # Get active sermons
-        sermons = db.query(Sermon)\
-                   .filter(Sermon.is_active == True)\
-                   .order_by(Sermon.order_index)\
-                   .all()
-        
-        # Get active yanas
-        yanas = db.query(Yana)\
-                 .filter(Yana.is_active == True)\
-                 .order_by(Yana.order_index)\
-                 .all()
-        
-        # Get active translation types
-        translation_types = db.query(TranslationType)\
-                           .filter(TranslationType.is_active == True)\
-                           .order_by(TranslationType.order_index)\
-                           .all()
-        
-        return FilterOptionsResponse(
-            categories=[MainCategoryBase(name_english=c.name_english, name_tibetan=c.name_tibetan) for c in categories],
-            sermons=[SermonBase(name_english=s.name_english, name_tibetan=s.name_tibetan) for s in sermons],
-            yanas=[YanaBase(name_english=y.name_english, name_tibetan=y.name_tibetan) for y in yanas],
-            translation_types=[TranslationTypeBase(name_english=t.name_english, name_tibetan=t.name_tibetan) for t in translation_types],
-            language=lang
-        )
+        return await handle_get_filter_options(lang=lang, db=db)
         
     except Exception as e:
         logger.error(f"Error in get_filter_options: {str(e)}")
@@ -15,15 +15,16 @@ from app.services.video_service.handleUpdateVideo import handle_update_video
 from app.services.video_service.handleDeleteVideo import handle_delete_video
 from app.services.video_service.handlePublishVideo import handle_publish_video
 from app.services.video_service.handleUnpublishVideo import handle_unpublish_video
+from app.utils.fast_json import FastJSONRoute
 
-router = APIRouter(tags=["videos"])
+router = APIRouter(tags=["videos"], route_class=FastJSONRoute)
 
 # ==================== SPECIFIC ROUTES (must come before parameterized routes) ====================
 
 @router.get("/videos/latest", response_model=List[VideoResponse])
 async def get_latest_videos(
     limit: int = Query(5, ge=1, le=20),
-    lang: Optional[str] = Query("en", regex="^(en|tb)$"),
+    lang: Optional[str] = Query(None, regex="^(en|tb)$", description="Language preference: en or tb; omit for both languages"),
     db: Session = Depends(get_db)
 ):
     """🌍 Get latest published videos"""
@@ -46,7 +47,7 @@ async def get_all_videos_admin(
 async def get_videos(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
-    lang: Optional[str] = Query("en", regex="^(en|tb)$"),
+    lang: Optional[str] = Query(None, regex="^(en|tb)$", description="Language preference: en or tb; omit for both languages"),
     db: Session = Depends(get_db)
 ):
     """🌍 Get published videos with pagination"""
@@ -55,7 +56,7 @@ async def get_videos(
 @router.get("/videos/{video_id}", response_model=VideoResponse)
 async def get_video_detail(
     video_id: int,
-    lang: Optional[str] = Query("en", regex="^(en|tb)$"),
+    lang: Optional[str] = Query(None, regex="^(en|tb)$", description="Language preference: en or tb; omit for both languages"),
     db: Session = Depends(get_db)
 ):
     """🌍 Get published video details"""
@@ -11,7 +11,8 @@ from .reference import (
     SermonBase, SermonCreate, SermonResponse,
     YanaBase, YanaCreate, YanaResponse,
     TranslationTypeBase, TranslationTypeCreate, TranslationTypeResponse,
-    EditionBase, EditionCreate, EditionUpdate, EditionResponse, EditionPaginatedResponse
+    LookupReorderRequest,
+    EditionBase, EditionCreate, EditionUpdate, EditionResponse, EditionLanguageResponse, EditionPaginatedResponse
 )
 
 # Category schemas
@@ -28,19 +29,20 @@ from .texts import (
     YesheDESpanBase, YesheDESpanCreate, YesheDESpanUpdate, YesheDESpanResponse,
     TextSummaryBase, TextSummaryCreate, TextSummaryUpdate, TextSummaryResponse,
     KagyurTextBase, KagyurTextCreate, KagyurTextCreateRequest, KagyurTextUpdate,
-    KagyurTextResponse
+    KagyurTextResponse, KagyurTextListItem, LookupLanguageResponse, KagyurTextLanguageListItem,
+    LocatedTextResponse, LocateResponse
 )
 
 # Media schemas
 from .media import (
-    AudioBase, AudioCreate, AudioUpdate, AudioResponse, AudioPaginatedResponse,
-    VideoBase, VideoCreate, VideoUpdate, VideoPublish, VideoPublishResponse, VideoResponse, VideoPaginatedResponse
+    AudioBase, AudioCreate, AudioUpdate, AudioResponse, AudioLanguageResponse, AudioPaginatedResponse,
+    VideoBase, VideoCreate, VideoUpdate, VideoPublish, VideoPublishResponse, VideoResponse, VideoLanguageResponse, VideoPaginatedResponse
 )
 
 # News schemas
 from .news import (
     PublicationStatus, NewsBase, NewsCreate, NewsUpdate, NewsPublish, NewsUnpublish, 
-    NewsResponse, NewsPaginatedResponse
+    NewsResponse, NewsLanguageResponse, NewsPaginatedResponse
 )
 
 # User schemas
@@ -59,6 +61,9 @@ from .search import (
     FilterOptionsResponse, KarchagStatsResponse
 )
 
+# Sync schemas
+from .sync import ChangeEntry, ChangesResponse
+
 def _resolve_forward_refs():
     """Resolve forward references after all schemas are imported"""
     try:
@@ -25,6 +25,8 @@ class MainCategoryUpdate(MainCategoryBase):
 
 class MainCategoryResponse(MainCategoryBase, TimestampMixin):
     id: int
+    text_count: int = 0
+    audio_count: int = 0
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -57,6 +59,8 @@ class SubCategoryUpdate(BaseModel):
 class SubCategoryResponse(SubCategoryBase, TimestampMixin):
     id: int
     main_category_id: int
+    text_count: int = 0
+    audio_count: int = 0
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -73,6 +77,8 @@ class SubCategoryLanguageResponse(BaseModel):
     description: Optional[str] = None
     order_index: int
     is_active: bool
+    text_count: int = 0
+    audio_count: int = 0
     created_at: datetime
     updated_at: datetime
     
@@ -85,6 +91,8 @@ class MainCategoryLanguageResponse(BaseModel):
     description: Optional[str] = None
     order_index: int
     is_active: bool
+    text_count: int = 0
+    audio_count: int = 0
     created_at: datetime
     updated_at: datetime
     sub_categories: List[SubCategoryLanguageResponse] = []
@@ -104,4 +104,40 @@ class AudioPaginatedResponse(PaginatedResponse):
 
 
 class VideoPaginatedResponse(PaginatedResponse):
-    videos: List[VideoResponse]
\ No newline at end of file
+    videos: List[VideoResponse]
+
+
+class AudioLanguageResponse(BaseModel):
+    """Response model for language-specific audio data"""
+    id: int
+    text_id: int
+    audio_url: str
+    file_name: str
+    file_size: int
+    duration: Optional[int] = None
+    narrator_name: Optional[str] = None  # Will be either English or Tibetan based on lang parameter
+    audio_quality: Optional[str] = None
+    audio_language: Optional[str] = None
+    order_index: Optional[int] = 0
+    is_active: Optional[bool] = True
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class VideoLanguageResponse(BaseModel):
+    """Response model for language-specific video data"""
+    id: int
+    title: Optional[str] = None  # Will be either English or Tibetan based on lang parameter
+    description: Optional[str] = None
+    video_url: str
+    published_date: Optional[datetime] = None
+    publication_status: PublicationStatus
+    is_active: bool
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
@@ -48,4 +48,18 @@ class NewsResponse(NewsBase, TimestampMixin):
 
 
 class NewsPaginatedResponse(PaginatedResponse):
-    news_articles: List[NewsResponse]
\ No newline at end of file
+    news_articles: List[NewsResponse]
+
+
+class NewsLanguageResponse(BaseModel):
+    """Response model for language-specific news data"""
+    id: int
+    title: Optional[str] = None  # Will be either English or Tibetan based on lang parameter
+    content: Optional[str] = None
+    published_date: Optional[datetime] = None
+    publication_status: PublicationStatus
+    is_active: bool
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(from_attributes=True)
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, ConfigDict
 from typing import List, Optional
+from datetime import datetime
 from enum import Enum
 from .base import TimestampMixin
 
@@ -21,6 +22,7 @@ class SermonCreate(SermonBase):
 
 class SermonResponse(SermonBase, TimestampMixin):
     id: int
+    order_index: int = 0
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -35,6 +37,7 @@ class YanaCreate(YanaBase):
 
 class YanaResponse(YanaBase, TimestampMixin):
     id: int
+    order_index: int = 0
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -49,9 +52,15 @@ class TranslationTypeCreate(TranslationTypeBase):
 
 class TranslationTypeResponse(TranslationTypeBase, TimestampMixin):
     id: int
+    order_index: int = 0
     model_config = ConfigDict(from_attributes=True)
 
 
+class LookupReorderRequest(BaseModel):
+    """Ids of a lookup table in the desired display order"""
+    ids: List[int]
+
+
 class EditionBase(BaseModel):
     name_english: str
     name_tibetan: Optional[str] = None
@@ -89,6 +98,23 @@ class EditionResponse(EditionBase, TimestampMixin):
     model_config = ConfigDict(from_attributes=True)
 
 
+class EditionLanguageResponse(BaseModel):
+    """Response model for language-specific edition data"""
+    id: int
+    name: str  # Will be either English or Tibetan based on lang parameter
+    description: Optional[str] = None
+    abbreviation: Optional[str] = None
+    publisher: Optional[str] = None
+    publication_year: Optional[int] = None
+    location: Optional[str] = None
+    total_volumes: Optional[int] = None
+    order_index: int = 0
+    is_active: bool = True
+    created_at: datetime
+    updated_at: datetime
+    model_config = ConfigDict(from_attributes=True)
+
+
 class EditionPaginatedResponse(BaseModel):
     editions: List[EditionResponse]
     total: int
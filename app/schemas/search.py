@@ -1,6 +1,7 @@
 from pydantic import BaseModel, ConfigDict
 from typing import List, Optional
-from .texts import KagyurTextResponse
+from datetime import datetime
+from .texts import KagyurTextListItem
 from .base import PaginationResponse
 from .reference import SermonBase, YanaBase, TranslationTypeBase
 from .categories import MainCategoryBase
@@ -28,7 +29,7 @@ class SearchSuggestionResponse(BaseModel):
 
 
 class TextsListResponse(BaseModel):
-    texts: List[KagyurTextResponse]
+    texts: List[KagyurTextListItem]
     pagination: PaginationResponse
 
 
@@ -50,6 +51,7 @@ class KarchagStatsResponse(BaseModel):
     total_translation_types: int
     texts_by_category: List[tuple]  # [(category_name, count), ...]
     texts_by_yana: List[tuple]      # [(yana_name, count), ...]
+    generated_at: Optional[datetime] = None  # When the served snapshot was computed
     
     model_config = ConfigDict(from_attributes=True)
 
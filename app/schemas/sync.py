@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+
+class ChangeEntry(BaseModel):
+    table: str
+    id: int
+    action: str  # "upsert" or "delete"
+    token: int  # Change-log position of this entry
+    data: Optional[dict] = None  # Current record for upserts
+
+
+class ChangesResponse(BaseModel):
+    changes: List[ChangeEntry]
+    next_token: int  # Pass as ?since= for the next page
+    has_more: bool
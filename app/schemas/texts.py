@@ -116,4 +116,53 @@ class KagyurTextResponse(KagyurTextBase, TimestampMixin):
     yana: Optional[YanaResponse] = None
     yeshe_de_spans: List[YesheDESpanResponse] = []
     translation_type: Optional[TranslationTypeResponse] = None
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+class KagyurTextListItem(KagyurTextBase, TimestampMixin):
+    """Listing row: text columns and lookups only, no summary or Yeshe De spans"""
+    id: int
+    sub_category_id: int
+    sermon: Optional[SermonResponse] = None
+    yana: Optional[YanaResponse] = None
+    translation_type: Optional[TranslationTypeResponse] = None
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LookupLanguageResponse(BaseModel):
+    """Sermon, yana or translation type reduced to its name in one language"""
+    id: int
+    name: Optional[str] = None
+
+
+class KagyurTextLanguageListItem(BaseModel):
+    """Listing row in one language: ``title`` replaces the English/Tibetan title pair"""
+    id: int
+    sub_category_id: int
+    derge_id: Optional[str] = None
+    yeshe_de_id: Optional[str] = None
+    title: Optional[str] = None  # Will be either English or Tibetan based on lang parameter
+    chinese_title: Optional[str] = None
+    sanskrit_title: Optional[str] = None
+    sermon: Optional[LookupLanguageResponse] = None
+    yana: Optional[LookupLanguageResponse] = None
+    translation_type: Optional[LookupLanguageResponse] = None
+    order_index: int = 0
+    is_active: bool = True
+    created_at: datetime
+    updated_at: datetime
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LocatedTextResponse(BaseModel):
+    """A text whose Yeshe De volume range covers the requested folio"""
+    text: KagyurTextListItem
+    volume_number: Optional[str] = None
+    start_page: Optional[str] = None
+    end_page: Optional[str] = None
+
+
+class LocateResponse(BaseModel):
+    volume: int
+    page: str
+    texts: List[LocatedTextResponse]
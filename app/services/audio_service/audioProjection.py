@@ -0,0 +1,30 @@
+from typing import Optional
+from sqlalchemy import select
+from app.models import KagyurAudio, KagyurText, SubCategory
+from app.schemas import AudioLanguageResponse
+from app.utils.language_projection import localized_column
+from app.utils.response_cache import ResponseCache
+
+# Rendered per-language public audio payloads, dropped whenever audio or its text/sub-category is written
+audio_cache = ResponseCache("audio", KagyurAudio, KagyurText, SubCategory)
+
+def active_audio_select(lang: Optional[str]):
+    """Active audio files with the narrator name in one language only"""
+    return select(
+        KagyurAudio.id,
+        KagyurAudio.text_id,
+        KagyurAudio.audio_url,
+        KagyurAudio.file_name,
+        KagyurAudio.file_size,
+        KagyurAudio.duration,
+        localized_column(KagyurAudio.narrator_name_english, KagyurAudio.narrator_name_tibetan, lang, "narrator_name"),
+        KagyurAudio.audio_quality,
+        KagyurAudio.audio_language,
+        KagyurAudio.order_index,
+        KagyurAudio.is_active,
+        KagyurAudio.created_at,
+        KagyurAudio.updated_at
+    ).where(KagyurAudio.is_active == True)
+
+def to_audio_language(rows) -> list:
+    return [AudioLanguageResponse.model_validate(dict(row._mapping)) for row in rows]
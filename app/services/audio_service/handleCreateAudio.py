@@ -1,6 +1,7 @@
 from fastapi import HTTPException, UploadFile
 from sqlalchemy.orm import Session
 from app.models import KagyurAudio, KagyurText, User
+from app.utils.counters import adjust_counters
 from datetime import datetime
 import os
 
@@ -55,6 +56,7 @@ async def handle_create_audio(
     )
     
     db.add(audio_data)
+    adjust_counters(db, text.sub_category_id, audio_delta=1)
     db.commit()
     db.refresh(audio_data)
     
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
-from app.models import KagyurAudio, User
+from app.models import KagyurAudio, KagyurText, User
+from app.utils.counters import adjust_counters
 from fastapi import HTTPException
 import os
 from typing import Any
@@ -16,6 +17,11 @@ async def handle_delete_audio(audio_id: int, current_user: User, db: Session) ->
                 os.remove(str(file_path))
     except (AttributeError, TypeError, OSError):
         pass
+    if audio.is_active:
+        sub_category_id = db.query(KagyurText.sub_category_id).filter(
+            KagyurText.id == audio.text_id
+        ).scalar()
+        adjust_counters(db, sub_category_id, audio_delta=-1)
     db.delete(audio)
     db.commit()
     return {"message": "Audio deleted successfully"} 
\ No newline at end of file
@@ -1,14 +1,26 @@
 from sqlalchemy.orm import Session
 from app.models import KagyurAudio
 from app.schemas import AudioResponse
+from app.services.audio_service.audioProjection import audio_cache, active_audio_select, to_audio_language
+from app.utils.compression import CachedJSONResponse
 from typing import Optional
 from fastapi import HTTPException
 
 async def handle_get_audio_details(audio_id: int, lang: Optional[str], db: Session) -> AudioResponse:
+    if lang:
+        body = audio_cache.get_or_render(("detail", audio_id, lang), lambda: _build_audio_detail(audio_id, lang, db))
+        return CachedJSONResponse(body)
+
     audio = db.query(KagyurAudio).filter(
         KagyurAudio.id == audio_id,
         KagyurAudio.is_active == True
     ).first()
     if not audio:
         raise HTTPException(status_code=404, detail="Audio not found")
-    return AudioResponse.from_orm(audio) 
\ No newline at end of file
+    return AudioResponse.from_orm(audio)
+
+def _build_audio_detail(audio_id: int, lang: str, db: Session):
+    rows = db.execute(active_audio_select(lang).where(KagyurAudio.id == audio_id)).all()
+    if not rows:
+        raise HTTPException(status_code=404, detail="Audio not found")
+    return to_audio_language(rows)[0]
@@ -1,10 +1,38 @@
 from sqlalchemy.orm import Session
 from app.models import KagyurText, SubCategory, KagyurAudio
 from app.schemas import AudioResponse
+from app.services.audio_service.audioProjection import audio_cache, active_audio_select, to_audio_language
+from app.utils.compression import CachedJSONResponse
 from typing import Optional
 from fastapi import HTTPException
 
 async def handle_get_text_audio(category_id: int, sub_category_id: int, text_id: int, lang: Optional[str], quality: Optional[str], db: Session) -> dict:
+    if lang:
+        body = audio_cache.get_or_render(
+            ("text", category_id, sub_category_id, text_id, quality, lang),
+            lambda: _build_text_audio(category_id, sub_category_id, text_id, lang, quality, db)
+        )
+        return CachedJSONResponse(body)
+    _check_text_path(category_id, sub_category_id, text_id, db)
+    query = db.query(KagyurAudio).filter(
+        KagyurAudio.text_id == text_id,
+        KagyurAudio.is_active == True
+    )
+    if quality:
+        query = query.filter(KagyurAudio.audio_quality == quality)
+    audio_files = query.order_by(KagyurAudio.order_index).all()
+    return {"audio_files": [AudioResponse.model_validate(audio) for audio in audio_files]}
+
+def _build_text_audio(category_id: int, sub_category_id: int, text_id: int, lang: str, quality: Optional[str], db: Session) -> dict:
+    """Audio files of a text with only the requested language's narrator name"""
+    _check_text_path(category_id, sub_category_id, text_id, db)
+    stmt = active_audio_select(lang).where(KagyurAudio.text_id == text_id)
+    if quality:
+        stmt = stmt.where(KagyurAudio.audio_quality == quality)
+    rows = db.execute(stmt.order_by(KagyurAudio.order_index)).all()
+    return {"audio_files": to_audio_language(rows)}
+
+def _check_text_path(category_id: int, sub_category_id: int, text_id: int, db: Session) -> None:
     text = db.query(KagyurText).filter(
         KagyurText.id == text_id,
         KagyurText.sub_category_id == sub_category_id
@@ -17,11 +45,3 @@ async def handle_get_text_audio(category_id: int, sub_category_id: int, text_id:
     ).first()
     if not subcategory:
         raise HTTPException(status_code=404, detail="Invalid category/subcategory combination")
-    query = db.query(KagyurAudio).filter(
-        KagyurAudio.text_id == text_id,
-        KagyurAudio.is_active == True
-    )
-    if quality:
-        query = query.filter(KagyurAudio.audio_quality == quality)
-    audio_files = query.order_by(KagyurAudio.order_index).all()
-    return {"audio_files": [AudioResponse.model_validate(audio) for audio in audio_files]} 
\ No newline at end of file
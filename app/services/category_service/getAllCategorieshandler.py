@@ -21,6 +21,8 @@ async def handle_get_all_categories(
             "description": category.description_english if lang != "tb" else category.description_tibetan,
             "order_index": category.order_index,
             "is_active": category.is_active,
+            "text_count": category.text_count,
+            "audio_count": category.audio_count,
             "created_at": category.created_at,
             "updated_at": category.updated_at
         }
@@ -2,29 +2,51 @@ from fastapi import Depends,Query
 from sqlalchemy.orm import Session, joinedload
 from typing import  Optional
 from app.database import get_db
-from app.models import MainCategory, SubCategory
+from app.models import MainCategory, SubCategory, KagyurText, KagyurAudio
 from app.dependencies.auth import require_admin
+from app.utils.compression import CachedJSONResponse
+from app.utils.response_cache import ResponseCache
+from app.utils.single_flight import single_flight
+from app.utils.tibetan_collation import MISSING_KEY
+
+# Rendered category tree per language. Text and audio writes change the
+# denormalized counters through bulk UPDATEs, so they invalidate it too.
+category_cache = ResponseCache("categories", MainCategory, SubCategory, KagyurText, KagyurAudio)
 
 async def handle_get_categories(
     lang: Optional[str] = Query(None, regex="^(en|tb)$", description="Language preference: en or tb"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    sort: Optional[str] = None
 ):
     """
     Retrieve all main categories with their sub-categories.
     
     Args:
         lang: Language preference (en=English, tb=Tibetan)
+        sort: "tibetan" for traditional Tibetan order of the names; omit for display order
     
     Returns:
-        Hierarchical category structure with all active main categories and their sub-categories
+        Hierarchical category structure with all active main categories and their sub-categories,
+        served from the rendered (and precompressed) cache when possible
     """
+    key = lang if sort is None else (lang, sort)
+    body = category_cache.get(key)
+    if body is None:
+        body = category_cache.put(key, await _load_categories(lang, db, sort))
+    return CachedJSONResponse(body)
+
+def build_category_tree(lang: Optional[str], db: Session, sort: Optional[str] = None) -> list:
+    """Build the active category tree in one language (uncached)"""
     categories_query = db.query(MainCategory).options(
         joinedload(MainCategory.sub_categories.and_(SubCategory.is_active == True))
     ).filter(
         MainCategory.is_active == True
     )
     
-    categories = categories_query.order_by(MainCategory.order_index).all()
+    if sort == "tibetan":
+        categories = categories_query.order_by(MainCategory.tibetan_sort_key, MainCategory.id).all()
+    else:
+        categories = categories_query.order_by(MainCategory.order_index).all()
     
     # Transform data based on language preference
     result = []
@@ -35,13 +57,18 @@ async def handle_get_categories(
             "description": category.description_english if lang != "tb" else (category.description_tibetan or category.description_english),
             "order_index": category.order_index,
             "is_active": category.is_active,
+            "text_count": category.text_count,
+            "audio_count": category.audio_count,
             "created_at": category.created_at,
             "updated_at": category.updated_at,
             "sub_categories": []
         }
         
         # Transform sub-categories too
-        for sub_cat in category.sub_categories:
+        sub_categories = category.sub_categories
+        if sort == "tibetan":
+            sub_categories = sorted(sub_categories, key=lambda sub_cat: (sub_cat.tibetan_sort_key or MISSING_KEY, sub_cat.id))
+        for sub_cat in sub_categories:
             sub_cat_data = {
                 "id": sub_cat.id,
                 "main_category_id": sub_cat.main_category_id,
@@ -49,6 +76,8 @@ async def handle_get_categories(
                 "description": sub_cat.description_english if lang != "tb" else (sub_cat.description_tibetan or sub_cat.description_english),
                 "order_index": sub_cat.order_index,
                 "is_active": sub_cat.is_active,
+                "text_count": sub_cat.text_count,
+                "audio_count": sub_cat.audio_count,
                 "created_at": sub_cat.created_at,
                 "updated_at": sub_cat.updated_at
             }
@@ -57,3 +86,6 @@ async def handle_get_categories(
         result.append(category_data)
     
     return result
+
+# Concurrent identical requests share one build
+_load_categories = single_flight("categories")(build_category_tree)
@@ -22,6 +22,8 @@ async def handle_get_category(category_id: int,
         "description": db_category.description_english if lang != "tb" else db_category.description_tibetan,
         "order_index": db_category.order_index,
         "is_active": db_category.is_active,
+        "text_count": db_category.text_count,
+        "audio_count": db_category.audio_count,
         "created_at": db_category.created_at,
         "updated_at": db_category.updated_at,
         "sub_categories": [
@@ -32,6 +34,8 @@ async def handle_get_category(category_id: int,
                 "main_category_id": getattr(sub, 'main_category_id', category_id),  # Use category_id as fallback
                 "order_index": getattr(sub, 'order_index', 0),  # Default to 0
                 "is_active": sub.is_active,
+                "text_count": sub.text_count,
+                "audio_count": sub.audio_count,
                 "created_at": getattr(sub, 'created_at', db_category.created_at),  # Use parent's timestamp as fallback
                 "updated_at": getattr(sub, 'updated_at', db_category.updated_at)   # Use parent's timestamp as fallback
             } for sub in db_category.sub_categories
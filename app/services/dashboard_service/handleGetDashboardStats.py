@@ -0,0 +1,79 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from datetime import datetime, timezone
+from typing import Optional
+from app.core.config import settings
+from app.models import MainCategory, KagyurText, Yana, Sermon, TranslationType, User
+from app.schemas import KarchagStatsResponse
+from app.utils.change_hooks import on_commit
+from app.utils.single_flight import single_flight
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+class _StatsSnapshot:
+    """In-memory dashboard statistics, rebuilt when stale"""
+    def __init__(self):
+        self.stats: Optional[KarchagStatsResponse] = None
+        self.built_at: float = 0.0  # time.monotonic() of the last rebuild
+        self.stale: bool = True
+
+    def is_fresh(self) -> bool:
+        if self.stats is None or self.stale:
+            return False
+        return time.monotonic() - self.built_at < settings.DASHBOARD_STATS_MAX_AGE_SECONDS
+
+_snapshot = _StatsSnapshot()
+
+@on_commit(KagyurText, MainCategory, Sermon, Yana, TranslationType)
+def invalidate_dashboard_stats(tables=None) -> None:
+    """Mark the snapshot stale so the next request rebuilds it"""
+    _snapshot.stale = True
+
+@single_flight("dashboard_stats")
+def _rebuild_snapshot(db: Session) -> KarchagStatsResponse:
+    """Recompute the stats; concurrent pollers share one rebuild"""
+    _snapshot.stale = False
+    _snapshot.stats = _build_stats(db)
+    _snapshot.built_at = time.monotonic()
+    logger.info("Dashboard stats snapshot rebuilt")
+    return _snapshot.stats
+
+def _build_stats(db: Session) -> KarchagStatsResponse:
+    # Texts by main category come from the denormalized counter
+    texts_by_category = db.query(MainCategory.name_english, MainCategory.text_count)\
+                         .filter(MainCategory.text_count > 0)\
+                         .order_by(MainCategory.order_index)\
+                         .all()
+    
+    texts_by_yana = db.query(Yana.name_english, func.count(KagyurText.id))\
+                      .join(KagyurText, Yana.id == KagyurText.yana_id)\
+                      .filter(KagyurText.is_active == True)\
+                      .group_by(Yana.id, Yana.name_english)\
+                      .all()
+    
+    return KarchagStatsResponse(
+        total_texts=db.query(func.coalesce(func.sum(MainCategory.text_count), 0)).scalar(),
+        total_categories=db.query(MainCategory).filter(MainCategory.is_active == True).count(),
+        total_sermons=db.query(Sermon).filter(Sermon.is_active == True).count(),
+        total_yanas=db.query(Yana).filter(Yana.is_active == True).count(),
+        total_translation_types=db.query(TranslationType).filter(TranslationType.is_active == True).count(),
+        texts_by_category=[tuple(row) for row in texts_by_category],
+        texts_by_yana=[tuple(row) for row in texts_by_yana],
+        generated_at=datetime.now(timezone.utc)
+    )
+
+async def handle_get_dashboard_stats(current_user: User, db: Session) -> KarchagStatsResponse:
+    """
+    Serve dashboard statistics from the in-memory snapshot.
+    
+    The snapshot is rebuilt when a commit touched texts, categories or lookup
+    tables, or when it is older than DASHBOARD_STATS_MAX_AGE_SECONDS (which
+    also bounds staleness for writes handled by other workers).
+    ``generated_at`` in the response tells the client how fresh it is.
+    """
+    if _snapshot.is_fresh():
+        return _snapshot.stats
+    
+    return await _rebuild_snapshot(db)
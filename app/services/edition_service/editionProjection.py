@@ -0,0 +1,29 @@
+from typing import Optional
+from sqlalchemy import select
+from app.models import Edition
+from app.schemas import EditionLanguageResponse
+from app.utils.language_projection import localized_column
+from app.utils.response_cache import ResponseCache
+
+# Rendered per-language public edition payloads, dropped whenever editions are written
+edition_cache = ResponseCache("editions", Edition)
+
+def active_editions_select(lang: Optional[str]):
+    """Active editions with name and description in one language only"""
+    return select(
+        Edition.id,
+        localized_column(Edition.name_english, Edition.name_tibetan, lang, "name"),
+        localized_column(Edition.description_english, Edition.description_tibetan, lang, "description"),
+        Edition.abbreviation,
+        Edition.publisher,
+        Edition.publication_year,
+        Edition.location,
+        Edition.total_volumes,
+        Edition.order_index,
+        Edition.is_active,
+        Edition.created_at,
+        Edition.updated_at
+    ).where(Edition.is_active == True)
+
+def to_edition_language(rows) -> list:
+    return [EditionLanguageResponse.model_validate(dict(row._mapping)) for row in rows]
@@ -1,14 +1,26 @@
 from sqlalchemy.orm import Session
 from app.models import Edition
 from app.schemas import EditionResponse
+from app.services.edition_service.editionProjection import edition_cache, active_editions_select, to_edition_language
+from app.utils.compression import CachedJSONResponse
 from typing import Optional
 from fastapi import HTTPException
 
 async def handle_get_edition_detail(edition_id: int, lang: Optional[str], db: Session) -> EditionResponse:
+    if lang:
+        body = edition_cache.get_or_render(("detail", edition_id, lang), lambda: _build_edition_detail(edition_id, lang, db))
+        return CachedJSONResponse(body)
+
     edition = db.query(Edition).filter(
         Edition.id == edition_id,
         Edition.is_active == True
     ).first()
     if not edition:
         raise HTTPException(status_code=404, detail="Edition not found")
-    return edition 
\ No newline at end of file
+    return edition
+
+def _build_edition_detail(edition_id: int, lang: str, db: Session):
+    rows = db.execute(active_editions_select(lang).where(Edition.id == edition_id)).all()
+    if not rows:
+        raise HTTPException(status_code=404, detail="Edition not found")
+    return to_edition_language(rows)[0]
@@ -1,10 +1,19 @@
 from sqlalchemy.orm import Session
 from app.models import Edition
 from app.schemas import EditionResponse
+from app.services.edition_service.editionProjection import edition_cache, active_editions_select, to_edition_language
+from app.utils.compression import CachedJSONResponse
 from typing import Optional, List
 
 async def handle_get_editions(lang: Optional[str], db: Session) -> list:
+    if lang:
+        body = edition_cache.get_or_render(
+            ("list", lang),
+            lambda: to_edition_language(db.execute(active_editions_select(lang).order_by(Edition.order_index)).all())
+        )
+        return CachedJSONResponse(body)
+
     editions = db.query(Edition).filter(
         Edition.is_active == True
     ).order_by(Edition.order_index).all()
-    return editions 
\ No newline at end of file
+    return editions
@@ -0,0 +1,172 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.database import SessionLocal
+from app.models import (
+    Base, MainCategory, SubCategory, Sermon, Yana, TranslationType,
+    KagyurText, TextSummary, YesheDESpan, Volume
+)
+from app.services.sync_service.handleGetChanges import public_row_filters, settled_change_token
+from app.utils.background_jobs import DebouncedJob
+from app.utils.change_hooks import on_commit
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+# Bumped when the bundle's table layout changes incompatibly
+BUNDLE_FORMAT = 1
+
+# Exported in dependency order, so foreign keys always point at earlier tables
+BUNDLE_MODELS = (
+    MainCategory, SubCategory, Sermon, Yana, TranslationType,
+    KagyurText, TextSummary, YesheDESpan, Volume
+)
+
+MANIFEST_NAME = "catalog-bundle.json"
+_INSERT_BATCH = 1000
+
+def _bundle_dir() -> Path:
+    path = Path(settings.EXPORT_BUNDLE_DIR)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+def bundle_file(manifest: dict) -> Path:
+    """Path of the bundle file a manifest describes"""
+    return _bundle_dir() / manifest["file_name"]
+
+def read_manifest() -> Optional[dict]:
+    """
+    The manifest of the current bundle (file name, version, ETag), or None if
+    none has been built. Read from disk, so every worker serves the same file.
+    """
+    try:
+        with open(_bundle_dir() / MANIFEST_NAME) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not bundle_file(manifest).exists():
+        return None
+    return manifest
+
+def _write_sqlite(db: Session, path: str, change_token: int) -> None:
+    """Copy the public rows of BUNDLE_MODELS into a fresh SQLite file at ``path``"""
+    tables = [model.__table__ for model in BUNDLE_MODELS]
+    target = create_engine(f"sqlite:///{path}")
+    try:
+        Base.metadata.create_all(target, tables=tables)
+        with target.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE bundle_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            conn.exec_driver_sql(
+                "INSERT INTO bundle_meta (key, value) VALUES (?, ?), (?, ?), (?, ?)",
+                ("format", str(BUNDLE_FORMAT), "change_token", str(change_token), "built_at", datetime.utcnow().isoformat())
+            )
+            for model in BUNDLE_MODELS:
+                stmt = select(*model.__table__.columns).where(*public_row_filters(model)).order_by(model.id)
+                batch = []
+                for row in db.execute(stmt):
+                    batch.append(dict(row._mapping))
+                    if len(batch) >= _INSERT_BATCH:
+                        conn.execute(insert(model.__table__), batch)
+                        batch = []
+                if batch:
+                    conn.execute(insert(model.__table__), batch)
+        with target.connect() as conn:
+            conn.exec_driver_sql("VACUUM")
+    finally:
+        target.dispose()
+
+def build_catalog_bundle(db: Session) -> dict:
+    """
+    Build a gzip-compressed SQLite snapshot of the public catalog and make it
+    the current bundle.
+
+    The snapshot holds categories, lookups, texts, summaries, Yeshe De spans
+    and volumes, plus a ``bundle_meta`` table whose ``change_token`` clients
+    pass to ``GET /changes?since=`` to catch up after importing it.
+
+    Returns:
+        dict: The new manifest
+    """
+    # Read the token first: anything committed after it is replayed by /changes.
+    # Only settled entries count, so no transaction still committing sits below it.
+    change_token = settled_change_token(db)
+    directory = _bundle_dir()
+
+    fd, sqlite_path = tempfile.mkstemp(suffix=".sqlite", dir=directory)
+    os.close(fd)
+    os.unlink(sqlite_path)
+    try:
+        _write_sqlite(db, sqlite_path, change_token)
+        with open(sqlite_path, "rb") as f:
+            data = gzip.compress(f.read(), compresslevel=9, mtime=0)
+    finally:
+        if os.path.exists(sqlite_path):
+            os.unlink(sqlite_path)
+
+    digest = hashlib.sha256(data).hexdigest()
+    version = f"{BUNDLE_FORMAT}.{change_token}.{digest[:12]}"
+    file_name = f"kangyur-catalog-{version}.sqlite.gz"
+    manifest = {
+        "version": version,
+        "format": BUNDLE_FORMAT,
+        "change_token": change_token,
+        "file_name": file_name,
+        "etag": f'"{digest}"',
+        "size": len(data),
+        "built_at": datetime.utcnow().isoformat()
+    }
+
+    previous = read_manifest()
+    _atomic_write(directory / file_name, data)
+    _atomic_write(directory / MANIFEST_NAME, json.dumps(manifest).encode())
+    if previous and previous["file_name"] != file_name:
+        # Keep the previous file briefly for downloads already in progress
+        _remove_stale_bundles(directory, keep={file_name, previous["file_name"]})
+    return manifest
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def _remove_stale_bundles(directory: Path, keep: set) -> None:
+    for path in directory.glob("kangyur-catalog-*.sqlite.gz"):
+        if path.name not in keep:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+def _rebuild() -> None:
+    db = SessionLocal()
+    try:
+        manifest = build_catalog_bundle(db)
+        logger.info(f"Rebuilt catalog bundle {manifest['version']}")
+    finally:
+        db.close()
+
+# Rebuilds EXPORT_BUNDLE_REBUILD_DELAY_SECONDS after a catalog write, on a
+# background thread; writes arriving in the meantime (a bulk import, an
+# editing session) are folded into the same rebuild
+bundle_rebuild_job = DebouncedJob("catalog bundle", _rebuild, lambda: settings.EXPORT_BUNDLE_REBUILD_DELAY_SECONDS)
+
+def ensure_catalog_bundle(db: Session) -> dict:
+    """The current manifest, building the first bundle if there is none"""
+    manifest = read_manifest()
+    if manifest is None:
+        with bundle_rebuild_job.run_lock:
+            manifest = read_manifest() or build_catalog_bundle(db)
+    return manifest
+
+@on_commit(*BUNDLE_MODELS)
+def _schedule_bundle_rebuild(tables=None) -> None:
+    bundle_rebuild_job.schedule()
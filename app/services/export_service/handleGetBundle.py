@@ -0,0 +1,33 @@
+from fastapi import Request, Response
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+from app.services.export_service.catalogBundle import bundle_file, ensure_catalog_bundle, read_manifest
+from app.utils.single_flight import single_flight
+
+# Building a bundle from scratch reads the whole catalog: it runs in the
+# threadpool, once, however many requests arrive while it does
+_build_first_bundle = single_flight("catalog_bundle", timeout=300)(ensure_catalog_bundle)
+
+async def handle_get_bundle(request: Request, db: Session) -> Response:
+    """
+    Serve the current catalog bundle file, or 304 when the client's
+    If-None-Match already names it.
+    """
+    manifest = read_manifest() or await _build_first_bundle(db=db)
+    headers = {
+        "ETag": manifest["etag"],
+        "Cache-Control": "public, max-age=0, must-revalidate",
+        "X-Bundle-Version": manifest["version"],
+        "X-Change-Token": str(manifest["change_token"]),
+    }
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if manifest["etag"] in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+
+    return FileResponse(
+        bundle_file(manifest),
+        media_type="application/gzip",
+        filename=manifest["file_name"],
+        headers=headers
+    )
@@ -1,11 +1,24 @@
 from sqlalchemy.orm import Session
 from app.models import KagyurNews
 from app.schemas import NewsResponse
+from app.services.news_service.newsProjection import news_cache, published_news_select, to_news_language
+from app.utils.single_flight import single_flight
+from app.utils.compression import CachedJSONResponse
 from typing import Optional, List
 
 async def handle_get_latest_news(limit: int, lang: Optional[str], db: Session) -> list:
+    if lang:
+        body = news_cache.get_or_render(
+            ("latest", limit, lang),
+            lambda: to_news_language(db.execute(published_news_select(lang).order_by(KagyurNews.published_date.desc()).limit(limit)).all())
+        )
+        return CachedJSONResponse(body)
+    return await _load_latest_news(limit, db)
+
+@single_flight("latest_news")
+def _load_latest_news(limit: int, db: Session) -> List[NewsResponse]:
     news_list = db.query(KagyurNews).filter(
         KagyurNews.is_active == True,
         KagyurNews.publication_status == 'published'
     ).order_by(KagyurNews.published_date.desc()).limit(limit).all()
-    return news_list
\ No newline at end of file
+    return [NewsResponse.model_validate(news) for news in news_list]
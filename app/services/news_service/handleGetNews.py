@@ -1,8 +1,15 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import select, func
 from app.models import KagyurNews
+from app.services.news_service.newsProjection import news_cache, published_news_select, to_news_language, PUBLISHED_NEWS_FILTERS
+from app.utils.compression import CachedJSONResponse
 from typing import Optional
 
 async def handle_get_news(page: int, limit: int, lang: Optional[str], db: Session) -> dict:
+    if lang:
+        body = news_cache.get_or_render(("list", page, limit, lang), lambda: _build_news_page(page, limit, lang, db))
+        return CachedJSONResponse(body)
+
     offset = (page - 1) * limit
     query = db.query(KagyurNews).filter(
         KagyurNews.is_active == True,
@@ -18,4 +25,19 @@ async def handle_get_news(page: int, limit: int, lang: Optional[str], db: Sessio
             "total": total,
             "total_pages": (total + limit - 1) // limit
         }
-    }
\ No newline at end of file
+    }
+
+def _build_news_page(page: int, limit: int, lang: str, db: Session) -> dict:
+    """One page of published news with only the requested language's columns"""
+    offset = (page - 1) * limit
+    total = db.execute(select(func.count(KagyurNews.id)).where(*PUBLISHED_NEWS_FILTERS)).scalar() or 0
+    rows = db.execute(published_news_select(lang).order_by(KagyurNews.published_date.desc()).offset(offset).limit(limit)).all()
+    return {
+        "news": to_news_language(rows),
+        "pagination": {
+            "current_page": page,
+            "per_page": limit,
+            "total": total,
+            "total_pages": (total + limit - 1) // limit
+        }
+    }
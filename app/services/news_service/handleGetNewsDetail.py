@@ -1,10 +1,16 @@
 from sqlalchemy.orm import Session
 from app.models import KagyurNews
 from app.schemas import NewsResponse
+from app.services.news_service.newsProjection import news_cache, published_news_select, to_news_language
+from app.utils.compression import CachedJSONResponse
 from typing import Optional
 from fastapi import HTTPException
 
 async def handle_get_news_detail(news_id: int, lang: Optional[str], db: Session) -> NewsResponse:
+    if lang:
+        body = news_cache.get_or_render(("detail", news_id, lang), lambda: _build_news_detail(news_id, lang, db))
+        return CachedJSONResponse(body)
+
     news = db.query(KagyurNews).filter(
         KagyurNews.id == news_id,
         KagyurNews.is_active == True,
@@ -12,4 +18,10 @@ async def handle_get_news_detail(news_id: int, lang: Optional[str], db: Session)
     ).first()
     if not news:
         raise HTTPException(status_code=404, detail="News not found")
-    return news
\ No newline at end of file
+    return news
+
+def _build_news_detail(news_id: int, lang: str, db: Session):
+    rows = db.execute(published_news_select(lang).where(KagyurNews.id == news_id)).all()
+    if not rows:
+        raise HTTPException(status_code=404, detail="News not found")
+    return to_news_language(rows)[0]
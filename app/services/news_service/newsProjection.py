@@ -0,0 +1,31 @@
+from typing import Optional
+from sqlalchemy import select
+from app.models import KagyurNews
+from app.schemas import NewsLanguageResponse
+from app.utils.language_projection import localized_column
+from app.utils.response_cache import ResponseCache
+
+# Rendered per-language public news payloads, dropped whenever news is written
+news_cache = ResponseCache("news", KagyurNews)
+
+# What the public may see
+PUBLISHED_NEWS_FILTERS = (
+    KagyurNews.is_active == True,
+    KagyurNews.publication_status == 'published'
+)
+
+def published_news_select(lang: Optional[str]):
+    """Published news with title and content in one language only"""
+    return select(
+        KagyurNews.id,
+        localized_column(KagyurNews.english_title, KagyurNews.tibetan_title, lang, "title"),
+        localized_column(KagyurNews.english_content, KagyurNews.tibetan_content, lang, "content"),
+        KagyurNews.published_date,
+        KagyurNews.publication_status,
+        KagyurNews.is_active,
+        KagyurNews.created_at,
+        KagyurNews.updated_at
+    ).where(*PUBLISHED_NEWS_FILTERS)
+
+def to_news_language(rows) -> list:
+    return [NewsLanguageResponse.model_validate(dict(row._mapping)) for row in rows]
@@ -0,0 +1,306 @@
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.database import SessionLocal
+from app.models import (
+    ChangeLog, MainCategory, SubCategory, Sermon, Yana, TranslationType,
+    KagyurText, TextSummary, YesheDESpan, Volume
+)
+from app.schemas import KagyurTextResponse, SubCategoryLanguageResponse
+from app.services.category_service.getCategoriesHandler import build_category_tree
+from app.services.subcategory_service.handleGetSubcategories import handle_get_subcategories
+from app.services.sync_service.changeLogRetention import oldest_valid_token
+from app.services.sync_service.handleGetChanges import settled_change_token, settled_cutoff
+from app.services.text_service.handleFetchTexts import build_language_page
+from app.services.text_service.loadingProfiles import text_loading_options
+from app.utils.background_jobs import DebouncedJob
+from app.utils.change_hooks import on_commit
+from app.utils.fast_json import dumps
+import asyncio
+import json
+import logging
+import os
+import shutil
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+PRERENDER_LANGUAGES = ("en", "tb")
+
+# Writes to these tables can change a pre-rendered file
+PRERENDERED_MODELS = (
+    MainCategory, SubCategory, Sermon, Yana, TranslationType,
+    KagyurText, TextSummary, YesheDESpan, Volume
+)
+
+# Lookups are embedded in every text list and detail
+_LOOKUP_TABLES = {Sermon.__tablename__, Yana.__tablename__, TranslationType.__tablename__}
+_TEXT_CHILD_TABLES = {TextSummary.__tablename__, YesheDESpan.__tablename__, Volume.__tablename__}
+
+_subcategories_adapter = TypeAdapter(List[SubCategoryLanguageResponse])
+
+# Files mirror the public URLs, with ?lang= as the first path segment and text
+# lists split into PRERENDER_TEXT_PAGE_SIZE pages:
+#
+#   {lang}/categories.json                                           GET /categories/?lang=
+#   {lang}/categories/{id}/subcategories.json                        GET /categories/{id}/subcategories?lang=
+#   {lang}/categories/{id}/subcategories/{sub_id}/texts/{page}.json  GET .../texts/?lang=&page=&limit=
+#   texts/{id}.json                                                  GET /texts/{id}
+
+def _root() -> Path:
+    return Path(settings.PRERENDER_DIR)
+
+def _state_path() -> Path:
+    # Next to the served tree, not inside it
+    return Path(f"{settings.PRERENDER_DIR.rstrip('/')}.state.json")
+
+def _subcategory_dir(lang: str, category_id: int, sub_category_id: int) -> Path:
+    return _root() / lang / "categories" / str(category_id) / "subcategories" / str(sub_category_id)
+
+def _write(path: Path, body: bytes) -> bool:
+    """Atomically write ``body`` unless the file already holds it; True if written"""
+    try:
+        if path.read_bytes() == body:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(body)
+    os.replace(tmp_path, path)
+    return True
+
+def _remove(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    elif path.exists():
+        path.unlink()
+
+class CatalogPrerenderer:
+    """
+    Renders the public catalog to PRERENDER_DIR, with the exact bytes the API
+    would send, and keeps it current by replaying the change log.
+
+    ``state`` remembers the last replayed change-log token and, for each
+    rendered text, its sub-category and child rows, so deleted or moved rows
+    can still be traced to the files they appeared in.
+    """
+    def __init__(self, db: Session):
+        self.db = db
+        self.state = self._load_state()
+        self.written = 0
+
+    def _load_state(self) -> Optional[dict]:
+        try:
+            with open(_state_path()) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_state(self) -> None:
+        _write(_state_path(), json.dumps(self.state).encode())
+
+    def _put(self, path: Path, body: bytes) -> None:
+        if _write(path, body):
+            self.written += 1
+
+    # Rendering
+
+    def _render_categories(self) -> Set[int]:
+        """Category trees and sub-category lists; returns the active sub-category ids"""
+        categories = self.db.query(MainCategory.id).filter(MainCategory.is_active == True).all()
+        category_ids = {category.id for category in categories}
+        sub_category_ids = set()
+
+        for lang in PRERENDER_LANGUAGES:
+            self._put(_root() / lang / "categories.json", dumps(build_category_tree(lang, self.db)))
+            categories_dir = _root() / lang / "categories"
+            for category_id in category_ids:
+                subcategories = asyncio.run(handle_get_subcategories(category_id=category_id, lang=lang, db=self.db))
+                sub_category_ids.update(sub["id"] for sub in subcategories)
+                path = categories_dir / str(category_id) / "subcategories.json"
+                try:
+                    self._put(path, dumps(_subcategories_adapter.validate_python(subcategories)))
+                except ValidationError as e:
+                    # The API cannot serve this list either; leave no stale file behind
+                    logger.warning(f"Not pre-rendering {path}: {e.error_count()} invalid fields")
+                    _remove(path)
+            # Categories that were deleted or deactivated
+            if categories_dir.exists():
+                for path in categories_dir.iterdir():
+                    if path.is_dir() and path.name.isdigit() and int(path.name) not in category_ids:
+                        _remove(path)
+        return sub_category_ids
+
+    def _parents(self, sub_category_ids: Iterable[int]) -> Dict[int, int]:
+        return dict(self.db.query(SubCategory.id, SubCategory.main_category_id).filter(
+            SubCategory.id.in_(list(sub_category_ids))
+        ).all())
+
+    def _unrendered(self, sub_category_ids: Set[int]) -> Set[int]:
+        """Public sub-categories without list pages yet, e.g. under a re-activated category"""
+        parents = self._parents(sub_category_ids)
+        return {
+            sub_category_id for sub_category_id in sub_category_ids
+            if not (_subcategory_dir(PRERENDER_LANGUAGES[0], parents[sub_category_id], sub_category_id) / "texts").exists()
+        }
+
+    def _render_text_pages(self, sub_category_ids: Iterable[int], public_ids: Set[int]) -> None:
+        """All list pages of the given sub-categories; lists of non-public ones are removed"""
+        parents = self._parents(sub_category_ids)
+        limit = settings.PRERENDER_TEXT_PAGE_SIZE
+
+        for sub_category_id in sub_category_ids:
+            for lang in PRERENDER_LANGUAGES:
+                current_dir = _subcategory_dir(lang, parents[sub_category_id], sub_category_id) if sub_category_id in public_ids else None
+                # Lists of hidden sub-categories, and of ones moved to another category
+                for path in (_root() / lang / "categories").glob(f"*/subcategories/{sub_category_id}"):
+                    if path != current_dir:
+                        _remove(path)
+                if current_dir is None:
+                    continue
+
+                texts_dir = current_dir / "texts"
+                filters = [KagyurText.sub_category_id == sub_category_id]
+                page, total_pages = 1, 1
+                while page <= total_pages:
+                    body = build_language_page(self.db, lang, filters, page, limit)
+                    total_pages = max(body["pagination"].total_pages, 1)
+                    self._put(texts_dir / f"{page}.json", dumps(body))
+                    page += 1
+                # Pages beyond the new last page
+                if texts_dir.exists():
+                    for path in texts_dir.glob("*.json"):
+                        if path.stem.isdigit() and int(path.stem) > total_pages:
+                            path.unlink()
+
+    def _render_text_details(self, text_ids: Iterable[int]) -> Set[int]:
+        """Detail files of the given texts; returns the sub-categories they were or are in"""
+        text_ids = set(text_ids)
+        texts_dir = _root() / "texts"
+        previous = self.state["texts"]
+        affected = {previous[str(text_id)]["sub_category_id"] for text_id in text_ids if str(text_id) in previous}
+
+        texts = self.db.query(KagyurText).options(*text_loading_options("detail")).filter(
+            KagyurText.id.in_(text_ids),
+            KagyurText.is_active == True
+        ).all()
+        for text in texts:
+            self._put(texts_dir / f"{text.id}.json", dumps(KagyurTextResponse.model_validate(text)))
+            affected.add(text.sub_category_id)
+            children = [f"{YesheDESpan.__tablename__}:{span.id}" for span in text.yeshe_de_spans]
+            children += [f"{Volume.__tablename__}:{volume.id}" for span in text.yeshe_de_spans for volume in span.volumes]
+            if text.text_summary is not None:
+                children.append(f"{TextSummary.__tablename__}:{text.text_summary.id}")
+            previous[str(text.id)] = {"sub_category_id": text.sub_category_id, "children": children}
+
+        rendered = {text.id for text in texts}
+        for text_id in text_ids - rendered:
+            _remove(texts_dir / f"{text_id}.json")
+            previous.pop(str(text_id), None)
+        affected.discard(None)
+        return affected
+
+    def _owning_texts(self, table_name: str, record_ids: Set[int]) -> Set[int]:
+        """Texts whose detail shows the given summary, span or volume rows"""
+        if table_name == TextSummary.__tablename__:
+            owners = self.db.query(TextSummary.id, TextSummary.text_id).filter(TextSummary.id.in_(record_ids))
+        elif table_name == YesheDESpan.__tablename__:
+            owners = self.db.query(YesheDESpan.id, YesheDESpan.text_id).filter(YesheDESpan.id.in_(record_ids))
+        else:
+            owners = self.db.query(Volume.id, YesheDESpan.text_id).join(YesheDESpan).filter(Volume.id.in_(record_ids))
+        text_ids = {text_id for _, text_id in owners if text_id}
+
+        # Rows deleted since: look them up in what was rendered
+        wanted = {f"{table_name}:{record_id}" for record_id in record_ids}
+        for text_id, entry in self.state["texts"].items():
+            if wanted.intersection(entry["children"]):
+                text_ids.add(int(text_id))
+        return text_ids
+
+    # Entry points
+
+    def render_all(self) -> None:
+        """Render every file from scratch and drop files of removed resources"""
+        # Only settled entries: a transaction still committing below max(id) is
+        # then replayed by the next refresh instead of skipped
+        token = settled_change_token(self.db)
+        if self.state is None:
+            self.state = {"token": 0, "texts": {}}
+        public_sub_ids = self._render_categories()
+
+        # Active texts, plus everything rendered before so removed texts lose their file
+        text_ids = {row.id for row in self.db.query(KagyurText.id).filter(KagyurText.is_active == True)}
+        text_ids.update(int(text_id) for text_id in self.state["texts"])
+        text_ids.update(int(path.stem) for path in (_root() / "texts").glob("*.json") if path.stem.isdigit())
+        self._render_text_details(text_ids)
+
+        self._render_text_pages(public_sub_ids, public_sub_ids)
+        for lang in PRERENDER_LANGUAGES:
+            for path in (_root() / lang / "categories").glob("*/subcategories/*"):
+                if path.name.isdigit() and int(path.name) not in public_sub_ids:
+                    _remove(path)
+
+        self.state["token"] = token
+        self._save_state()
+
+    def refresh(self) -> None:
+        """
+        Re-render only the files affected by change-log entries since the
+        last run (everything on the first run, when a lookup changed, or when
+        the last run is older than the change log's retention).
+        """
+        if self.state is None or self.state["token"] < oldest_valid_token(self.db):
+            self.render_all()
+            return
+
+        entries = self.db.query(ChangeLog).filter(ChangeLog.id > self.state["token"]).order_by(ChangeLog.id).all()
+        if not entries:
+            return
+
+        changed: Dict[str, Set[int]] = {}
+        for entry in entries:
+            changed.setdefault(entry.table_name, set()).add(entry.record_id)
+
+        if _LOOKUP_TABLES & set(changed):
+            self.render_all()
+            return
+
+        text_ids = set(changed.get(KagyurText.__tablename__, ()))
+        for table_name in _TEXT_CHILD_TABLES & set(changed):
+            text_ids |= self._owning_texts(table_name, changed[table_name])
+
+        # Category trees and counters are small; re-render all of them on any change
+        public_sub_ids = self._render_categories()
+        sub_category_ids = self._render_text_details(text_ids) if text_ids else set()
+        sub_category_ids |= changed.get(SubCategory.__tablename__, set())
+        sub_category_ids |= self._unrendered(public_sub_ids)
+        self._render_text_pages(sub_category_ids, public_sub_ids)
+
+        # Entries this recent may still have lower-numbered siblings committing;
+        # keep them above the token so the next run sees those too
+        cutoff = settled_cutoff()
+        settled = [entry.id for entry in entries if entry.changed_at <= cutoff]
+        if settled:
+            self.state["token"] = max(settled)
+        self._save_state()
+
+def _refresh() -> None:
+    db = SessionLocal()
+    try:
+        prerenderer = CatalogPrerenderer(db)
+        prerenderer.refresh()
+        logger.info(f"Pre-rendered catalog refreshed, {prerenderer.written} files written")
+    finally:
+        db.close()
+
+# Re-renders affected files PRERENDER_REBUILD_DELAY_SECONDS after catalog writes
+prerender_job = DebouncedJob("catalog prerender", _refresh, lambda: settings.PRERENDER_REBUILD_DELAY_SECONDS)
+
+@on_commit(*PRERENDERED_MODELS)
+def _schedule_prerender(tables=None) -> None:
+    if settings.PRERENDER_ENABLED:
+        prerender_job.schedule()
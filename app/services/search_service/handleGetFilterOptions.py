@@ -0,0 +1,14 @@
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.utils.compression import CachedJSONResponse
+from app.utils.lookup_registry import get_lookup_registry
+
+async def handle_get_filter_options(lang: Optional[str], db: Session) -> CachedJSONResponse:
+    """
+    Get available filter options for search.
+    
+    Returns categories, sermons, yanas, and translation types from the
+    in-memory lookup registry as a pre-rendered, precompressed body; the
+    database is only read when the registry has been invalidated.
+    """
+    return CachedJSONResponse(get_lookup_registry(db).filter_options_json(lang))
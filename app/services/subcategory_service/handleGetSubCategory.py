@@ -46,6 +46,8 @@ async def handle_get_subcategory(
         } if subcategory.main_category else None,
         "order_index": subcategory.order_index,
         "is_active": subcategory.is_active,
+        "text_count": subcategory.text_count,
+        "audio_count": subcategory.audio_count,
         "created_at": subcategory.created_at,
         "updated_at": subcategory.updated_at
     }
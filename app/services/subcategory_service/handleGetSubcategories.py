@@ -7,7 +7,8 @@ from app.models import MainCategory, SubCategory
 async def handle_get_subcategories(
     category_id: int,
     lang: Optional[str] = Query(None, regex="^(en|tb)$", description="Language preference: en or tb"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    sort: Optional[str] = None
 ):
     """
     Retrieve all sub-categories under a specific main category.
@@ -15,6 +16,7 @@ async def handle_get_subcategories(
     Args:
         category_id: The ID of the main category
         lang: Language preference (en=English, tb=Tibetan)
+        sort: "tibetan" for traditional Tibetan order of the names; omit for display order
     
     Returns:
         List of sub-categories with their basic info
@@ -31,10 +33,11 @@ async def handle_get_subcategories(
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
     
+    order_by = (SubCategory.tibetan_sort_key, SubCategory.id) if sort == "tibetan" else (SubCategory.order_index,)
     sub_categories = db.query(SubCategory).filter(
         SubCategory.main_category_id == category_id,
         SubCategory.is_active == True
-    ).order_by(SubCategory.order_index).all()
+    ).order_by(*order_by).all()
     
     subcategories_data = [
         {
@@ -44,6 +47,8 @@ async def handle_get_subcategories(
             "main_category_id": sub.main_category_id,
             "order_index": sub.order_index,
             "is_active": sub.is_active,
+            "text_count": sub.text_count,
+            "audio_count": sub.audio_count,
             "created_at": sub.created_at,
             "updated_at": sub.updated_at
         }
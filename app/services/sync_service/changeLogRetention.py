@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import delete, exists, func
+from sqlalchemy.orm import Session, aliased
+from app.core.config import settings
+from app.database import SessionLocal
+from app.models import ChangeLog
+from app.utils.background_jobs import DebouncedJob
+from app.utils.change_hooks import on_commit
+from app.utils.change_log import SYNCED_MODELS, DELETE
+import logging
+
+logger = logging.getLogger(__name__)
+
+def retention_horizon() -> datetime:
+    """Change-log entries older than this may have been compacted away"""
+    return datetime.utcnow() - timedelta(days=settings.CHANGES_RETENTION_DAYS)
+
+def compact_change_log(db: Session, horizon: Optional[datetime] = None) -> int:
+    """
+    Shrink the change log to what a sync from before ``horizon`` could still
+    need: entries older than it are dropped when a later entry exists for the
+    same record, and old tombstones are dropped outright. What remains is at
+    most one entry per existing row plus the entries newer than the horizon.
+
+    Returns:
+        int: Number of entries deleted
+    """
+    horizon = horizon or retention_horizon()
+    newer = aliased(ChangeLog)
+    superseded = exists().where(
+        newer.table_name == ChangeLog.table_name,
+        newer.record_id == ChangeLog.record_id,
+        newer.id > ChangeLog.id
+    )
+    deleted = db.execute(delete(ChangeLog).where(ChangeLog.changed_at < horizon, superseded)).rowcount
+    deleted += db.execute(delete(ChangeLog).where(ChangeLog.changed_at < horizon, ChangeLog.action == DELETE)).rowcount
+    db.commit()
+    return deleted
+
+def oldest_valid_token(db: Session) -> int:
+    """
+    The lowest sync token ``/changes`` can still answer completely. Entries
+    before the retention horizon may have been compacted, so a client holding
+    an older token could miss a delete and has to resync from scratch.
+    """
+    # Ids follow changed_at closely enough (both are taken at flush) that the
+    # first recent entry by time is the first recent one by id
+    first_recent = db.query(ChangeLog.id).filter(
+        ChangeLog.changed_at >= retention_horizon()
+    ).order_by(ChangeLog.changed_at, ChangeLog.id).limit(1).scalar()
+    if first_recent is None:
+        return db.query(func.max(ChangeLog.id)).scalar() or 0
+    return first_recent - 1
+
+def _compact() -> None:
+    db = SessionLocal()
+    try:
+        deleted = compact_change_log(db)
+        if deleted:
+            logger.info(f"Compacted the change log, {deleted} entries deleted")
+    finally:
+        db.close()
+
+# Compacts CHANGES_COMPACT_INTERVAL_SECONDS after a catalog write; the log
+# only grows with writes, so an idle catalog needs no runs
+compaction_job = DebouncedJob("change log compaction", _compact, lambda: settings.CHANGES_COMPACT_INTERVAL_SECONDS)
+
+@on_commit(*SYNCED_MODELS.values())
+def _schedule_compaction(tables=None) -> None:
+    compaction_job.schedule()
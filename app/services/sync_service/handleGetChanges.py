@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta
+from typing import Dict, List
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models import ChangeLog, KagyurText, TextSummary, YesheDESpan, Volume
+from app.schemas import ChangeEntry, ChangesResponse
+from app.services.news_service.newsProjection import PUBLISHED_NEWS_FILTERS
+from app.services.sync_service.changeLogRetention import oldest_valid_token
+from app.services.video_service.videoProjection import PUBLISHED_VIDEO_FILTERS
+from app.utils.change_log import SYNCED_MODELS, UPSERT, DELETE
+
+_ACTIVE_TEXT_IDS = select(KagyurText.id).where(KagyurText.is_active == True)
+
+# Extra conditions a row must meet to be public; rows that fail them are sent
+# as deletes, so unpublishing or deactivating removes them from clients.
+# Tables with an is_active column must be active on top of these.
+VISIBILITY_FILTERS = {
+    "kagyur_news": PUBLISHED_NEWS_FILTERS,
+    "kangyur_video": PUBLISHED_VIDEO_FILTERS,
+    "text_summaries": (TextSummary.text_id.in_(_ACTIVE_TEXT_IDS),),
+    "yeshe_de_spans": (YesheDESpan.text_id.in_(_ACTIVE_TEXT_IDS),),
+    "volumes": (Volume.yeshe_de_span_id.in_(
+        select(YesheDESpan.id).where(YesheDESpan.text_id.in_(_ACTIVE_TEXT_IDS))
+    ),),
+}
+
+def public_row_filters(model) -> list:
+    """WHERE clauses selecting the rows of ``model`` the public may see"""
+    filters = list(VISIBILITY_FILTERS.get(model.__tablename__, ()))
+    if "is_active" in model.__table__.columns:
+        filters.append(model.is_active == True)
+    return filters
+
+def _visible_rows(db: Session, table_name: str, record_ids: List[int]) -> Dict[int, dict]:
+    """Current column values of the public rows among ``record_ids``"""
+    model = SYNCED_MODELS[table_name]
+    filters = [model.id.in_(record_ids), *public_row_filters(model)]
+    columns = list(model.__table__.columns)
+    return {row.id: _json_record(row._mapping) for row in db.execute(select(*columns).where(*filters))}
+
+def _json_record(mapping) -> dict:
+    # Binary sort keys go out as lowercase hex, which compares in the same order as the bytes
+    return {key: value.hex() if isinstance(value, bytes) else value for key, value in mapping.items()}
+
+def settled_cutoff() -> datetime:
+    """
+    Change-log entries at or before this time can no longer be preceded by a
+    later commit. ``changed_at`` is stamped by the writing app server's clock,
+    so this holds while the servers' clocks agree to well within
+    CHANGES_SETTLE_SECONDS.
+    """
+    return datetime.utcnow() - timedelta(seconds=settings.CHANGES_SETTLE_SECONDS)
+
+def settled_change_token(db: Session) -> int:
+    """
+    The highest token every change up to which has committed: what a
+    snapshot (export bundle, pre-rendered files) may tell clients to resume
+    ``/changes`` from. Newer entries may still be overtaken by a slower
+    transaction with a lower id, so they are left above the token and
+    replayed (idempotently) instead.
+    """
+    return db.query(func.max(ChangeLog.id)).filter(ChangeLog.changed_at <= settled_cutoff()).scalar() or 0
+
+async def handle_get_changes(since: int, limit: int, db: Session) -> ChangesResponse:
+    """
+    Catalog changes after the sync token ``since`` (0 for everything).
+
+    Reads up to ``limit`` change-log entries and keeps only the latest one per
+    record, so a text edited ten times is sent once. Upserts carry the current
+    record; records deleted, deactivated or unpublished since are sent as
+    deletes. Clients drop a text's summary, spans and volumes with the text.
+
+    Entries newer than CHANGES_SETTLE_SECONDS are not returned yet: ids are
+    assigned before commit, so a slow transaction could otherwise commit an
+    entry below a token a client has already moved past.
+
+    Tokens older than CHANGES_RETENTION_DAYS get 410 Gone: the entries after
+    them may have been compacted, so the client must resync from 0 (or a
+    fresh bundle).
+
+    Returns:
+        ChangesResponse with ``next_token`` to pass as ``since`` next time
+    """
+    if since and since < oldest_valid_token(db):
+        raise HTTPException(status_code=410, detail="Sync token expired, resync required")
+
+    entries = db.query(ChangeLog).filter(
+        ChangeLog.id > since,
+        ChangeLog.changed_at <= settled_cutoff()
+    ).order_by(ChangeLog.id).limit(limit + 1).all()
+
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+    next_token = entries[-1].id if entries else since
+
+    # Latest entry per record, in change order
+    latest: Dict[tuple, ChangeLog] = {}
+    for entry in entries:
+        key = (entry.table_name, entry.record_id)
+        latest.pop(key, None)
+        latest[key] = entry
+
+    upserts: Dict[str, List[int]] = {}
+    for entry in latest.values():
+        if entry.action == UPSERT:
+            upserts.setdefault(entry.table_name, []).append(entry.record_id)
+    rows = {
+        table_name: _visible_rows(db, table_name, record_ids)
+        for table_name, record_ids in upserts.items()
+    }
+
+    changes = []
+    for (table_name, record_id), entry in latest.items():
+        data = rows.get(table_name, {}).get(record_id) if entry.action == UPSERT else None
+        changes.append(ChangeEntry(
+            table=table_name,
+            id=record_id,
+            action=UPSERT if data is not None else DELETE,
+            token=entry.id,
+            data=data
+        ))
+
+    return ChangesResponse(changes=changes, next_token=next_token, has_more=has_more)
@@ -1,11 +1,13 @@
 from fastapi import HTTPException, UploadFile
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from app.models import KagyurText, SubCategory, TextSummary, YesheDESpan, Volume, Yana, Sermon, TranslationType, User
+from app.models import KagyurText, SubCategory, TextSummary, YesheDESpan, Volume, User
 from app.schemas import KagyurTextCreateRequest, TextSummaryCreate, YesheDESpanCreate, VolumeCreate
 import csv
 import json
 from io import StringIO
+from app.utils.counters import adjust_counters
+from app.utils.lookup_registry import get_lookup_registry
 import logging
 
 # Set up logging
@@ -275,32 +277,26 @@ def _create_single_text(
                     detail=f"Sub-category {sub_category_id} not found"
                 )
         
-        # Step 2: Validate foreign keys
-        if text_data.sermon_id:
-            sermon = db.query(Sermon).filter(Sermon.id == text_data.sermon_id).first()
-            if not sermon:
-                raise HTTPException(
-                    status_code=404, 
-                    detail=f"Sermon with ID {text_data.sermon_id} not found"
-                )
+        # Step 2: Validate foreign keys against the in-memory lookup registry
+        lookups = get_lookup_registry(db)
         
-        if text_data.yana_id:
-            yana = db.query(Yana).filter(Yana.id == text_data.yana_id).first()
-            if not yana:
-                raise HTTPException(
-                    status_code=404, 
-                    detail=f"Yana with ID {text_data.yana_id} not found"
-                )
+        if text_data.sermon_id and not lookups.exists("sermon", text_data.sermon_id, db):
+            raise HTTPException(
+                status_code=404, 
+                detail=f"Sermon with ID {text_data.sermon_id} not found"
+            )
         
-        if text_data.translation_type_id:
-            translation_type = db.query(TranslationType).filter(
-                TranslationType.id == text_data.translation_type_id
-            ).first()
-            if not translation_type:
-                raise HTTPException(
-                    status_code=404, 
-                    detail=f"Translation type with ID {text_data.translation_type_id} not found"
-                )
+        if text_data.yana_id and not lookups.exists("yana", text_data.yana_id, db):
+            raise HTTPException(
+                status_code=404, 
+                detail=f"Yana with ID {text_data.yana_id} not found"
+            )
+        
+        if text_data.translation_type_id and not lookups.exists("translation_type", text_data.translation_type_id, db):
+            raise HTTPException(
+                status_code=404, 
+                detail=f"Translation type with ID {text_data.translation_type_id} not found"
+            )
         
         # Step 3: Create main text
         text_dict = text_data.dict(exclude={'text_summary', 'yeshe_de_spans'})
@@ -310,6 +306,9 @@ def _create_single_text(
         db.add(new_text)
         db.flush()
         
+        if new_text.is_active:
+            adjust_counters(db, sub_category_id, text_delta=1)
+        
         # Step 4: Create text summary if provided
         if text_data.text_summary:
             summary_dict = text_data.text_summary.dict()
@@ -1,9 +1,11 @@
 from fastapi import Depends, HTTPException
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.models import KagyurText, SubCategory, TextSummary, YesheDESpan, Volume, Yana, Sermon, TranslationType,User
+from app.models import KagyurText, SubCategory, TextSummary, YesheDESpan, Volume, User
 from app.schemas import KagyurTextCreateRequest
 from sqlalchemy.exc import IntegrityError
+from app.utils.counters import adjust_counters
+from app.utils.lookup_registry import get_lookup_registry
 import logging
 
 # Set up logging
@@ -35,40 +37,31 @@ def handle_create_text(
             )
         logger.debug(f"Sub-category found: {sub_category.id}")
         
-        # Step 2: Validate foreign keys
+        # Step 2: Validate foreign keys against the in-memory lookup registry
         logger.debug("Step 2 - Validating foreign keys")
+        lookups = get_lookup_registry(db)
         
         # Validate sermon_id if provided
-        if text_data.sermon_id:
-            sermon = db.query(Sermon).filter(Sermon.id == text_data.sermon_id).first()
-            if not sermon:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"Invalid sermon_id: {text_data.sermon_id}"
-                )
-            logger.debug(f"Sermon validation passed: {sermon.id}")
+        if text_data.sermon_id and not lookups.exists("sermon", text_data.sermon_id, db):
+            raise HTTPException(
+                status_code=400, 
+                detail=f"Invalid sermon_id: {text_data.sermon_id}"
+            )
         
         # Validate yana_id if provided
-        if text_data.yana_id:
-            yana = db.query(Yana).filter(Yana.id == text_data.yana_id).first()
-            if not yana:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"Invalid yana_id: {text_data.yana_id}"
-                )
-            logger.debug(f"Yana validation passed: {yana.id}")
+        if text_data.yana_id and not lookups.exists("yana", text_data.yana_id, db):
+            raise HTTPException(
+                status_code=400, 
+                detail=f"Invalid yana_id: {text_data.yana_id}"
+            )
         
         # Validate translation_type_id if provided
-        if text_data.translation_type_id:
-            translation_type = db.query(TranslationType).filter(
-                TranslationType.id == text_data.translation_type_id
-            ).first()
-            if not translation_type:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"Invalid translation_type_id: {text_data.translation_type_id}"
-                )
-            logger.debug(f"Translation type validation passed: {translation_type.id}")
+        if text_data.translation_type_id and not lookups.exists("translation_type", text_data.translation_type_id, db):
+            raise HTTPException(
+                status_code=400, 
+                detail=f"Invalid translation_type_id: {text_data.translation_type_id}"
+            )
+        logger.debug("Foreign key validation passed")
         
         # Step 3: Create main text
         logger.debug("Step 3 - Creating main text")
@@ -84,6 +77,9 @@ def handle_create_text(
         db.flush()
         logger.debug(f"Text flushed successfully, ID: {new_text.id}")
         
+        if new_text.is_active:
+            adjust_counters(db, sub_category_id, text_delta=1)
+        
         # Step 4: Create text summary if provided
         if text_data.text_summary:
             logger.debug(f"Creating summary for text_id: {new_text.id}")
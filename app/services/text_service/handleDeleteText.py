@@ -1,6 +1,7 @@
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 from app.models import KagyurText, User
+from app.utils.counters import adjust_counters, count_active_audio
 
 async def handle_delete_text(
     text_id: int,
@@ -17,6 +18,14 @@ async def handle_delete_text(
             detail="Text not found"
         )
     
+    # Release its share of the category counters (audio is cascade-deleted)
+    adjust_counters(
+        db,
+        db_text.sub_category_id,
+        text_delta=-1 if db_text.is_active else 0,
+        audio_delta=-count_active_audio(db, db_text.id)
+    )
+    
     # Delete the text
     db.delete(db_text)
     db.commit()
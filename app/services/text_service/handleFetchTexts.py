@@ -1,9 +1,16 @@
 # text_service.py
 from typing import Optional
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 from sqlalchemy import or_
 from app.models import KagyurText, SubCategory
-from app.schemas import TextsListResponse, KagyurTextResponse, PaginationResponse
+from app.schemas import TextsListResponse, KagyurTextListItem, KagyurTextResponse, PaginationResponse
+from app.services.text_service.textListProjection import (
+    fetch_text_list_page, fetch_text_list_selection, fetch_text_list_language, text_list_cache,
+    INCLUDABLE_RELATIONS, TEXT_SORT_ORDERS
+)
+from app.utils.compression import CachedJSONResponse
+from app.utils.fast_json import FastJSONResponse
+from app.utils.field_selection import parse_field_selection
 
 async def handle_fetch_texts(
         db: Session,
@@ -11,7 +18,11 @@ async def handle_fetch_texts(
         limit: int = 20,
         category_id: Optional[int] = None,
         sub_category_id: Optional[int] = None,
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        lang: Optional[str] = None,
+        fields: Optional[str] = None,
+        include: Optional[str] = None,
+        sort: Optional[str] = None
     ) -> TextsListResponse:
         """
         Get all texts with pagination and filters
@@ -23,51 +34,85 @@ async def handle_fetch_texts(
             category_id: Filter by category ID
             sub_category_id: Filter by sub-category ID
             search: Search in titles
+            lang: Language preference (en=English, tb=Tibetan); omit for both languages
+            fields: Comma-separated fields to return (optional)
+            include: Comma-separated relationships to embed: text_summary, yeshe_de_spans (optional)
+            sort: "tibetan" for traditional Tibetan order of the title; omit for display order
             
         Returns:
             TextsListResponse with paginated texts and metadata
         """
         
-        # Build base query with eager loading
-        query = db.query(KagyurText).options(
-            joinedload(KagyurText.sub_category),
-            joinedload(KagyurText.text_summary),
-            joinedload(KagyurText.sermon),
-            joinedload(KagyurText.yana),
-            joinedload(KagyurText.translation_type)
+        # Validate ?fields= / ?include= before touching the database
+        selection = parse_field_selection(
+            KagyurTextResponse, fields, include,
+            default=KagyurTextListItem.model_fields, includable=INCLUDABLE_RELATIONS
         )
         
+        # Listing rows are a column projection; summaries are only loaded on detail
+        filters = []
+        joins = []
+        order_by = TEXT_SORT_ORDERS[sort]
+        
         # Apply filters
         if sub_category_id:
-            query = query.filter(KagyurText.sub_category_id == sub_category_id)
+            filters.append(KagyurText.sub_category_id == sub_category_id)
         elif category_id:
-            query = query.join(SubCategory).filter(SubCategory.main_category_id == category_id)
+            joins.append(SubCategory)
+            filters.append(SubCategory.main_category_id == category_id)
         
         if search:
             search_filter = or_(
                 KagyurText.english_title.ilike(f"%{search}%"),
                 KagyurText.tibetan_title.ilike(f"%{search}%")
             )
-            query = query.filter(search_filter)
+            filters.append(search_filter)
+        
+        # One language only: rendered once per page and language, ignored when ?fields= is given
+        if lang and selection is None:
+            body = text_list_cache.get_or_render(
+                ("list", category_id, sub_category_id, search, page, limit, lang, sort),
+                lambda: build_language_page(db, lang, filters, page, limit, joins, order_by)
+            )
+            return CachedJSONResponse(body)
         
-        # Get total count
-        total_count = query.count()
+        # Get the page and total count, shaped to the selection if one was given
+        if selection is not None:
+            texts, total_count = fetch_text_list_selection(
+                db, selection, filters=filters, page=page, limit=limit, joins=joins, order_by=order_by
+            )
+        else:
+            texts, total_count = fetch_text_list_page(
+                db, filters=filters, page=page, limit=limit, joins=joins, order_by=order_by
+            )
         
-        # Apply pagination
-        offset = (page - 1) * limit
-        texts = query.order_by(KagyurText.order_index).offset(offset).limit(limit).all()
+        pagination = build_pagination(page, limit, total_count)
         
-        # Calculate pagination info
-        total_pages = (total_count + limit - 1) // limit
+        if selection is not None:
+            return FastJSONResponse({"texts": texts, "pagination": pagination})
         
         return TextsListResponse(
-            texts=[KagyurTextResponse.from_orm(text) for text in texts],
-            pagination=PaginationResponse(
-                current_page=page,
-                total_pages=total_pages,
-                total_items=total_count,
-                items_per_page=limit,
-                has_next=page < total_pages,
-                has_prev=page > 1
-            )
-        )
\ No newline at end of file
+            texts=[KagyurTextListItem.model_validate(text) for text in texts],
+            pagination=pagination
+        )
+
+def build_language_page(
+    db: Session, lang: str, filters: list, page: int, limit: int, joins: list = (), order_by: tuple = ()
+) -> dict:
+    """One page of texts in one language, shaped like the TextsListResponse body (uncached)"""
+    texts, total_count = fetch_text_list_language(
+        db, lang, filters=filters, page=page, limit=limit, joins=joins, order_by=order_by
+    )
+    return {"texts": texts, "pagination": build_pagination(page, limit, total_count)}
+
+def build_pagination(page: int, limit: int, total_count: int) -> PaginationResponse:
+    """Pagination info for a page of a list with ``total_count`` items"""
+    total_pages = (total_count + limit - 1) // limit
+    return PaginationResponse(
+        current_page=page,
+        total_pages=total_pages,
+        total_items=total_count,
+        items_per_page=limit,
+        has_next=page < total_pages,
+        has_prev=page > 1
+    )
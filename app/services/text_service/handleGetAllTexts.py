@@ -1,16 +1,22 @@
 from fastapi import Depends
 from typing import Optional
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 from sqlalchemy import or_
 from app.models import KagyurText, User
-from app.schemas import TextsListResponse, KagyurTextResponse, PaginationResponse
+from app.schemas import TextsListResponse, KagyurTextListItem, KagyurTextResponse, PaginationResponse
+from app.services.text_service.textListProjection import fetch_text_list_page, fetch_text_list_selection, INCLUDABLE_RELATIONS, TEXT_SORT_ORDERS
+from app.utils.fast_json import FastJSONResponse
+from app.utils.field_selection import parse_field_selection
 
 async def handle_get_all_texts(
         admin_user: User,  # Admin user passed from router
         db: Session,
         page: int = 1,
         limit: int = 20,
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        fields: Optional[str] = None,
+        include: Optional[str] = None,
+        sort: Optional[str] = None
     ) -> TextsListResponse:
         """
         Get all texts without category filtering - just pagination and search
@@ -20,46 +26,57 @@ async def handle_get_all_texts(
             page: Page number (default: 1)
             limit: Items per page (default: 20)
             search: Search in titles (optional)
+            fields: Comma-separated fields to return (optional)
+            include: Comma-separated relationships to embed: text_summary, yeshe_de_spans (optional)
+            sort: "tibetan" for traditional Tibetan order of the title; omit for display order
             
         Returns:
             TextsListResponse with all texts (paginated)
         """
         
-        # Build base query with eager loading
-        query = db.query(KagyurText).options(
-            joinedload(KagyurText.sub_category),
-            joinedload(KagyurText.text_summary),
-            joinedload(KagyurText.sermon),
-            joinedload(KagyurText.yana),
-            joinedload(KagyurText.translation_type)
+        # Validate ?fields= / ?include= before touching the database
+        selection = parse_field_selection(
+            KagyurTextResponse, fields, include,
+            default=KagyurTextListItem.model_fields, includable=INCLUDABLE_RELATIONS
         )
         
+        # Listing rows are a column projection; summaries are only loaded on detail
+        filters = []
+        
         # Apply search filter if provided
         if search:
             search_filter = or_(
                 KagyurText.english_title.ilike(f"%{search}%"),
                 KagyurText.tibetan_title.ilike(f"%{search}%")
             )
-            query = query.filter(search_filter)
-        
-        # Get total count
-        total_count = query.count()
+            filters.append(search_filter)
         
-        # Apply pagination
-        offset = (page - 1) * limit
-        texts = query.order_by(KagyurText.order_index).offset(offset).limit(limit).all()
+        # Get the page and total count, shaped to the selection if one was given
+        if selection is not None:
+            texts, total_count = fetch_text_list_selection(
+                db, selection, filters=filters, page=page, limit=limit, order_by=TEXT_SORT_ORDERS[sort]
+            )
+        else:
+            texts, total_count = fetch_text_list_page(
+                db, filters=filters, page=page, limit=limit, order_by=TEXT_SORT_ORDERS[sort]
+            )
         
         # Calculate pagination info
         total_pages = (total_count + limit - 1) // limit
         
+        pagination = PaginationResponse(
+            current_page=page,
+            total_pages=total_pages,
+            total_items=total_count,
+            items_per_page=limit,
+            has_next=page < total_pages,
+            has_prev=page > 1
+        )
+        
+        if selection is not None:
+            return FastJSONResponse({"texts": texts, "pagination": pagination})
+        
         return TextsListResponse(
-            texts=[KagyurTextResponse.from_orm(text) for text in texts],
-            pagination=PaginationResponse(
-                current_page=page,
-                total_pages=total_pages,
-                total_items=total_count,
-                items_per_page=limit,
-                has_next=page < total_pages,
-                has_prev=page > 1
-            )
+            texts=[KagyurTextListItem.model_validate(text) for text in texts],
+            pagination=pagination
         )
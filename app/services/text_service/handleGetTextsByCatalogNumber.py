@@ -0,0 +1,95 @@
+from collections import namedtuple
+from typing import Optional
+from fastapi import HTTPException
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from app.models import KagyurText
+from app.schemas import TextsListResponse, KagyurTextListItem
+from app.services.text_service.handleFetchTexts import build_pagination
+from app.services.text_service.loadingProfiles import text_loading_options
+from app.services.text_service.textListProjection import fetch_text_list_page
+from app.utils.catalog_numbers import CatalogNumber, parse_catalog_number
+
+CatalogKey = namedtuple("CatalogKey", ["number", "suffix", "end"])
+
+# Catalog name -> its normalized key columns on KagyurText
+CATALOG_KEYS = {
+    "derge": CatalogKey(KagyurText.derge_no, KagyurText.derge_suffix, KagyurText.derge_end_no),
+    "yeshe_de": CatalogKey(KagyurText.yeshe_de_no, KagyurText.yeshe_de_suffix, KagyurText.yeshe_de_end_no),
+}
+
+def _parse(value: str) -> CatalogNumber:
+    parsed = parse_catalog_number(value)
+    if parsed is None:
+        raise HTTPException(status_code=400, detail=f"Invalid catalog number: {value}")
+    return parsed
+
+async def handle_get_text_by_catalog_number(catalog: str, value: str, db: Session) -> KagyurText:
+    """
+    Find the active text with a Derge or Yeshe De number.
+
+    An exact match on the normalized key wins (D340a, D1-3). Otherwise a
+    text whose range covers the number is returned (D1 and D2 find D1-3).
+
+    Raises:
+        HTTPException: 400 for an unparsable number, 404 if no text has it
+    """
+    key = CATALOG_KEYS[catalog]
+    parsed = _parse(value)
+    query = db.query(KagyurText).options(*text_loading_options("detail")).filter(KagyurText.is_active == True)
+
+    text = query.filter(
+        key.number == parsed.number,
+        key.suffix == parsed.suffix,
+        key.end.is_(None) if parsed.end is None else key.end == parsed.end
+    ).order_by(KagyurText.order_index, KagyurText.id).first()
+
+    if text is None and parsed.end is None and not parsed.suffix:
+        # A range's own first number counts too: D1 finds D1-3 when there is no plain D1
+        text = query.filter(
+            key.end.isnot(None),
+            key.number <= parsed.number,
+            key.end >= parsed.number
+        ).order_by(key.number.desc(), KagyurText.id).first()
+
+    if text is None:
+        raise HTTPException(status_code=404, detail="Text not found")
+    return text
+
+async def handle_get_texts_by_catalog_range(
+    catalog: str,
+    start: str,
+    end: Optional[str],
+    db: Session,
+    page: int = 1,
+    limit: int = 20
+) -> TextsListResponse:
+    """
+    Active texts from one catalog number to another (inclusive), in natural
+    catalog order: D100 < D100a < D101. An end without a suffix includes all
+    of its lettered texts (D100-D200 includes D200a).
+
+    The bounds are expressed on the indexed (number, suffix) key, so the
+    database answers with an index range scan.
+    """
+    key = CATALOG_KEYS[catalog]
+    low = _parse(start)
+    high = _parse(end) if end else CatalogNumber(low.end or low.number, "", None)
+    if high.number < low.number or (high.number == low.number and high.suffix and high.suffix < low.suffix):
+        raise HTTPException(status_code=400, detail="Range end is before its start")
+
+    filters = [
+        KagyurText.is_active == True,
+        key.number.between(low.number, high.number),
+        or_(key.number > low.number, key.suffix >= low.suffix)
+    ]
+    if high.suffix:
+        filters.append(or_(key.number < high.number, key.suffix <= high.suffix))
+
+    texts, total_count = fetch_text_list_page(
+        db, filters=filters, page=page, limit=limit, order_by=(key.number, key.suffix, KagyurText.id)
+    )
+    return TextsListResponse(
+        texts=[KagyurTextListItem.model_validate(text) for text in texts],
+        pagination=build_pagination(page, limit, total_count)
+    )
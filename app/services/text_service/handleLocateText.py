@@ -0,0 +1,56 @@
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+from app.models import KagyurText, Volume
+from app.schemas import KagyurTextListItem, LocatedTextResponse, LocateResponse
+from app.services.text_service.textListProjection import fetch_text_list_page
+from app.utils.folio_index import get_folio_index
+from app.utils.folios import parse_folio
+
+async def handle_locate_text(volume: int, page: str, db: Session) -> LocateResponse:
+    """
+    Find the texts whose Yeshe De volume ranges cover a folio.
+
+    Args:
+        volume: Volume number
+        page: Folio such as "12a" or "12b"; "12" matches either side
+
+    Returns:
+        LocateResponse with the covering texts in folio order (several when
+        ranges meet on the same folio)
+
+    Raises:
+        HTTPException: 400 if ``page`` is not a folio reference
+    """
+    parsed = parse_folio(page)
+    if parsed is None:
+        raise HTTPException(status_code=400, detail="Invalid page: expected a folio such as 12a or 12b")
+    folio, side = parsed
+    start = folio * 2 + (side or 0)
+    end = folio * 2 + (side if side is not None else 1)
+
+    ranges = get_folio_index(db).locate(volume, start, end)
+    if not ranges:
+        return LocateResponse(volume=volume, page=page, texts=[])
+
+    # The index may be older than a deactivation made through another worker
+    text_ids = {r.text_id for r in ranges}
+    texts, _ = fetch_text_list_page(db, filters=[KagyurText.id.in_(text_ids)], limit=len(text_ids), active_only=True)
+    texts_by_id = {text.id: text for text in texts}
+    volumes = {
+        row.id: row for row in db.query(
+            Volume.id, Volume.volume_number, Volume.start_page, Volume.end_page
+        ).filter(Volume.id.in_([r.volume_id for r in ranges]))
+    }
+
+    located = []
+    for r in ranges:
+        text, row = texts_by_id.get(r.text_id), volumes.get(r.volume_id)
+        if text is None or row is None:
+            continue  # Removed or deactivated since the index was built
+        located.append(LocatedTextResponse(
+            text=KagyurTextListItem.model_validate(text),
+            volume_number=row.volume_number,
+            start_page=row.start_page,
+            end_page=row.end_page
+        ))
+    return LocateResponse(volume=volume, page=page, texts=located)
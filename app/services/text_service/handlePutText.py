@@ -1,9 +1,12 @@
 from fastapi import  Depends, HTTPException
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.models import KagyurText, SubCategory, TextSummary, YesheDESpan, Volume,Yana,Sermon, TranslationType,User
+from app.models import KagyurText, SubCategory, TextSummary, YesheDESpan, Volume, User
 from app.schemas import  KagyurTextUpdate
 from sqlalchemy.exc import IntegrityError
+from app.utils.counters import adjust_counters, count_active_audio
+from app.utils.lookup_registry import get_lookup_registry
+from app.services.text_service.loadingProfiles import text_loading_options
 
 async def handle_put_text(
     text_id: int,
@@ -19,7 +22,9 @@ async def handle_put_text(
     try:
         # Step 1: Check if text exists
         print("DEBUG: Step 1 - Checking if text exists")
-        db_text = db.query(KagyurText).filter(KagyurText.id == text_id).first()
+        db_text = db.query(KagyurText).options(
+            *text_loading_options("admin_edit")
+        ).filter(KagyurText.id == text_id).first()
         if not db_text:
             raise HTTPException(status_code=404, detail=f"Text with ID {text_id} not found")
         print(f"DEBUG: Text found: {db_text.id}")
@@ -38,51 +43,57 @@ async def handle_put_text(
                 )
             print(f"DEBUG: Sub-category validation passed: {sub_category.id}")
         
+        # Lookup ids are checked against the in-memory registry
+        lookups = get_lookup_registry(db)
+        
         # Validate sermon_id if provided
         sermon_id = getattr(text_data, 'sermon_id', None)
-        if sermon_id is not None:
-            sermon = db.query(Sermon).filter(Sermon.id == sermon_id).first()
-            if not sermon:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"Invalid sermon_id: {sermon_id}"
-                )
-            print(f"DEBUG: Sermon validation passed: {sermon.id}")
+        if sermon_id is not None and not lookups.exists("sermon", sermon_id, db):
+            raise HTTPException(
+                status_code=400, 
+                detail=f"Invalid sermon_id: {sermon_id}"
+            )
         
         # Validate yana_id if provided
         yana_id = getattr(text_data, 'yana_id', None)
-        if yana_id is not None:
-            yana = db.query(Yana).filter(Yana.id == yana_id).first()
-            if not yana:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"Invalid yana_id: {yana_id}"
-                )
-            print(f"DEBUG: Yana validation passed: {yana.id}")
+        if yana_id is not None and not lookups.exists("yana", yana_id, db):
+            raise HTTPException(
+                status_code=400, 
+                detail=f"Invalid yana_id: {yana_id}"
+            )
         
         # Validate translation_type_id if provided
         translation_type_id = getattr(text_data, 'translation_type_id', None)
-        if translation_type_id is not None:
-            translation_type = db.query(TranslationType).filter(
-                TranslationType.id == translation_type_id
-            ).first()
-            if not translation_type:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"Invalid translation_type_id: {translation_type_id}"
-                )
-            print(f"DEBUG: Translation type validation passed: {translation_type.id}")
+        if translation_type_id is not None and not lookups.exists("translation_type", translation_type_id, db):
+            raise HTTPException(
+                status_code=400, 
+                detail=f"Invalid translation_type_id: {translation_type_id}"
+            )
+        print("DEBUG: Lookup validation passed")
         
         # Step 3: Update main text fields
         print("DEBUG: Step 3 - Updating main text fields")
         text_dict = text_data.dict(exclude={'text_summary', 'yeshe_de_spans'}, exclude_unset=True)
         print(f"DEBUG: Text update dict: {text_dict}")
         
+        old_sub_category_id = db_text.sub_category_id
+        old_is_active = bool(db_text.is_active)
+        
         for field, value in text_dict.items():
             if hasattr(db_text, field):
                 setattr(db_text, field, value)
                 print(f"DEBUG: Updated field {field} to {value}")
         
+        # Keep category counters in step with a move or (de)activation
+        new_sub_category_id = db_text.sub_category_id
+        new_is_active = bool(db_text.is_active)
+        if new_sub_category_id != old_sub_category_id:
+            audio_count = count_active_audio(db, text_id)
+            adjust_counters(db, old_sub_category_id, text_delta=-int(old_is_active), audio_delta=-audio_count)
+            adjust_counters(db, new_sub_category_id, text_delta=int(new_is_active), audio_delta=audio_count)
+        elif new_is_active != old_is_active:
+            adjust_counters(db, new_sub_category_id, text_delta=1 if new_is_active else -1)
+        
         # Flush to save main text updates
         db.flush()
         print(f"DEBUG: Main text updates flushed successfully")
@@ -0,0 +1,68 @@
+from sqlalchemy.orm import joinedload, selectinload, raiseload, load_only
+from app.models import KagyurText, TextSummary, YesheDESpan
+from app.utils.field_selection import FieldSelection
+
+# Named relationship-loading strategies for KagyurText queries.
+#
+# Many-to-one lookups (sermon, yana, translation_type, sub_category) are
+# joined: they add columns but never multiply rows. Collections and the wide
+# one-to-one summary are loaded with selectinload, one extra query each, so
+# spans x volumes never produce a cartesian row set that repeats every text
+# and summary column. Everything not listed raises on access instead of
+# silently lazy-loading per row.
+#
+# Listings do not load ORM objects at all; see textListProjection.
+TEXT_LOADING_PROFILES = {
+    # Public text detail: everything KagyurTextResponse renders
+    "detail": (
+        joinedload(KagyurText.sermon),
+        joinedload(KagyurText.yana),
+        joinedload(KagyurText.translation_type),
+        selectinload(KagyurText.text_summary),
+        selectinload(KagyurText.yeshe_de_spans).selectinload(YesheDESpan.volumes),
+        raiseload("*"),
+    ),
+    # Admin edit/update: the detail shape plus the owning sub-category
+    "admin_edit": (
+        joinedload(KagyurText.sermon),
+        joinedload(KagyurText.yana),
+        joinedload(KagyurText.translation_type),
+        joinedload(KagyurText.sub_category),
+        selectinload(KagyurText.text_summary),
+        selectinload(KagyurText.yeshe_de_spans).selectinload(YesheDESpan.volumes),
+        raiseload("*"),
+    ),
+}
+
+def text_loading_options(profile: str) -> tuple:
+    """
+    Loader options for a named profile, for use with ``query.options(*...)``.
+
+    Args:
+        profile: One of "detail", "admin_edit"
+    """
+    try:
+        return TEXT_LOADING_PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown text loading profile: {profile}")
+
+def text_selection_options(selection: FieldSelection) -> tuple:
+    """
+    Loader options for a ``?fields=`` selection: only the requested text
+    columns, and only the requested relationships (summary narrowed to its
+    requested columns). Everything else raises.
+    """
+    options = [load_only(*selection.columns(KagyurText))]
+    for name in ("sermon", "yana", "translation_type"):
+        if name in selection:
+            options.append(joinedload(getattr(KagyurText, name)))
+    if "text_summary" in selection:
+        loader = selectinload(KagyurText.text_summary)
+        subtree = selection.subtree("text_summary")
+        if subtree is not None:
+            loader = loader.load_only(*selection.columns(TextSummary, subtree))
+        options.append(loader)
+    if "yeshe_de_spans" in selection:
+        options.append(selectinload(KagyurText.yeshe_de_spans).selectinload(YesheDESpan.volumes))
+    options.append(raiseload("*"))
+    return tuple(options)
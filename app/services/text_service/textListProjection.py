@@ -0,0 +1,200 @@
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy.orm import Session, selectinload, load_only
+from sqlalchemy import select, func
+from app.models import KagyurText, TextSummary, YesheDESpan, Sermon, Yana, TranslationType
+from app.schemas import KagyurTextLanguageListItem
+from app.utils.field_selection import FieldSelection
+from app.utils.language_projection import localized_column
+from app.utils.lookup_registry import get_lookup_registry
+from app.utils.response_cache import ResponseCache
+
+# Columns a listing row needs; the summary and Yeshe De spans are detail-only
+TEXT_LIST_COLUMNS = (
+    KagyurText.id,
+    KagyurText.sub_category_id,
+    KagyurText.derge_id,
+    KagyurText.yeshe_de_id,
+    KagyurText.tibetan_title,
+    KagyurText.chinese_title,
+    KagyurText.sanskrit_title,
+    KagyurText.english_title,
+    KagyurText.sermon_id,
+    KagyurText.yana_id,
+    KagyurText.translation_type_id,
+    KagyurText.order_index,
+    KagyurText.is_active,
+    KagyurText.created_at,
+    KagyurText.updated_at,
+)
+
+# Lookup relationships attached from the registry: field -> (registry kind, foreign key column)
+LOOKUP_RELATIONS = {
+    "sermon": ("sermon", KagyurText.sermon_id),
+    "yana": ("yana", KagyurText.yana_id),
+    "translation_type": ("translation_type", KagyurText.translation_type_id),
+}
+
+# ?sort= values of the text listings -> ORDER BY columns (None: display order)
+TEXT_SORT_ORDERS = {
+    None: (KagyurText.order_index, KagyurText.id),
+    "tibetan": (KagyurText.tibetan_sort_key, KagyurText.id),
+}
+
+# Detail-only relationships a listing can embed with ?include=
+INCLUDABLE_RELATIONS = ("text_summary", "yeshe_de_spans")
+
+# Rendered per-language public text listings, dropped whenever texts or their lookups are written
+text_list_cache = ResponseCache("texts", KagyurText, Sermon, Yana, TranslationType)
+
+class TextListRow:
+    """
+    One listing row read straight from a Core select, outside the ORM identity
+    map. ``sermon``, ``yana`` and ``translation_type`` are filled from the
+    in-memory lookup registry instead of joins.
+    """
+    __slots__ = tuple(column.key for column in TEXT_LIST_COLUMNS) + ("sermon", "yana", "translation_type")
+
+    def __init__(self, row, lookups):
+        for column, value in zip(TEXT_LIST_COLUMNS, row):
+            setattr(self, column.key, value)
+        for field, (kind, foreign_key) in LOOKUP_RELATIONS.items():
+            setattr(self, field, lookups.payloads[kind].get(getattr(self, foreign_key.key)))
+
+def _fetch_page(db: Session, columns: Sequence, filters: Sequence, page: int, limit: int, joins: Sequence, order_by: Sequence = ()):
+    stmt = select(*columns)
+    count_stmt = select(func.count(KagyurText.id))
+    for target in joins:
+        stmt = stmt.join(target)
+        count_stmt = count_stmt.join(target)
+    if filters:
+        stmt = stmt.where(*filters)
+        count_stmt = count_stmt.where(*filters)
+
+    total_count = db.execute(count_stmt).scalar() or 0
+
+    offset = (page - 1) * limit
+    rows = db.execute(
+        stmt.order_by(*(order_by or TEXT_SORT_ORDERS[None])).offset(offset).limit(limit)
+    ).all()
+    return rows, total_count
+
+def fetch_text_list_page(
+    db: Session,
+    filters: Sequence = (),
+    page: int = 1,
+    limit: int = 20,
+    joins: Sequence = (),
+    order_by: Sequence = (),
+    active_only: bool = False
+) -> Tuple[List[TextListRow], int]:
+    """
+    Fetch one page of texts as TextListRow objects plus the total count.
+
+    Args:
+        db: Database session
+        filters: WHERE clauses on KagyurText (and any joined tables)
+        page: Page number
+        limit: Items per page
+        joins: Targets to join before filtering, e.g. SubCategory
+        order_by: Sort columns (default: order_index, id)
+        active_only: Leave out deactivated texts, e.g. when the ids come from a
+            cache that may predate a deactivation
+
+    Returns:
+        tuple: (rows, total_count)
+    """
+    if active_only:
+        filters = [*filters, KagyurText.is_active == True]
+    rows, total_count = _fetch_page(db, TEXT_LIST_COLUMNS, filters, page, limit, joins, order_by)
+    lookups = get_lookup_registry(db)
+    return [TextListRow(row, lookups) for row in rows], total_count
+
+def fetch_text_list_selection(
+    db: Session,
+    selection: FieldSelection,
+    filters: Sequence = (),
+    page: int = 1,
+    limit: int = 20,
+    joins: Sequence = (),
+    order_by: Sequence = ()
+) -> Tuple[List[dict], int]:
+    """
+    Fetch one page of texts shaped to a ``?fields=``/``?include=`` selection.
+
+    Only the requested text columns are selected. Lookups are attached from
+    the registry when asked for, and the summary or Yeshe De spans (with only
+    their requested columns) are loaded in one extra query each.
+
+    Returns:
+        tuple: (dicts of the requested fields, total_count)
+    """
+    columns = selection.columns(KagyurText)
+    lookup_fields = [field for field in LOOKUP_RELATIONS if field in selection]
+    selected = {column.key for column in columns}
+    columns += [LOOKUP_RELATIONS[field][1] for field in lookup_fields if LOOKUP_RELATIONS[field][1].key not in selected]
+
+    rows, total_count = _fetch_page(db, columns, filters, page, limit, joins, order_by)
+    items = [dict(row._mapping) for row in rows]
+    text_ids = [item["id"] for item in items]
+
+    if lookup_fields:
+        lookups = get_lookup_registry(db)
+        for item in items:
+            for field in lookup_fields:
+                kind, foreign_key = LOOKUP_RELATIONS[field]
+                item[field] = lookups.payloads[kind].get(item[foreign_key.key])
+
+    if text_ids and "text_summary" in selection:
+        query = db.query(TextSummary).filter(TextSummary.text_id.in_(text_ids))
+        subtree = selection.subtree("text_summary")
+        if subtree is not None:
+            query = query.options(load_only(*selection.columns(TextSummary, subtree), TextSummary.text_id))
+        summaries = {summary.text_id: summary for summary in query}
+        for item in items:
+            item["text_summary"] = summaries.get(item["id"])
+
+    if text_ids and "yeshe_de_spans" in selection:
+        spans = {}
+        query = db.query(YesheDESpan).options(selectinload(YesheDESpan.volumes)).filter(YesheDESpan.text_id.in_(text_ids))
+        for span in query.order_by(YesheDESpan.id):
+            spans.setdefault(span.text_id, []).append(span)
+        for item in items:
+            item["yeshe_de_spans"] = spans.get(item["id"], [])
+
+    return [selection.extract(item) for item in items], total_count
+
+def fetch_text_list_language(
+    db: Session,
+    lang: str,
+    filters: Sequence = (),
+    page: int = 1,
+    limit: int = 20,
+    joins: Sequence = (),
+    order_by: Sequence = ()
+) -> Tuple[List[KagyurTextLanguageListItem], int]:
+    """
+    Fetch one page of texts in one language: a single ``title`` (falling back
+    to the other language) instead of the English/Tibetan pair, and lookups
+    reduced to their localized name.
+
+    Returns:
+        tuple: (rows, total_count)
+    """
+    columns = [column for column in TEXT_LIST_COLUMNS if column.key not in ("english_title", "tibetan_title")]
+    columns.append(localized_column(KagyurText.english_title, KagyurText.tibetan_title, lang, "title"))
+    rows, total_count = _fetch_page(db, columns, filters, page, limit, joins, order_by)
+
+    lookups = get_lookup_registry(db)
+    items = []
+    for row in rows:
+        item = dict(row._mapping)
+        for field, (kind, foreign_key) in LOOKUP_RELATIONS.items():
+            payload = lookups.payloads[kind].get(item.pop(foreign_key.key))
+            item[field] = _localized_lookup(payload, lang) if payload else None
+        items.append(KagyurTextLanguageListItem.model_validate(item))
+    return items, total_count
+
+def _localized_lookup(payload: dict, lang: str) -> dict:
+    name = payload["name_tibetan"] if lang == "tb" else payload["name_english"]
+    return {"id": payload["id"], "name": name or payload["name_english"] or payload["name_tibetan"]}
+
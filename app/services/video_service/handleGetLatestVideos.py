@@ -1,12 +1,21 @@
 from sqlalchemy.orm import Session
 from app.models import KagyurVideo
 from app.schemas import VideoResponse
+from app.services.video_service.videoProjection import video_cache, published_videos_select, to_video_language
+from app.utils.compression import CachedJSONResponse
 from typing import Optional, List
 
 async def handle_get_latest_videos(limit: int, lang: Optional[str], db: Session) -> list:
+    if lang:
+        body = video_cache.get_or_render(
+            ("latest", limit, lang),
+            lambda: to_video_language(db.execute(published_videos_select(lang).order_by(KagyurVideo.published_date.desc()).limit(limit)).all())
+        )
+        return CachedJSONResponse(body)
+
     # Only show published videos for public access
     videos = db.query(KagyurVideo).filter(
         KagyurVideo.is_active == True,
         KagyurVideo.publication_status == "published"
     ).order_by(KagyurVideo.published_date.desc()).limit(limit).all()
-    return videos 
\ No newline at end of file
+    return videos
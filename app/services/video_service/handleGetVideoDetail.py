@@ -1,10 +1,16 @@
 from sqlalchemy.orm import Session
 from app.models import KagyurVideo
 from app.schemas import VideoResponse
+from app.services.video_service.videoProjection import video_cache, published_videos_select, to_video_language
+from app.utils.compression import CachedJSONResponse
 from typing import Optional
 from fastapi import HTTPException
 
 async def handle_get_video_detail(video_id: int, lang: Optional[str], db: Session) -> VideoResponse:
+    if lang:
+        body = video_cache.get_or_render(("detail", video_id, lang), lambda: _build_video_detail(video_id, lang, db))
+        return CachedJSONResponse(body)
+
     # Only show published videos for public access
     video = db.query(KagyurVideo).filter(
         KagyurVideo.id == video_id,
@@ -13,4 +19,10 @@ async def handle_get_video_detail(video_id: int, lang: Optional[str], db: Sessio
     ).first()
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
-    return video 
\ No newline at end of file
+    return video
+
+def _build_video_detail(video_id: int, lang: str, db: Session):
+    rows = db.execute(published_videos_select(lang).where(KagyurVideo.id == video_id)).all()
+    if not rows:
+        raise HTTPException(status_code=404, detail="Video not found")
+    return to_video_language(rows)[0]
@@ -1,8 +1,15 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import select, func
 from app.models import KagyurVideo
+from app.services.video_service.videoProjection import video_cache, published_videos_select, to_video_language, PUBLISHED_VIDEO_FILTERS
+from app.utils.compression import CachedJSONResponse
 from typing import Optional
 
 async def handle_get_videos(page: int, limit: int, lang: Optional[str], db: Session) -> dict:
+    if lang:
+        body = video_cache.get_or_render(("list", page, limit, lang), lambda: _build_videos_page(page, limit, lang, db))
+        return CachedJSONResponse(body)
+
     offset = (page - 1) * limit
     # Only show published videos for public access
     query = db.query(KagyurVideo).filter(
@@ -19,4 +26,19 @@ async def handle_get_videos(page: int, limit: int, lang: Optional[str], db: Sess
             "total": total,
             "total_pages": (total + limit - 1) // limit
         }
-    } 
\ No newline at end of file
+    }
+
+def _build_videos_page(page: int, limit: int, lang: str, db: Session) -> dict:
+    """One page of published videos with only the requested language's columns"""
+    offset = (page - 1) * limit
+    total = db.execute(select(func.count(KagyurVideo.id)).where(*PUBLISHED_VIDEO_FILTERS)).scalar() or 0
+    rows = db.execute(published_videos_select(lang).order_by(KagyurVideo.published_date.desc()).offset(offset).limit(limit)).all()
+    return {
+        "videos": to_video_language(rows),
+        "pagination": {
+            "current_page": page,
+            "per_page": limit,
+            "total": total,
+            "total_pages": (total + limit - 1) // limit
+        }
+    }
@@ -0,0 +1,32 @@
+from typing import Optional
+from sqlalchemy import select
+from app.models import KagyurVideo
+from app.schemas import VideoLanguageResponse
+from app.utils.language_projection import localized_column
+from app.utils.response_cache import ResponseCache
+
+# Rendered per-language public video payloads, dropped whenever videos are written
+video_cache = ResponseCache("videos", KagyurVideo)
+
+# What the public may see
+PUBLISHED_VIDEO_FILTERS = (
+    KagyurVideo.is_active == True,
+    KagyurVideo.publication_status == "published"
+)
+
+def published_videos_select(lang: Optional[str]):
+    """Published videos with title and description in one language only"""
+    return select(
+        KagyurVideo.id,
+        localized_column(KagyurVideo.english_title, KagyurVideo.tibetan_title, lang, "title"),
+        localized_column(KagyurVideo.english_description, KagyurVideo.tibetan_description, lang, "description"),
+        KagyurVideo.video_url,
+        KagyurVideo.published_date,
+        KagyurVideo.publication_status,
+        KagyurVideo.is_active,
+        KagyurVideo.created_at,
+        KagyurVideo.updated_at
+    ).where(*PUBLISHED_VIDEO_FILTERS)
+
+def to_video_language(rows) -> list:
+    return [VideoLanguageResponse.model_validate(dict(row._mapping)) for row in rows]
@@ -0,0 +1,43 @@
+from typing import Callable, Optional
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+class DebouncedJob:
+    """
+    Runs ``func`` once on a background thread, ``delay()`` seconds after the
+    first ``schedule()`` call. Calls made while a run is pending are folded
+    into it; runs never overlap.
+
+    Example:
+        rebuild_job = DebouncedJob("catalog bundle", _rebuild, lambda: settings.EXPORT_BUNDLE_REBUILD_DELAY_SECONDS)
+
+        @on_commit(KagyurText)
+        def _schedule(tables):
+            rebuild_job.schedule()
+    """
+    def __init__(self, name: str, func: Callable[[], None], delay: Callable[[], float]):
+        self.name = name
+        self.func = func
+        self.delay = delay
+        self.run_lock = threading.Lock()
+        self._schedule_lock = threading.Lock()
+        self._pending: Optional[threading.Timer] = None
+
+    def schedule(self) -> None:
+        with self._schedule_lock:
+            if self._pending is not None:
+                return
+            self._pending = threading.Timer(self.delay(), self._run)
+            self._pending.daemon = True
+            self._pending.start()
+
+    def _run(self) -> None:
+        with self._schedule_lock:
+            self._pending = None
+        with self.run_lock:
+            try:
+                self.func()
+            except Exception as e:
+                logger.error(f"Background job {self.name} failed: {e}")
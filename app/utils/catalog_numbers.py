@@ -0,0 +1,27 @@
+from collections import namedtuple
+from typing import Optional
+from app.utils.folios import TIBETAN_DIGITS
+import re
+
+# "D340a", "Toh 1", "D1-3", "D1a–D2", "YD 12"
+_CATALOG_NUMBER_RE = re.compile(
+    r"^(?:[a-z]+\.?\s*)?(\d+)\s*([a-z]*)"
+    r"(?:\s*[-–—]\s*(?:[a-z]+\.?\s*)?(\d+)\s*[a-z]*)?$"
+)
+
+# Sortable parts of a Derge or Yeshe De catalog number: the number, a lowercase
+# letter suffix ("" if none) and, for ranges such as D1-3, the last number
+CatalogNumber = namedtuple("CatalogNumber", ["number", "suffix", "end"])
+
+def parse_catalog_number(value: Optional[str]) -> Optional[CatalogNumber]:
+    """Split a catalog number into its sortable parts, or None if it has no number"""
+    if not value:
+        return None
+    match = _CATALOG_NUMBER_RE.match(value.translate(TIBETAN_DIGITS).strip().lower())
+    if match is None:
+        return None
+    number, suffix, end = match.groups()
+    end = int(end) if end is not None else None
+    if end is not None and end <= int(number):
+        end = None
+    return CatalogNumber(int(number), suffix, end)
@@ -0,0 +1,56 @@
+from typing import Callable, List, Set, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+import logging
+
+logger = logging.getLogger(__name__)
+
+# (watched table names, callback) pairs registered with on_commit
+_listeners: List[Tuple[Set[str], Callable[[Set[str]], None]]] = []
+
+def on_commit(*models):
+    """
+    Register a callback to run after any commit that wrote to one of ``models``.
+
+    The callback receives the set of table names touched by the transaction.
+    Used by in-memory caches to drop stale data as soon as a write lands.
+
+    Example:
+        @on_commit(Sermon, Yana)
+        def _invalidate(tables):
+            ...
+    """
+    tables = {model.__tablename__ for model in models}
+
+    def decorator(callback: Callable[[Set[str]], None]):
+        _listeners.append((tables, callback))
+        return callback
+
+    return decorator
+
+def notify_tables_changed(tables: Set[str]) -> None:
+    """Run the callbacks watching any of ``tables`` (also used for bulk SQL writes)"""
+    for watched, callback in _listeners:
+        if watched & tables:
+            try:
+                callback(tables)
+            except Exception as e:
+                logger.error(f"Change hook {callback.__name__} failed: {e}")
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_tables(session, flush_context):
+    changed = session.info.setdefault("changed_tables", set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        table_name = getattr(obj, "__tablename__", None)
+        if table_name:
+            changed.add(table_name)
+
+@event.listens_for(Session, "after_commit")
+def _fire_change_hooks(session):
+    changed = session.info.pop("changed_tables", None)
+    if changed:
+        notify_tables_changed(changed)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_tables(session):
+    session.info.pop("changed_tables", None)
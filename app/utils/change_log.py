@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import Iterable
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+from app.models import (
+    ChangeLog, MainCategory, SubCategory, Sermon, Yana, TranslationType, KagyurText,
+    TextSummary, YesheDESpan, Volume, KagyurAudio, KagyurNews, KagyurVideo, Edition
+)
+
+# Public catalog tables whose writes are recorded for GET /changes.
+# Users, audit logs and the change log itself are never synced.
+SYNCED_MODELS = {
+    model.__tablename__: model
+    for model in (
+        MainCategory, SubCategory, Sermon, Yana, TranslationType, KagyurText,
+        TextSummary, YesheDESpan, Volume, KagyurAudio, KagyurNews, KagyurVideo, Edition
+    )
+}
+
+UPSERT = "upsert"
+DELETE = "delete"
+
+def record_changes(db: Session, model, record_ids: Iterable[int], action: str = UPSERT) -> None:
+    """
+    Add change-log entries for rows written with bulk SQL (``query.update()``),
+    which the flush hook below cannot see. Runs in the caller's transaction.
+    """
+    rows = [
+        {"table_name": model.__tablename__, "record_id": record_id, "action": action, "changed_at": datetime.utcnow()}
+        for record_id in record_ids if record_id
+    ]
+    if rows:
+        db.execute(insert(ChangeLog), rows)
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed_changes(session, flush_context):
+    """
+    Append one change-log entry per synced row inserted, updated or deleted
+    by the flush, in the same transaction, so entries commit or roll back
+    with the write. Deletes become tombstones.
+    """
+    now = datetime.utcnow()
+    rows = []
+    for objects, action in ((session.new, UPSERT), (session.dirty, UPSERT), (session.deleted, DELETE)):
+        for obj in objects:
+            table_name = getattr(obj, "__tablename__", None)
+            if table_name not in SYNCED_MODELS:
+                continue
+            if action == UPSERT and obj in session.dirty and not session.is_modified(obj, include_collections=False):
+                continue
+            rows.append({"table_name": table_name, "record_id": obj.id, "action": action, "changed_at": now})
+    if rows:
+        session.connection().execute(insert(ChangeLog), rows)
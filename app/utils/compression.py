@@ -0,0 +1,184 @@
+from typing import Dict, List, Optional, Tuple
+from fastapi import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+import brotli
+import gzip
+
+# Content types worth compressing; media and archives are already compressed
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+# Precompressed bodies are encoded once and served many times, so spend more CPU on them
+PRECOMPRESSED_GZIP_LEVEL = 9
+PRECOMPRESSED_BROTLI_QUALITY = 9
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick "br" or "gzip" from an Accept-Encoding header, preferring brotli.
+    Encodings with q=0 are refused; ``*`` allows either.
+    """
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        token, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if token:
+            accepted[token] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    for encoding in ("br", "gzip"):
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+def compress(body: bytes, encoding: str, gzip_level: int = None, brotli_quality: int = None) -> bytes:
+    if encoding == "br":
+        quality = settings.COMPRESSION_BROTLI_QUALITY if brotli_quality is None else brotli_quality
+        return brotli.compress(body, quality=quality)
+    level = settings.COMPRESSION_GZIP_LEVEL if gzip_level is None else gzip_level
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    return bool(content_type) and content_type.startswith(COMPRESSIBLE_TYPES)
+
+class CompressedBody:
+    """
+    A cached response body with its gzip and brotli encodings, each computed
+    on first use and kept, so cache hits never compress again. Encodings
+    already at hand (e.g. read from disk) can be passed in ``encoded``.
+    """
+    __slots__ = ("identity", "_encoded")
+
+    def __init__(self, identity: bytes, encoded: Optional[Dict[str, bytes]] = None):
+        self.identity = identity
+        self._encoded: Dict[str, bytes] = dict(encoded or {})
+
+    def encoded(self, encoding: str) -> bytes:
+        body = self._encoded.get(encoding)
+        if body is None:
+            body = compress(self.identity, encoding, PRECOMPRESSED_GZIP_LEVEL, PRECOMPRESSED_BROTLI_QUALITY)
+            self._encoded[encoding] = body
+        return body
+
+class CachedJSONResponse(Response):
+    """
+    JSON response for a cached CompressedBody. Sends the precompressed
+    variant the client accepts, so CompressionMiddleware passes it through.
+    """
+    media_type = "application/json"
+
+    def __init__(self, body: CompressedBody, status_code: int = 200, headers: Optional[Dict[str, str]] = None):
+        self.compressed_body = body
+        super().__init__(content=body.identity, status_code=status_code, headers=headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if len(self.compressed_body.identity) >= settings.COMPRESSION_MIN_SIZE:
+            encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+            self.headers.append("Vary", "Accept-Encoding")
+            if encoding is not None:
+                self.body = self.compressed_body.encoded(encoding)
+                self.headers["Content-Encoding"] = encoding
+                self.headers["Content-Length"] = str(len(self.body))
+        await super().__call__(scope, receive, send)
+
+class CompressionMiddleware:
+    """
+    gzip/brotli compression of complete (non-streaming) responses whose
+    content type is in COMPRESSIBLE_TYPES and whose body reaches the size
+    threshold. Responses that already carry a Content-Encoding (such as
+    CachedJSONResponse) and streamed bodies are passed through.
+
+    ``path_thresholds`` overrides ``minimum_size`` by path prefix (longest
+    prefix wins); a threshold of None disables compression for that prefix.
+
+    Example:
+        app.add_middleware(CompressionMiddleware, minimum_size=1024, path_thresholds={"/login": None})
+    """
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        path_thresholds: Optional[Dict[str, Optional[int]]] = None
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.path_thresholds: List[Tuple[str, Optional[int]]] = sorted(
+            (path_thresholds or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+
+    def threshold_for(self, path: str) -> Optional[int]:
+        for prefix, threshold in self.path_thresholds:
+            if path.startswith(prefix):
+                return threshold
+        return self.minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        threshold = self.threshold_for(scope["path"])
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if threshold is None or encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingSender(send, encoding, threshold)
+        await self.app(scope, receive, responder)
+
+class _CompressingSender:
+    """ASGI send wrapper that holds back the start message until the body is known"""
+
+    def __init__(self, send: Send, encoding: str, threshold: int):
+        self.send = send
+        self.encoding = encoding
+        self.threshold = threshold
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        if self.passthrough:
+            await self.send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            if "content-encoding" in headers or not is_compressible(headers.get("content-type")):
+                self.passthrough = True
+                await self.send(message)
+            else:
+                self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or self.start_message is None:
+            await self.send(message)
+            return
+
+        start_message, self.start_message = self.start_message, None
+        body = message.get("body", b"")
+        if message.get("more_body", False) or len(body) < self.threshold:
+            # Streamed or small: send unchanged
+            self.passthrough = True
+            await self.send(start_message)
+            await self.send(message)
+            return
+
+        compressed = compress(body, self.encoding)
+        headers = MutableHeaders(raw=start_message["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers["Content-Length"] = str(len(compressed))
+        headers.add_vary_header("Accept-Encoding")
+        await self.send(start_message)
+        await self.send({"type": "http.response.body", "body": compressed, "more_body": False})
@@ -0,0 +1,107 @@
+from typing import Optional, Dict
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+
+from app.models import MainCategory, SubCategory, KagyurText, KagyurAudio
+from app.utils.change_log import record_changes
+
+def adjust_counters(
+    db: Session,
+    sub_category_id: Optional[int],
+    text_delta: int = 0,
+    audio_delta: int = 0
+) -> None:
+    """
+    Apply a delta to the denormalized text/audio counters of a sub-category
+    and its main category.
+
+    The update is issued as ``SET col = col + delta`` inside the caller's
+    transaction, so it commits or rolls back together with the write that
+    caused it and concurrent writers never overwrite each other's changes.
+
+    Args:
+        db: Database session
+        sub_category_id: Sub-category the text/audio belongs to
+        text_delta: Change in number of active texts
+        audio_delta: Change in number of active audio files
+    """
+    if not sub_category_id or (not text_delta and not audio_delta):
+        return
+
+    main_category_id = db.query(SubCategory.main_category_id).filter(
+        SubCategory.id == sub_category_id
+    ).scalar()
+
+    db.query(SubCategory).filter(SubCategory.id == sub_category_id).update({
+        SubCategory.text_count: SubCategory.text_count + text_delta,
+        SubCategory.audio_count: SubCategory.audio_count + audio_delta
+    }, synchronize_session=False)
+
+    if main_category_id:
+        db.query(MainCategory).filter(MainCategory.id == main_category_id).update({
+            MainCategory.text_count: MainCategory.text_count + text_delta,
+            MainCategory.audio_count: MainCategory.audio_count + audio_delta
+        }, synchronize_session=False)
+
+    # Counters are part of the synced category records
+    record_changes(db, SubCategory, [sub_category_id])
+    record_changes(db, MainCategory, [main_category_id])
+
+def count_active_audio(db: Session, text_id: int) -> int:
+    """Number of active audio files attached to a text"""
+    return db.query(func.count(KagyurAudio.id)).filter(
+        KagyurAudio.text_id == text_id,
+        KagyurAudio.is_active == True
+    ).scalar() or 0
+
+def recount_counters(db: Session) -> Dict[str, int]:
+    """
+    Recompute every text/audio counter from scratch.
+
+    Used to repair drift after manual SQL edits or imports that bypassed the
+    services. Does not commit; the caller decides.
+
+    Returns:
+        dict: Number of sub-categories and main categories whose counters changed
+    """
+    text_counts = dict(
+        db.query(KagyurText.sub_category_id, func.count(KagyurText.id))
+          .filter(KagyurText.is_active == True)
+          .group_by(KagyurText.sub_category_id)
+          .all()
+    )
+    audio_counts = dict(
+        db.query(KagyurText.sub_category_id, func.count(KagyurAudio.id))
+          .join(KagyurAudio, KagyurAudio.text_id == KagyurText.id)
+          .filter(KagyurAudio.is_active == True)
+          .group_by(KagyurText.sub_category_id)
+          .all()
+    )
+
+    fixed_sub_categories = 0
+    main_totals: Dict[int, list] = {}
+    for sub_category in db.query(SubCategory).all():
+        text_count = text_counts.get(sub_category.id, 0)
+        audio_count = audio_counts.get(sub_category.id, 0)
+        if sub_category.text_count != text_count or sub_category.audio_count != audio_count:
+            sub_category.text_count = text_count
+            sub_category.audio_count = audio_count
+            fixed_sub_categories += 1
+
+        totals = main_totals.setdefault(sub_category.main_category_id, [0, 0])
+        totals[0] += text_count
+        totals[1] += audio_count
+
+    fixed_main_categories = 0
+    for category in db.query(MainCategory).all():
+        text_count, audio_count = main_totals.get(category.id, [0, 0])
+        if category.text_count != text_count or category.audio_count != audio_count:
+            category.text_count = text_count
+            category.audio_count = audio_count
+            fixed_main_categories += 1
+
+    db.flush()
+    return {
+        "sub_categories_fixed": fixed_sub_categories,
+        "main_categories_fixed": fixed_main_categories
+    }
@@ -0,0 +1,100 @@
+from decimal import Decimal
+from typing import Any, Callable, List, Optional, get_args, get_origin
+from fastapi import Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter
+import functools
+import inspect
+import orjson
+
+def _default(obj: Any) -> Any:
+    """orjson fallback for the objects handlers return besides plain data"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(by_alias=True)
+    if hasattr(obj, "_sa_instance_state"):
+        # ORM instance without a response model; same fields jsonable_encoder would emit
+        return {key: value for key, value in vars(obj).items() if not key.startswith("_sa")}
+    if hasattr(obj, "_mapping"):
+        return dict(obj._mapping)  # Core Row
+    if isinstance(obj, Decimal):
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, (bytes, bytearray)):
+        return obj.hex()  # Binary sort keys; hex compares in the same order as the bytes
+    if hasattr(obj, "__slots__"):
+        return {name: getattr(obj, name, None) for name in obj.__slots__}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps(content: Any) -> bytes:
+    """Serialize a response payload to compact UTF-8 JSON with orjson"""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+class FastJSONResponse(Response):
+    """JSON response rendered by orjson; ``bytes`` content is sent as-is"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+def _model_class(annotation: Any) -> Optional[type]:
+    return annotation if isinstance(annotation, type) and issubclass(annotation, BaseModel) else None
+
+class FastJSONRoute(APIRoute):
+    """
+    Route that validates a handler's return value at most once and serializes
+    it with orjson, instead of FastAPI's validate + jsonable_encoder pass.
+
+    - ``Response`` objects are passed through untouched.
+    - Instances of exactly the response model class (or lists of them for a
+      ``List[Model]`` response model) are trusted as already validated.
+    - Anything else (ORM objects, dicts, other or derived models) is
+      validated against the response model once, with ``from_attributes``,
+      and dumped through it, so only schema fields are sent.
+    - Without a response model the value is serialized as-is.
+
+    Opt in per router with ``APIRouter(route_class=FastJSONRoute)``. Not for
+    routes that rely on ``response_model_include``/``exclude`` options or set
+    headers through an injected ``Response`` parameter.
+    """
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        route = self
+        # include_router() re-creates routes from the already wrapped endpoint
+        endpoint = getattr(endpoint, "__fast_json_endpoint__", endpoint)
+
+        if inspect.iscoroutinefunction(endpoint):
+            @functools.wraps(endpoint)
+            async def wrapper(*args, **kw):
+                return route.render(await endpoint(*args, **kw))
+        else:
+            @functools.wraps(endpoint)
+            def wrapper(*args, **kw):
+                return route.render(endpoint(*args, **kw))
+        wrapper.__fast_json_endpoint__ = endpoint
+
+        kwargs.setdefault("response_class", FastJSONResponse)
+        super().__init__(path, wrapper, **kwargs)
+        self._adapter: Optional[TypeAdapter] = None
+        self._model_class = _model_class(self.response_model)
+        self._item_class = _model_class(get_args(self.response_model)[0]) if get_origin(self.response_model) in (list, List) else None
+
+    def _is_validated(self, content: Any) -> bool:
+        # Exact classes only: a subclass (or any other model) may carry fields
+        # the schema does not declare, which FastAPI would strip
+        if self._model_class is not None:
+            return type(content) is self._model_class
+        if self._item_class is not None and isinstance(content, list):
+            return all(type(item) is self._item_class for item in content)
+        return False
+
+    def render(self, content: Any) -> Response:
+        """Turn a handler's return value into a FastJSONResponse"""
+        if isinstance(content, Response):
+            return content
+        if self.response_model is not None and not self._is_validated(content):
+            if self._adapter is None:
+                self._adapter = TypeAdapter(self.response_model)
+            content = self._adapter.dump_json(self._adapter.validate_python(content, from_attributes=True), by_alias=True)
+        return FastJSONResponse(content, status_code=self.status_code or 200)
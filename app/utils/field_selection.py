@@ -0,0 +1,135 @@
+from typing import Dict, Iterable, List, Optional, Type, get_args
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+
+class FieldNode:
+    """
+    One requested field. ``schema`` is the nested Pydantic model when the
+    field holds one (or a list of them); ``children`` narrows it to a subset
+    of that model's fields, or is None to return it whole.
+    """
+    __slots__ = ("schema", "children")
+
+    def __init__(self, schema: Optional[Type[BaseModel]] = None, children: Optional[Dict[str, "FieldNode"]] = None):
+        self.schema = schema
+        self.children = children
+
+def _nested_schema(annotation) -> Optional[Type[BaseModel]]:
+    """The BaseModel inside Optional[...] / List[...] annotations, if any"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        schema = _nested_schema(arg)
+        if schema is not None:
+            return schema
+    return None
+
+def _add_path(tree: Dict[str, FieldNode], schema: Type[BaseModel], path: str) -> None:
+    parts = path.split(".")
+    current_tree, current_schema = tree, schema
+    for depth, part in enumerate(parts):
+        field = current_schema.model_fields.get(part) if current_schema else None
+        if field is None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown field: {path}")
+        nested = _nested_schema(field.annotation)
+        is_last = depth == len(parts) - 1
+
+        node = current_tree.get(part)
+        if node is None:
+            node = FieldNode(nested, None if is_last else {})
+            current_tree[part] = node
+        elif is_last:
+            node.children = None  # The whole object was asked for; it wins over sub-fields
+        if is_last or node.children is None:
+            return
+        current_tree, current_schema = node.children, nested
+
+class FieldSelection:
+    """Validated tree of requested fields, used to build queries and shape output"""
+
+    def __init__(self, tree: Dict[str, FieldNode]):
+        self.tree = tree
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.tree
+
+    def subtree(self, name: str) -> Optional[Dict[str, FieldNode]]:
+        """Requested sub-fields of ``name``, or None if it was requested whole"""
+        return self.tree[name].children
+
+    def columns(self, model, tree: Optional[Dict[str, FieldNode]] = None) -> List:
+        """
+        Column attributes of ``model`` named in ``tree`` (the top level by
+        default), always including the primary key.
+        """
+        tree = self.tree if tree is None else tree
+        table_columns = model.__table__.columns
+        names = ["id"] + [name for name in tree if name != "id" and name in table_columns]
+        return [getattr(model, name) for name in names]
+
+    def extract(self, obj) -> dict:
+        """Shape an ORM object, row mapping or dict into the requested fields"""
+        return _extract(obj, self.tree)
+
+def _extract(obj, tree: Dict[str, FieldNode]) -> dict:
+    if isinstance(obj, dict):
+        return {name: _extract_value(obj.get(name), node) for name, node in tree.items()}
+    return {name: _extract_value(getattr(obj, name, None), node) for name, node in tree.items()}
+
+def _extract_value(value, node: FieldNode):
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple)):
+        return [_extract_value(item, node) for item in value]
+    if node.children is not None:
+        return _extract(value, node.children)
+    if node.schema is not None and not isinstance(value, dict):
+        return node.schema.model_validate(value).model_dump(mode="json")
+    return value
+
+def _split(value: Optional[str]) -> List[str]:
+    return [part.strip() for part in value.split(",") if part.strip()] if value else []
+
+def parse_field_selection(
+    schema: Type[BaseModel],
+    fields: Optional[str] = None,
+    include: Optional[str] = None,
+    default: Optional[Iterable[str]] = None,
+    includable: Iterable[str] = ()
+) -> Optional[FieldSelection]:
+    """
+    Parse ``?fields=`` and ``?include=`` query parameters.
+
+    ``fields`` is a comma-separated list of field paths validated against
+    ``schema``; dotted paths select inside nested objects
+    (``sermon.name_english``). Without it the ``default`` top-level fields
+    are used (all of ``schema`` if None). ``include`` adds relationships
+    from ``includable`` on top. ``id`` is always returned.
+
+    Returns:
+        FieldSelection, or None when neither parameter was given so callers
+        can keep their regular response path
+
+    Raises:
+        HTTPException: 400 for unknown fields or relationships
+    """
+    requested_fields = _split(fields)
+    requested_includes = _split(include)
+    if not requested_fields and not requested_includes:
+        return None
+
+    includable = set(includable)
+    for name in requested_includes:
+        if name not in includable:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Cannot include: {name}. Allowed: {', '.join(sorted(includable)) or 'none'}"
+            )
+
+    if not requested_fields:
+        requested_fields = list(default) if default is not None else list(schema.model_fields)
+
+    tree: Dict[str, FieldNode] = {}
+    for path in ["id"] + requested_fields + requested_includes:
+        _add_path(tree, schema, path)
+    return FieldSelection(tree)
@@ -0,0 +1,134 @@
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from typing import Dict, List, Optional
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models import KagyurText, YesheDESpan, Volume
+from app.utils.change_hooks import on_commit
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# One Yeshe De volume range; positions as in app.utils.folios.folio_position
+FolioRange = namedtuple("FolioRange", ["start", "end", "text_id", "volume_id"])
+
+class _VolumeRanges:
+    """
+    The ranges of one volume. Matches for a query either start inside it,
+    a contiguous slice of the ranges sorted by start, or start before it and
+    contain its first position, which a centered interval tree finds. Each
+    part costs O(log n) plus its matches, however long or nested the ranges.
+    """
+    __slots__ = ("ranges", "starts", "tree")
+
+    def __init__(self, ranges: List[FolioRange]):
+        self.ranges = sorted(ranges)
+        self.starts = [r.start for r in self.ranges]
+        self.tree = _build_tree(self.ranges)
+
+    def _containing(self, position: int) -> List[FolioRange]:
+        found = []
+        node = self.tree
+        while node is not None:
+            center, by_start, by_end, left, right = node
+            if position < center:
+                for r in by_start:
+                    if r.start > position:
+                        break
+                    found.append(r)
+                node = left
+            elif position > center:
+                for r in by_end:
+                    if r.end < position:
+                        break
+                    found.append(r)
+                node = right
+            else:
+                found.extend(by_start)
+                break
+        return found
+
+    def overlapping(self, start: int, end: int) -> List[FolioRange]:
+        earlier = sorted(r for r in self._containing(start) if r.start < start)
+        return earlier + self.ranges[bisect_left(self.starts, start):bisect_right(self.starts, end)]
+
+def _build_tree(ranges: List[FolioRange]) -> Optional[tuple]:
+    """
+    (center, ranges containing it by start, the same by end descending, left,
+    right) around the median endpoint, so each side holds at most half of
+    the endpoints and the tree is O(log n) deep
+    """
+    if not ranges:
+        return None
+    points = sorted(p for r in ranges for p in (r.start, r.end))
+    center = points[len(points) // 2]
+    here = [r for r in ranges if r.start <= center <= r.end]
+    return (
+        center,
+        sorted(here, key=lambda r: r.start),
+        sorted(here, key=lambda r: r.end, reverse=True),
+        _build_tree([r for r in ranges if r.end < center]),
+        _build_tree([r for r in ranges if r.start > center]),
+    )
+
+class FolioIndex:
+    """Immutable interval index over the volume ranges of active texts"""
+
+    def __init__(self, ranges_by_volume: Dict[int, List[FolioRange]]):
+        self.volumes = {volume: _VolumeRanges(ranges) for volume, ranges in ranges_by_volume.items()}
+        self.built_at = time.monotonic()
+
+    def locate(self, volume: int, start: int, end: Optional[int] = None) -> List[FolioRange]:
+        """Ranges in ``volume`` overlapping positions ``start``..``end``, in folio order"""
+        ranges = self.volumes.get(volume)
+        if ranges is None:
+            return []
+        return ranges.overlapping(start, start if end is None else end)
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() - self.built_at < settings.FOLIO_INDEX_MAX_AGE_SECONDS
+
+_index: Optional[FolioIndex] = None
+_index_lock = threading.Lock()
+
+def _load_index(db: Session) -> FolioIndex:
+    rows = db.query(
+        Volume.volume_no, Volume.start_position, Volume.end_position, YesheDESpan.text_id, Volume.id
+    ).join(YesheDESpan, Volume.yeshe_de_span_id == YesheDESpan.id).join(
+        KagyurText, YesheDESpan.text_id == KagyurText.id
+    ).filter(
+        KagyurText.is_active == True,
+        Volume.volume_no.isnot(None),
+        Volume.start_position.isnot(None)
+    ).all()
+
+    ranges_by_volume: Dict[int, List[FolioRange]] = {}
+    for volume_no, start, end, text_id, volume_id in rows:
+        # A missing or reversed end means the range covers its start folio only
+        end = end if end is not None and end >= start else start | 1
+        ranges_by_volume.setdefault(volume_no, []).append(FolioRange(start, end, text_id, volume_id))
+    return FolioIndex(ranges_by_volume)
+
+def get_folio_index(db: Session) -> FolioIndex:
+    """
+    Return the current index, rebuilding it after catalog writes or once it
+    is older than FOLIO_INDEX_MAX_AGE_SECONDS (writes by other workers).
+    """
+    global _index
+    index = _index
+    if index is not None and index.is_fresh():
+        return index
+
+    with _index_lock:
+        if _index is None or not _index.is_fresh():
+            _index = _load_index(db)
+            logger.info("Folio index loaded")
+        return _index
+
+@on_commit(KagyurText, YesheDESpan, Volume)
+def invalidate_folio_index(tables=None) -> None:
+    """Drop the index so the next lookup rebuilds it"""
+    global _index
+    _index = None
@@ -0,0 +1,50 @@
+from typing import Optional, Tuple
+import re
+
+# Tibetan digits ༠-༩ read as 0-9
+TIBETAN_DIGITS = str.maketrans("༠༡༢༣༤༥༦༧༨༩", "0123456789")
+
+_FOLIO_RE = re.compile(r"^(?:f(?:ol(?:io)?)?\.?\s*)?(\d+)\s*\.?\s*([ab])?$")
+_NUMBER_RE = re.compile(r"\d+")
+
+SIDES = "ab"
+
+def parse_volume(volume_number: Optional[str]) -> Optional[int]:
+    """The number in a volume label ("12", "Vol. 12", "༡༢"), or None"""
+    if not volume_number:
+        return None
+    match = _NUMBER_RE.search(volume_number.translate(TIBETAN_DIGITS))
+    return int(match.group()) if match else None
+
+def parse_folio(page: Optional[str]) -> Optional[Tuple[int, Optional[int]]]:
+    """
+    Split a folio reference such as "12a", "12.b", "f. 12b" or "12" into
+    (folio, side) with side 0 for recto (a), 1 for verso (b) and None when
+    not given. Returns None if the string is not a folio reference.
+    """
+    if not page:
+        return None
+    match = _FOLIO_RE.match(page.translate(TIBETAN_DIGITS).strip().lower())
+    if match is None:
+        return None
+    side = match.group(2)
+    return int(match.group(1)), SIDES.index(side) if side else None
+
+def folio_position(page: Optional[str], end: bool = False) -> Optional[int]:
+    """
+    A folio reference as one sortable integer, ``folio * 2 + side``.
+
+    A reference without a side covers the whole folio, so it starts at its
+    recto and, with ``end``, ends at its verso.
+    """
+    parsed = parse_folio(page)
+    if parsed is None:
+        return None
+    folio, side = parsed
+    if side is None:
+        side = 1 if end else 0
+    return folio * 2 + side
+
+def format_position(position: int) -> str:
+    """Inverse of folio_position, e.g. 25 is 12b"""
+    return f"{position // 2}{SIDES[position % 2]}"
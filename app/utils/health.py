@@ -0,0 +1,142 @@
+from typing import Dict, FrozenSet, Optional, Tuple
+from datetime import datetime
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.utils.lookup_registry import lookup_registry_is_warm
+from app.utils.response_cache import get_response_cache_stats
+from app.utils.schema_startup import expected_heads, schema_startup_mode
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# (monotonic time, HTTP status, report) of the last readiness check
+_last_report: Optional[Tuple[float, int, dict]] = None
+_report_lock = asyncio.Lock()
+
+# The database check of an earlier probe that outlived its timeout; while it
+# is stuck (typically waiting for a pool connection) no second one is started
+_pending_ping: Optional[asyncio.Future] = None
+
+_expected_heads: Optional[FrozenSet[str]] = None
+
+def _expected() -> FrozenSet[str]:
+    global _expected_heads
+    if _expected_heads is None:
+        _expected_heads = expected_heads()
+    return _expected_heads
+
+def _ping(engine: Engine) -> Dict[str, object]:
+    """Check out a connection, time ``SELECT 1`` on it and read the migration version"""
+    from alembic.runtime.migration import MigrationContext
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        checked_out = time.perf_counter()
+        if conn.dialect.name == "postgresql":
+            conn.execute(text(f"SET LOCAL statement_timeout = {int(settings.HEALTH_DB_TIMEOUT_SECONDS * 1000)}"))
+        conn.execute(text("SELECT 1")).scalar()
+        finished = time.perf_counter()
+        heads = MigrationContext.configure(conn).get_current_heads()
+    return {
+        "checkout_ms": round((checked_out - started) * 1000, 3),
+        "latency_ms": round((finished - checked_out) * 1000, 3),
+        "heads": frozenset(heads),
+    }
+
+def pool_state(engine: Engine) -> Dict[str, object]:
+    """Connections checked out of ``engine``'s pool, against the most it will open"""
+    pool = engine.pool
+    if not hasattr(pool, "checkedout"):
+        return {"class": type(pool).__name__}
+    capacity = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "capacity": capacity,
+        "saturation": round(pool.checkedout() / capacity, 3) if capacity > 0 else None,
+    }
+
+async def _check_database(engine: Engine) -> Dict[str, object]:
+    global _pending_ping
+    if _pending_ping is not None and not _pending_ping.done():
+        return {"ok": False, "error": "An earlier check is still waiting on the database"}
+
+    _pending_ping = asyncio.ensure_future(run_in_threadpool(_ping, engine))
+    try:
+        result = await asyncio.wait_for(asyncio.shield(_pending_ping), settings.HEALTH_DB_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        return {"ok": False, "error": f"No answer within {settings.HEALTH_DB_TIMEOUT_SECONDS}s"}
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+    return {"ok": True, **result}
+
+async def _build_report(app: FastAPI, engine: Engine) -> Tuple[int, dict]:
+    database = await _check_database(engine)
+    current = database.pop("heads", None)
+
+    # The version only decides readiness where startup enforces it (SCHEMA_STARTUP_MODE=check)
+    enforced = schema_startup_mode(engine) == "check"
+    try:
+        expected = _expected()
+    except Exception as e:
+        logger.error(f"Could not read the migration head: {e}")
+        expected = None
+    migrations_ok = current is not None and expected is not None and current == expected
+    migrations = {
+        "ok": migrations_ok,
+        "enforced": enforced,
+        "current": sorted(current) if current is not None else None,
+        "expected": sorted(expected) if expected is not None else None,
+    }
+
+    response_caches = get_response_cache_stats()
+    caches = {
+        "lookup_registry": lookup_registry_is_warm(),
+        "openapi_document": getattr(app.state, "openapi_document", None) is not None,
+        "response_cache_entries": sum(cache["entries"] for cache in response_caches.values()),
+    }
+
+    ready = database["ok"] and (migrations_ok or not enforced)
+    report = {
+        "status": "ready" if ready else "not_ready",
+        "checked_at": datetime.utcnow().isoformat(),
+        "database": database,
+        "pool": pool_state(engine),
+        "migrations": migrations,
+        "caches": caches,
+    }
+    return (200 if ready else 503), report
+
+async def check_readiness(app: FastAPI, engine: Engine) -> Tuple[int, dict]:
+    """
+    Whether this worker can serve requests: a timed ``SELECT 1`` (failing
+    after HEALTH_DB_TIMEOUT_SECONDS, so an exhausted pool or an unreachable
+    database shows up as not ready), the migration version (enforced when
+    SCHEMA_STARTUP_MODE is check), pool saturation and cache warmness.
+
+    The result is reused for HEALTH_READY_CACHE_SECONDS and concurrent
+    probes share one check, so probe storms cost one query per interval.
+
+    Returns:
+        tuple: HTTP status (200 or 503) and the report
+    """
+    global _last_report
+    last = _last_report
+    if last is not None and time.monotonic() - last[0] < settings.HEALTH_READY_CACHE_SECONDS:
+        return last[1], last[2]
+
+    async with _report_lock:
+        last = _last_report
+        if last is not None and time.monotonic() - last[0] < settings.HEALTH_READY_CACHE_SECONDS:
+            return last[1], last[2]
+        status_code, report = await _build_report(app, engine)
+        if status_code != 200:
+            logger.warning(f"Readiness check failed: {report['database']}, migrations {report['migrations']}")
+        _last_report = (time.monotonic(), status_code, report)
+        return status_code, report
@@ -0,0 +1,14 @@
+from typing import Optional
+from sqlalchemy import func
+
+def localized_column(english, tibetan, lang: Optional[str], label: str):
+    """
+    Select one language of a bilingual column pair, falling back to the other
+    language when the requested one is NULL or empty. The fallback happens in
+    SQL, so only one text value per row leaves the database.
+
+    Example:
+        select(KagyurNews.id, localized_column(KagyurNews.english_title, KagyurNews.tibetan_title, "tb", "title"))
+    """
+    primary, fallback = (tibetan, english) if lang == "tb" else (english, tibetan)
+    return func.coalesce(func.nullif(primary, ""), fallback).label(label)
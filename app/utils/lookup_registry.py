@@ -0,0 +1,223 @@
+from collections import namedtuple
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.database import SessionLocal
+from app.models import MainCategory, Sermon, Yana, TranslationType
+from app.schemas import (
+    FilterOptionsResponse, MainCategoryBase, SermonBase, YanaBase, TranslationTypeBase,
+    SermonResponse, YanaResponse, TranslationTypeResponse
+)
+from app.utils.change_hooks import on_commit
+from app.utils.compression import CompressedBody
+from app.utils.fast_json import dumps
+from app.utils.metrics import cache_counters
+from app.utils.tibetan_collation import MISSING_KEY
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+LookupEntry = namedtuple("LookupEntry", ["id", "name_english", "name_tibetan", "order_index", "is_active"])
+
+# Lookup kind -> model, as used by LookupRegistry.exists()
+LOOKUP_MODELS = {
+    "category": MainCategory,
+    "sermon": Sermon,
+    "yana": Yana,
+    "translation_type": TranslationType,
+}
+
+# Lookup kinds served publicly by the generic lookup routers, with their response schema
+LOOKUP_RESPONSE_SCHEMAS = {
+    "sermon": SermonResponse,
+    "yana": YanaResponse,
+    "translation_type": TranslationTypeResponse,
+}
+
+class LookupRegistry:
+    """
+    Immutable snapshot of the small reference tables.
+
+    Holds every row (active or not) keyed by id for O(1) foreign-key checks,
+    the active rows in display order for the search filters, and the public
+    JSON payloads of the lookup tables. A new registry is built on
+    invalidation; an existing one is never mutated apart from memoizing
+    rendered (and compressed) output.
+    """
+    def __init__(
+        self,
+        entries: Dict[str, Tuple[LookupEntry, ...]],
+        payloads: Dict[str, Dict[int, dict]],
+        tibetan_order: Dict[str, Tuple[int, ...]]
+    ):
+        self.by_id: Dict[str, Dict[int, LookupEntry]] = {
+            kind: {entry.id: entry for entry in rows} for kind, rows in entries.items()
+        }
+        self.active: Dict[str, Tuple[LookupEntry, ...]] = {
+            kind: tuple(entry for entry in rows if entry.is_active) for kind, rows in entries.items()
+        }
+        self.payloads = payloads  # kind -> {id: response dict} for active rows, in display order
+        self.tibetan_order = tibetan_order  # kind -> ids of the payloads by their tibetan_sort_key
+        self.built_at = time.monotonic()
+        self._filter_options: Dict[Optional[str], FilterOptionsResponse] = {}
+        self._rendered: Dict[tuple, CompressedBody] = {}
+
+    def exists(self, kind: str, record_id: int, db: Session) -> bool:
+        """
+        Check that a lookup row exists.
+
+        Hits are answered from memory. A miss is confirmed against the
+        database, since the row may have been created by another worker
+        since this snapshot was built.
+        """
+        if record_id in self.by_id[kind]:
+            return True
+        if db.get(LOOKUP_MODELS[kind], record_id) is None:
+            return False
+        invalidate_lookup_registry()
+        return True
+
+    def filter_options(self, lang: Optional[str]) -> FilterOptionsResponse:
+        """Search filter options, rendered once per language"""
+        options = self._filter_options.get(lang)
+        if options is None:
+            options = FilterOptionsResponse(
+                categories=[MainCategoryBase(name_english=c.name_english, name_tibetan=c.name_tibetan) for c in self.active["category"]],
+                sermons=[SermonBase(name_english=s.name_english, name_tibetan=s.name_tibetan) for s in self.active["sermon"]],
+                yanas=[YanaBase(name_english=y.name_english, name_tibetan=y.name_tibetan) for y in self.active["yana"]],
+                translation_types=[TranslationTypeBase(name_english=t.name_english, name_tibetan=t.name_tibetan) for t in self.active["translation_type"]],
+                language=lang
+            )
+            self._filter_options[lang] = options
+        return options
+
+    def _localize(self, payload: dict, lang: Optional[str]) -> dict:
+        name = payload["name_english"]
+        if lang == "tb":
+            name = payload["name_tibetan"] or name
+        return {**payload, "name": name}
+
+    def filter_options_json(self, lang: Optional[str]) -> CompressedBody:
+        """Search filter options as a JSON body, rendered once per language"""
+        key = ("filter_options", None, lang)
+        rendered = self._rendered.get(key)
+        if rendered is None:
+            rendered = CompressedBody(dumps(self.filter_options(lang)))
+            self._rendered[key] = rendered
+        return rendered
+
+    def list_json(self, kind: str, lang: Optional[str], sort: Optional[str] = None) -> CompressedBody:
+        """
+        Active rows of a lookup table as a JSON body, rendered once per
+        language and order (display order, or "tibetan" for Tibetan order)
+        """
+        key = (kind, None, lang, sort)
+        rendered = self._rendered.get(key)
+        if rendered is None:
+            payloads = self.payloads[kind]
+            if sort == "tibetan":
+                rows = [payloads[record_id] for record_id in self.tibetan_order[kind]]
+            else:
+                rows = payloads.values()
+            rendered = CompressedBody(dumps([self._localize(p, lang) for p in rows]))
+            self._rendered[key] = rendered
+        return rendered
+
+    def detail_json(self, kind: str, record_id: int, lang: Optional[str]) -> Optional[CompressedBody]:
+        """One active row as a JSON body, or None if it is missing or inactive"""
+        payload = self.payloads[kind].get(record_id)
+        if payload is None:
+            return None
+        key = (kind, record_id, lang)
+        rendered = self._rendered.get(key)
+        if rendered is None:
+            rendered = CompressedBody(dumps(self._localize(payload, lang)))
+            self._rendered[key] = rendered
+        return rendered
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() - self.built_at < settings.LOOKUP_REGISTRY_MAX_AGE_SECONDS
+
+_registry: Optional[LookupRegistry] = None
+_registry_lock = threading.Lock()
+_registry_hits, _registry_misses = cache_counters("lookup_registry")
+
+def _load_registry(db: Session) -> LookupRegistry:
+    entries = {}
+    payloads = {}
+    tibetan_order = {}
+    for kind, model in LOOKUP_MODELS.items():
+        schema = LOOKUP_RESPONSE_SCHEMAS.get(kind)
+        if schema is None:
+            rows = db.query(
+                model.id, model.name_english, model.name_tibetan, model.order_index, model.is_active
+            ).order_by(model.order_index, model.id).all()
+            entries[kind] = tuple(LookupEntry(*row) for row in rows)
+            continue
+
+        rows = db.query(model).order_by(model.order_index, model.id).all()
+        entries[kind] = tuple(
+            LookupEntry(row.id, row.name_english, row.name_tibetan, row.order_index, row.is_active) for row in rows
+        )
+        payloads[kind] = {
+            row.id: schema.model_validate(row).model_dump(mode="json") for row in rows if row.is_active
+        }
+        tibetan_order[kind] = tuple(
+            row.id for row in sorted(rows, key=lambda row: (row.tibetan_sort_key or MISSING_KEY, row.id)) if row.is_active
+        )
+    return LookupRegistry(entries, payloads, tibetan_order)
+
+def get_lookup_registry(db: Optional[Session] = None) -> LookupRegistry:
+    """
+    Return the current registry, rebuilding it if it was invalidated or is
+    older than LOOKUP_REGISTRY_MAX_AGE_SECONDS (which bounds staleness for
+    writes made by other workers).
+
+    ``db`` is only used for a rebuild; without one a short-lived session is
+    opened, so public readers need not check out a connection per request.
+    """
+    global _registry
+    registry = _registry
+    if registry is not None and registry.is_fresh():
+        _registry_hits.inc()
+        return registry
+
+    with _registry_lock:
+        if _registry is None or not _registry.is_fresh():
+            _registry_misses.inc()
+            if db is not None:
+                _registry = _load_registry(db)
+            else:
+                own_db = SessionLocal()
+                try:
+                    _registry = _load_registry(own_db)
+                finally:
+                    own_db.close()
+            logger.info("Lookup registry loaded")
+        return _registry
+
+def lookup_registry_is_warm() -> bool:
+    """Whether a fresh registry is in memory, so the next reader won't rebuild it"""
+    registry = _registry
+    return registry is not None and registry.is_fresh()
+
+def invalidate_lookup_registry() -> None:
+    """Drop the registry so the next reader rebuilds it"""
+    global _registry
+    _registry = None
+
+@on_commit(MainCategory, Sermon, Yana, TranslationType)
+def refresh_lookup_registry(tables=None) -> None:
+    """
+    Rebuild the registry right after a commit to categories, sermons, yanas
+    or translation types, so public lookup reads keep being served from
+    memory. Falls back to dropping it if the rebuild fails.
+    """
+    invalidate_lookup_registry()
+    try:
+        get_lookup_registry()
+    except Exception as e:
+        logger.error(f"Lookup registry rebuild failed: {e}")
+        invalidate_lookup_registry()
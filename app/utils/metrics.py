@@ -0,0 +1,146 @@
+from typing import Dict, Optional
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, REGISTRY, generate_latest, multiprocess
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.routing import Mount
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+import os
+import time
+
+# Prometheus metrics, aggregated across uvicorn/gunicorn workers when
+# PROMETHEUS_MULTIPROC_DIR is set: each worker then writes its samples to
+# memory-mapped files in that directory and GET /metrics merges them. The
+# variable must be set (and the directory emptied) before the workers start.
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+# Route label for requests no route matched, so scanners cannot grow the label set
+UNMATCHED_ROUTE = "<unmatched>"
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template and status",
+    ["method", "route", "status"], buckets=LATENCY_BUCKETS
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "HTTP requests being served", multiprocess_mode="livesum"
+)
+DB_STATEMENT_SECONDS = Histogram(
+    "db_statement_duration_seconds", "SQL statement execution time by statement type",
+    ["operation"], buckets=DB_LATENCY_BUCKETS
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections", "Connection pool state: size, checked_out, idle, overflow",
+    ["state"], multiprocess_mode="livesum"
+)
+CACHE_LOOKUPS = Counter(
+    "cache_lookups", "In-memory cache lookups by cache and result (hit/miss)", ["cache", "result"]
+)
+SINGLE_FLIGHT_EVENTS = Counter(
+    "single_flight_events", "Request coalescing: computations run, coalesced waiters, errors, timeouts, takeovers",
+    ["flight", "event"]
+)
+
+def cache_counters(cache: str):
+    """(hit, miss) counters for ``cache``, bound once so lookups only increment"""
+    return CACHE_LOOKUPS.labels(cache=cache, result="hit"), CACHE_LOOKUPS.labels(cache=cache, result="miss")
+
+def render_metrics() -> bytes:
+    """All metrics in the Prometheus text format, merged across workers in multiprocess mode"""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+def mark_worker_stopped() -> None:
+    """Drop this worker's in-flight and pool gauges from the merged view"""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(os.getpid())
+
+def _statement_operation(statement: str) -> str:
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return operation if operation in ("SELECT", "INSERT", "UPDATE", "DELETE") else "OTHER"
+
+def instrument_engine(engine: Engine) -> None:
+    """Time every statement run on ``engine`` and track its pool occupancy"""
+    observers: Dict[str, Histogram] = {}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._metrics_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _observe(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_metrics_started", None)
+        if started is None:
+            return
+        operation = _statement_operation(statement)
+        observer = observers.get(operation)
+        if observer is None:
+            observer = observers[operation] = DB_STATEMENT_SECONDS.labels(operation=operation)
+        observer.observe(time.perf_counter() - started)
+
+    def _record_pool(*args) -> None:
+        pool = engine.pool
+        if not hasattr(pool, "checkedout"):
+            return  # NullPool/StaticPool keep no counts
+        DB_POOL_CONNECTIONS.labels(state="size").set(pool.size())
+        DB_POOL_CONNECTIONS.labels(state="checked_out").set(pool.checkedout())
+        DB_POOL_CONNECTIONS.labels(state="idle").set(pool.checkedin())
+        DB_POOL_CONNECTIONS.labels(state="overflow").set(max(pool.overflow(), 0))
+
+    event.listen(engine, "checkout", _record_pool)
+    event.listen(engine, "checkin", _record_pool)
+
+class MetricsMiddleware:
+    """
+    Request latency per method, route template and status, plus the number
+    of requests in flight. The route template (``/texts/{text_id}``) comes
+    from the matched route after the app has run, so paths with ids do not
+    each become their own series.
+
+    Example:
+        app.add_middleware(MetricsMiddleware)
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._endpoint_paths: Optional[Dict[object, str]] = None
+
+    def _route_template(self, scope: Scope) -> str:
+        route = scope.get("route")
+        if route is not None:
+            return route.path
+        # Plain Starlette routes (docs, /openapi.json) and mounts only leave their endpoint in the scope
+        if self._endpoint_paths is None:
+            self._endpoint_paths = {}
+            for route in scope["app"].router.routes:
+                if isinstance(route, Mount):
+                    self._endpoint_paths[route.app] = f"{route.path}/{{path}}"
+                elif hasattr(route, "endpoint"):
+                    self._endpoint_paths[route.endpoint] = route.path
+        return self._endpoint_paths.get(scope.get("endpoint"), UNMATCHED_ROUTE)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            HTTP_REQUEST_SECONDS.labels(
+                method=scope["method"], route=self._route_template(scope), status=str(status_code)
+            ).observe(time.perf_counter() - started)
@@ -0,0 +1,140 @@
+from pathlib import Path
+from typing import Optional
+from datetime import datetime
+from fastapi import FastAPI, Request, Response
+from app.core.config import settings
+from app.utils.compression import (
+    CachedJSONResponse, CompressedBody, compress, PRECOMPRESSED_GZIP_LEVEL, PRECOMPRESSED_BROTLI_QUALITY
+)
+from app.utils.fast_json import dumps
+import fastapi
+import hashlib
+import json
+import logging
+import os
+import pydantic
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "openapi.manifest.json"
+
+# Stored next to the document, so serving never compresses
+ENCODINGS = {"gzip": ".gz", "br": ".br"}
+
+# The generated document only changes with the code that declares the routes
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SOURCE_FILES = ("main.py", "app/**/*.py")
+
+def _cache_dir() -> Path:
+    return Path(settings.OPENAPI_CACHE_DIR)
+
+def source_fingerprint() -> str:
+    """Hash of the application source and the libraries that shape the schema"""
+    digest = hashlib.sha256(f"fastapi {fastapi.__version__} pydantic {pydantic.VERSION}".encode())
+    paths = sorted(path for pattern in SOURCE_FILES for path in PROJECT_ROOT.glob(pattern))
+    for path in paths:
+        digest.update(str(path.relative_to(PROJECT_ROOT)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+def read_manifest() -> Optional[dict]:
+    try:
+        return json.loads((_cache_dir() / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return None
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def build_openapi_cache(app: FastAPI, fingerprint: Optional[str] = None) -> dict:
+    """
+    Generate ``app``'s OpenAPI document and write it, gzip- and
+    brotli-compressed copies and a manifest to OPENAPI_CACHE_DIR.
+
+    The files are named after the document's SHA-256, which is also its ETag.
+
+    Returns:
+        dict: The new manifest
+    """
+    body = dumps(app.openapi())
+    digest = hashlib.sha256(body).hexdigest()
+    file_name = f"openapi.{digest[:12]}.json"
+    manifest = {
+        "source": fingerprint or source_fingerprint(),
+        "file_name": file_name,
+        "etag": f'"{digest}"',
+        "size": len(body),
+        "built_at": datetime.utcnow().isoformat()
+    }
+
+    directory = _cache_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    _atomic_write(directory / file_name, body)
+    _atomic_write(directory / (file_name + ENCODINGS["gzip"]), compress(body, "gzip", gzip_level=PRECOMPRESSED_GZIP_LEVEL))
+    _atomic_write(directory / (file_name + ENCODINGS["br"]), compress(body, "br", brotli_quality=PRECOMPRESSED_BROTLI_QUALITY))
+    _atomic_write(directory / MANIFEST_NAME, json.dumps(manifest).encode())
+
+    for path in directory.glob("openapi.*.json*"):
+        if path.name != MANIFEST_NAME and not path.name.startswith(file_name):
+            path.unlink(missing_ok=True)
+    return manifest
+
+def _read_document(manifest: dict) -> CompressedBody:
+    directory = _cache_dir()
+    identity = (directory / manifest["file_name"]).read_bytes()
+    encoded = {
+        encoding: (directory / (manifest["file_name"] + suffix)).read_bytes()
+        for encoding, suffix in ENCODINGS.items()
+    }
+    return CompressedBody(identity, encoded)
+
+def load_openapi_cache(app: FastAPI) -> dict:
+    """
+    Load the cached OpenAPI document for serving, building it first when the
+    cache is missing or was built from different source.
+
+    Returns:
+        dict: The manifest in use
+    """
+    fingerprint = source_fingerprint()
+    manifest = read_manifest()
+    body = None
+    if manifest is not None and manifest.get("source") == fingerprint:
+        try:
+            body = _read_document(manifest)
+        except OSError:
+            pass  # Removed by a concurrent rebuild; build our own
+    if body is None:
+        manifest = build_openapi_cache(app, fingerprint)
+        body = _read_document(manifest)
+        logger.info(f"OpenAPI document written to {_cache_dir() / manifest['file_name']}")
+
+    app.state.openapi_document = (body, manifest["etag"])
+    return manifest
+
+async def _cached_openapi(request: Request) -> Response:
+    document = getattr(request.app.state, "openapi_document", None)
+    if document is None:
+        load_openapi_cache(request.app)
+        document = request.app.state.openapi_document
+    body, etag = document
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=0, must-revalidate"}
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+    return CachedJSONResponse(body, headers=headers)
+
+def serve_cached_openapi(app: FastAPI) -> None:
+    """
+    Serve ``app.openapi_url`` from the document on disk (see
+    load_openapi_cache) instead of generating it in every worker.
+    """
+    app.router.routes = [
+        route for route in app.router.routes if getattr(route, "path", None) != app.openapi_url
+    ]
+    app.add_route(app.openapi_url, _cached_openapi, include_in_schema=False)
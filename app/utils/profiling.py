@@ -0,0 +1,184 @@
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+from datetime import datetime
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+import hashlib
+import hmac
+import json
+import logging
+import os
+import random
+import re
+import tempfile
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile-token"
+
+_FILE_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+def _profile_dir() -> Path:
+    return Path(settings.PROFILING_DIR)
+
+# ==================== SIGNED TRIGGER ====================
+
+def _signature(expires: int) -> str:
+    return hmac.new(settings.SECRET_KEY.encode(), f"profile:{expires}".encode(), hashlib.sha256).hexdigest()
+
+def create_profile_token(max_age_seconds: int) -> Dict[str, object]:
+    """A token that profiles every request sending it in X-Profile-Token until it expires"""
+    expires = int(time.time()) + min(max_age_seconds, settings.PROFILING_TOKEN_MAX_AGE_SECONDS)
+    return {"token": f"{expires}.{_signature(expires)}", "header": "X-Profile-Token", "expires_at": expires}
+
+def verify_profile_token(token: str) -> bool:
+    expires, _, signature = token.partition(".")
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    return hmac.compare_digest(signature, _signature(int(expires)))
+
+# ==================== STORAGE ====================
+
+def _frame_name(frame_info: str) -> str:
+    # "function\x00path\x00line" plus optional attributes after \x01; semicolons would split the stack
+    function, _, rest = frame_info.split("\x01", 1)[0].partition("\x00")
+    path, _, line = rest.partition("\x00")
+    name = f"{function} ({Path(path).name}:{line})" if path else function
+    return name.replace(";", ",")
+
+def folded_stacks(session) -> str:
+    """
+    A pyinstrument session as folded stacks ("frame;frame;frame microseconds"
+    per line), the input format of flamegraph.pl, inferno and speedscope.
+    Frames above the middleware that started the profiler are left out.
+    """
+    skip = max(len(session.start_call_stack) - 1, 0)
+    totals: Dict[str, float] = defaultdict(float)
+    for stack, seconds in session.frame_records:
+        totals[";".join(_frame_name(frame) for frame in stack[skip:])] += seconds
+    return "".join(
+        f"{stack} {round(seconds * 1_000_000)}\n"
+        for stack, seconds in sorted(totals.items()) if stack and seconds > 0
+    )
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def save_profile(session, meta: dict) -> dict:
+    """Write the folded stacks and their metadata; keep the newest PROFILING_MAX_FILES profiles"""
+    directory = _profile_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    created = datetime.utcnow()
+    profile_id = f"{created:%Y%m%dT%H%M%S}-{_FILE_UNSAFE.sub('_', meta['route']).strip('_')[:60]}-{uuid.uuid4().hex[:6]}"
+    meta = {
+        "id": profile_id,
+        **meta,
+        "wall_ms": round(session.duration * 1000, 3),
+        "cpu_ms": round(session.cpu_time * 1000, 3),
+        "samples": session.sample_count,
+        "created_at": created.isoformat(),
+        "file_name": f"{profile_id}.folded",
+    }
+    _atomic_write(directory / meta["file_name"], folded_stacks(session).encode())
+    _atomic_write(directory / f"{profile_id}.json", json.dumps(meta).encode())
+
+    for stale in list_profiles()[settings.PROFILING_MAX_FILES:]:
+        (directory / stale["file_name"]).unlink(missing_ok=True)
+        (directory / f"{stale['id']}.json").unlink(missing_ok=True)
+    return meta
+
+def list_profiles() -> List[dict]:
+    """Metadata of the stored profiles, newest first"""
+    profiles = []
+    for path in _profile_dir().glob("*.json"):
+        try:
+            profiles.append(json.loads(path.read_text()))
+        except (OSError, ValueError):
+            continue
+    return sorted(profiles, key=lambda meta: meta["created_at"], reverse=True)
+
+def profile_file(profile_id: str) -> Optional[Path]:
+    """Path of a stored profile's folded stacks, or None if there is no such profile"""
+    if _FILE_UNSAFE.search(profile_id):
+        return None
+    path = _profile_dir() / f"{profile_id}.folded"
+    return path if path.is_file() else None
+
+# ==================== MIDDLEWARE ====================
+
+class ProfilingMiddleware:
+    """
+    Statistical stack profiles of individual requests, taken with
+    pyinstrument for a random PROFILING_SAMPLE_RATE fraction of requests and
+    for every request carrying a valid X-Profile-Token (see
+    create_profile_token). Each profile is stored in PROFILING_DIR as folded
+    stacks of wall time, with "[await]" frames where the request waited, and
+    the request's wall and process CPU time in a metadata file.
+
+    Requests that are not profiled pass straight through: one random draw
+    (if sampling is on) and one header lookup. pyinstrument is imported on
+    the first profiled request.
+
+    Code run in the threadpool (plain ``def`` endpoints and dependencies) is
+    not sampled; it appears as the await that waited for it.
+
+    Example:
+        app.add_middleware(ProfilingMiddleware)
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    def _trigger(self, scope: Scope) -> Optional[str]:
+        rate = settings.PROFILING_SAMPLE_RATE
+        if rate > 0 and random.random() < rate:
+            return "sampled"
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                return "token" if verify_profile_token(value.decode("latin-1")) else None
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        trigger = self._trigger(scope)
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+
+        from pyinstrument import Profiler
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        profiler = Profiler(interval=settings.PROFILING_INTERVAL_SECONDS, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            session = profiler.stop()
+            route = scope.get("route")
+            meta = {
+                "method": scope["method"],
+                "path": scope["path"],
+                "query": scope.get("query_string", b"").decode("latin-1"),
+                "route": route.path if route is not None else scope["path"],
+                "status": status_code,
+                "trigger": trigger,
+            }
+            try:
+                await run_in_threadpool(save_profile, session, meta)
+            except Exception as e:
+                logger.error(f"Could not store profile of {scope['method']} {scope['path']}: {e}")
@@ -0,0 +1,83 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+from app.core.config import settings
+from app.utils.change_hooks import on_commit
+from app.utils.compression import CompressedBody
+from app.utils.fast_json import dumps
+from app.utils.metrics import cache_counters
+import threading
+import time
+
+# cache name -> ResponseCache, for stats
+_caches: Dict[str, "ResponseCache"] = {}
+
+class ResponseCache:
+    """
+    Rendered JSON bodies of public responses, keyed by request parameters.
+    Bodies are kept as CompressedBody, so their gzip/brotli encodings are
+    also computed once per entry.
+
+    Entries are dropped after any commit that writes to one of ``models``,
+    and expire after RESPONSE_CACHE_MAX_AGE_SECONDS so writes made by other
+    workers show up too. The least recently used entries are evicted beyond
+    RESPONSE_CACHE_MAX_ENTRIES. Safe to use from the event loop and the
+    threadpool at once (commit hooks clear it from threadpool threads).
+
+    Example:
+        _news_cache = ResponseCache("news", KagyurNews)
+
+        body = _news_cache.get_or_render(("list", page, limit, lang), lambda: build(...))
+        return CachedJSONResponse(body)
+    """
+    def __init__(self, name: str, *models):
+        self.name = name
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._hit_counter, self._miss_counter = cache_counters(name)
+        on_commit(*models)(self.clear)
+        _caches[name] = self
+
+    def get(self, key: Hashable) -> Optional[CompressedBody]:
+        """The cached body for ``key``, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            fresh = entry is not None and time.monotonic() - entry[0] < settings.RESPONSE_CACHE_MAX_AGE_SECONDS
+            if fresh:
+                self._entries.move_to_end(key)
+        if not fresh:
+            self.misses += 1
+            self._miss_counter.inc()
+            return None
+        self.hits += 1
+        self._hit_counter.inc()
+        return entry[1]
+
+    def put(self, key: Hashable, data: Any) -> CompressedBody:
+        """Render ``data`` to JSON, store it under ``key`` and return it"""
+        body = CompressedBody(dumps(data))
+        with self._lock:
+            self._entries[key] = (time.monotonic(), body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > settings.RESPONSE_CACHE_MAX_ENTRIES:
+                self._entries.popitem(last=False)
+        return body
+
+    def get_or_render(self, key: Hashable, build: Callable[[], Any]) -> CompressedBody:
+        """Return the cached body for ``key``, rendering ``build()`` on a miss"""
+        body = self.get(key)
+        if body is None:
+            body = self.put(key, build())
+        return body
+
+    def clear(self, tables=None) -> None:
+        with self._lock:
+            self._entries.clear()
+
+def get_response_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Per-cache entry count and hit/miss counters"""
+    return {
+        name: {"entries": len(cache._entries), "hits": cache.hits, "misses": cache.misses}
+        for name, cache in _caches.items()
+    }
@@ -0,0 +1,73 @@
+from pathlib import Path
+from typing import FrozenSet
+from sqlalchemy.engine import Engine
+from app.core.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+SCHEMA_STARTUP_MODES = ("check", "create", "skip")
+
+class SchemaVersionError(RuntimeError):
+    """The database is not at the migration head this code was written for"""
+
+def schema_startup_mode(engine: Engine) -> str:
+    """SCHEMA_STARTUP_MODE with "auto" resolved for ``engine``"""
+    mode = settings.SCHEMA_STARTUP_MODE.lower()
+    if mode == "auto":
+        return "create" if engine.dialect.name == "sqlite" else "check"
+    if mode not in SCHEMA_STARTUP_MODES:
+        raise ValueError(f"SCHEMA_STARTUP_MODE must be auto or one of {', '.join(SCHEMA_STARTUP_MODES)}, not {mode!r}")
+    return mode
+
+def expected_heads() -> FrozenSet[str]:
+    """Head revision(s) of the migration scripts shipped with this code"""
+    # Alembic is only needed when checking, so it is not imported at startup otherwise
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+    return frozenset(ScriptDirectory.from_config(Config(str(ALEMBIC_INI))).get_heads())
+
+def current_heads(engine: Engine) -> FrozenSet[str]:
+    """Revision(s) recorded in the database's alembic_version table (empty if none)"""
+    from alembic.runtime.migration import MigrationContext
+    with engine.connect() as conn:
+        return frozenset(MigrationContext.configure(conn).get_current_heads())
+
+def check_schema_version(engine: Engine) -> FrozenSet[str]:
+    """
+    Verify that the database has been migrated to the scripts' head.
+
+    One indexed read of alembic_version, instead of create_all's existence
+    check per table; it also never writes, so workers starting together
+    cannot race on DDL.
+
+    Raises:
+        SchemaVersionError: if the recorded revision differs from the head
+    """
+    expected = expected_heads()
+    current = current_heads(engine)
+    if current != expected:
+        raise SchemaVersionError(
+            f"Database schema is at {', '.join(sorted(current)) or 'no revision'}, "
+            f"this code expects {', '.join(sorted(expected))}: run `alembic upgrade head`"
+        )
+    return current
+
+def prepare_schema(engine: Engine) -> str:
+    """
+    Apply SCHEMA_STARTUP_MODE before serving: check the Alembic head,
+    create missing tables, or do nothing.
+
+    Returns:
+        str: the mode that was applied
+    """
+    mode = schema_startup_mode(engine)
+    if mode == "check":
+        revisions = check_schema_version(engine)
+        logger.info(f"Database schema at {', '.join(sorted(revisions))}")
+    elif mode == "create":
+        from app.models import Base
+        Base.metadata.create_all(bind=engine)
+    return mode
@@ -0,0 +1,114 @@
+from typing import Any, Callable, Dict, Optional, Sequence
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.utils.metrics import SINGLE_FLIGHT_EVENTS
+import asyncio
+import functools
+import inspect
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Arguments that differ per request but never change the result
+DEFAULT_EXCLUDED_ARGS = ("db", "current_user", "admin_user")
+
+# key -> future shared by every caller waiting on the same computation
+_in_flight: Dict[str, asyncio.Future] = {}
+
+# flight name -> {"calls", "coalesced", "errors", "timeouts", "takeovers"}
+_stats: Dict[str, Dict[str, int]] = {}
+
+class _LeaderCancelled(Exception):
+    """Set on a flight whose leader was cancelled (e.g. its client disconnected)"""
+
+def _record(name: str, counter: str) -> None:
+    counters = _stats.setdefault(name, {"calls": 0, "coalesced": 0, "errors": 0, "timeouts": 0, "takeovers": 0})
+    counters[counter] += 1
+    SINGLE_FLIGHT_EVENTS.labels(flight=name, event=counter).inc()
+
+def get_single_flight_stats() -> Dict[str, Dict[str, int]]:
+    """Per-flight counters: computations run, requests coalesced, errors, follower timeouts and takeovers"""
+    return {name: dict(counters) for name, counters in _stats.items()}
+
+def single_flight(
+    name: Optional[str] = None,
+    timeout: Optional[float] = None,
+    exclude: Sequence[str] = DEFAULT_EXCLUDED_ARGS
+):
+    """
+    Coalesce concurrent identical calls into one computation.
+
+    The first caller for a key (the leader) runs the function; callers that
+    arrive while it is running await the same result instead of repeating the
+    queries. Exceptions raised by the leader are re-raised in every waiter;
+    if the leader is cancelled instead, one waiter takes over and runs the
+    function. Waiters give up after ``timeout`` seconds with a 504.
+
+    The key is the flight name plus the bound arguments, minus ``exclude``
+    (sessions and users). Plain ``def`` functions run in the threadpool so the
+    event loop stays free to queue followers; the wrapper is always awaitable.
+    Return plain data (dicts, Pydantic models), never session-bound ORM objects,
+    since the result is shared across requests.
+
+    Example:
+        @single_flight("categories")
+        def _load_categories(lang, db):
+            ...
+
+        categories = await _load_categories(lang, db)
+    """
+    def decorator(func: Callable[..., Any]):
+        flight_name = name or func.__name__
+        signature = inspect.signature(func)
+        is_coroutine = inspect.iscoroutinefunction(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = repr((flight_name, [(arg, value) for arg, value in bound.arguments.items() if arg not in exclude]))
+
+            wait_seconds = timeout if timeout is not None else settings.SINGLE_FLIGHT_TIMEOUT_SECONDS
+            deadline = asyncio.get_running_loop().time() + wait_seconds
+            if key in _in_flight:
+                _record(flight_name, "coalesced")
+            while key in _in_flight:
+                try:
+                    remaining = max(deadline - asyncio.get_running_loop().time(), 0)
+                    return await asyncio.wait_for(asyncio.shield(_in_flight[key]), remaining)
+                except _LeaderCancelled:
+                    # The leader's request went away; the first follower to wake runs it instead
+                    _record(flight_name, "takeovers")
+                except asyncio.TimeoutError:
+                    _record(flight_name, "timeouts")
+                    logger.warning(f"Timed out after {wait_seconds}s waiting for in-flight {flight_name}")
+                    raise HTTPException(status_code=504, detail=f"Timed out waiting for {flight_name}")
+
+            future = asyncio.get_running_loop().create_future()
+            _in_flight[key] = future
+            _record(flight_name, "calls")
+            try:
+                if is_coroutine:
+                    result = await func(*args, **kwargs)
+                else:
+                    result = await run_in_threadpool(func, *args, **kwargs)
+            except asyncio.CancelledError:
+                # Never cancel the shared future: that would cancel every follower too
+                future.set_exception(_LeaderCancelled())
+                future.exception()
+                raise
+            except Exception as e:
+                _record(flight_name, "errors")
+                future.set_exception(e)
+                future.exception()  # Mark retrieved so asyncio doesn't warn when nobody waited
+                raise
+            else:
+                future.set_result(result)
+                return result
+            finally:
+                _in_flight.pop(key, None)
+
+        return wrapper
+
+    return decorator
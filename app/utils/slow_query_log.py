@@ -0,0 +1,193 @@
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Tuple
+from datetime import datetime
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.config import settings
+import logging
+import re
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Most recent slow statements of this worker, oldest dropped first
+_entries: Deque[dict] = deque(maxlen=settings.SLOW_QUERY_LOG_SIZE)
+
+# normalized SQL -> (monotonic time, plan); each statement shape is explained at most
+# once per SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS, later entries reuse the plan
+_plans: Dict[str, Tuple[float, Optional[str]]] = {}
+_plans_lock = threading.Lock()
+
+_APP_DIR = str(Path(__file__).resolve().parents[1])
+_UTILS_DIR = str(Path(_APP_DIR) / "utils")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = r"(?:\?|%s|%\(\w+\)s|:\w+)"
+_PLACEHOLDER_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+# Plan lines that can carry bound values (Postgres prints them as literals)
+_PLAN_CONDITION = re.compile(r"\b(?:Cond|Filter|Key):")
+
+# Statements EXPLAIN accepts; ANALYZE (Postgres) is only ever applied to reads
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+def normalize_sql(statement: str) -> str:
+    """
+    The statement's shape: literals become ``?``, placeholder lists (expanded
+    IN clauses) become ``(...)`` and whitespace is collapsed, so the same
+    query with different values normalizes to the same text.
+    """
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _PLACEHOLDER_LIST.sub("(...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+def params_shape(parameters, executemany: bool = False):
+    """Parameter names/positions and value types, never the values themselves"""
+    if executemany:
+        rows = list(parameters or [])
+        return {"rows": len(rows), "row": params_shape(rows[0]) if rows else None}
+    if isinstance(parameters, dict):
+        items = list(parameters.items())
+        if len(items) > 20:
+            return {"count": len(items), "types": sorted({type(value).__name__ for _, value in items})}
+        return {name: type(value).__name__ for name, value in items}
+    if isinstance(parameters, (list, tuple)):
+        if len(parameters) > 20:
+            return {"count": len(parameters), "types": sorted({type(value).__name__ for value in parameters})}
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__ if parameters is not None else None
+
+def redact_plan(plan: str) -> str:
+    """``plan`` with the literal values in its condition lines replaced by ``?``"""
+    lines = []
+    for line in plan.splitlines():
+        if _PLAN_CONDITION.search(line):
+            line = _NUMBER_LITERAL.sub("?", _STRING_LITERAL.sub("?", line))
+        lines.append(line)
+    return "\n".join(lines)
+
+def _calling_frames(limit: int = 8) -> List[str]:
+    """Application frames of the current stack, innermost first"""
+    frames = []
+    frame = sys._getframe(1)
+    while frame is not None and len(frames) < limit:
+        path = frame.f_code.co_filename
+        if path.startswith(_APP_DIR) and path != __file__:
+            frames.append((path, frame.f_lineno, frame.f_code.co_name))
+        frame = frame.f_back
+    return frames
+
+def _handler(frames) -> Optional[str]:
+    """
+    The innermost frame outside app/utils: the service, router or dependency
+    line that ran the statement, not the middleware or caching helpers
+    wrapped around it. Falls back to the innermost app frame.
+    """
+    for frame in frames:
+        if not frame[0].startswith(_UTILS_DIR):
+            return _format_frame(frame)
+    return _format_frame(frames[0]) if frames else None
+
+def _format_frame(frame) -> str:
+    path, line, function = frame
+    return f"{Path(path).relative_to(Path(_APP_DIR).parent)}:{line} {function}"
+
+def _explain(conn, statement: str, parameters) -> Optional[str]:
+    """
+    The plan of ``statement``, run on a separate cursor of the same connection
+    so it sees the same transaction. On Postgres it is wrapped in a savepoint,
+    so a failing EXPLAIN cannot abort the caller's transaction.
+    """
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    if operation not in _EXPLAINABLE:
+        return None
+
+    dialect = conn.dialect.name
+    cursor = conn.connection.cursor()
+    try:
+        if dialect == "sqlite":
+            cursor.execute("EXPLAIN QUERY PLAN " + statement, parameters)
+            return "\n".join(str(row[-1]) for row in cursor.fetchall())
+        if dialect == "postgresql":
+            analyze = settings.SLOW_QUERY_EXPLAIN_ANALYZE and operation in ("SELECT", "WITH")
+            cursor.execute("SAVEPOINT slow_query_explain")
+            try:
+                cursor.execute(("EXPLAIN (ANALYZE, BUFFERS) " if analyze else "EXPLAIN ") + statement, parameters)
+                plan = "\n".join(row[0] for row in cursor.fetchall())
+            except Exception:
+                cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                raise
+            cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+            return plan
+        return None
+    finally:
+        cursor.close()
+
+def _plan_for(conn, sql: str, statement: str, parameters) -> Optional[str]:
+    now = time.monotonic()
+    with _plans_lock:
+        cached = _plans.get(sql)
+        if cached is not None and now - cached[0] < settings.SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS:
+            return cached[1]
+        _plans[sql] = (now, None)  # Concurrent slow runs of the same shape don't all explain
+        if len(_plans) > 4 * settings.SLOW_QUERY_LOG_SIZE:
+            oldest = min(_plans, key=lambda key: _plans[key][0])
+            del _plans[oldest]
+    try:
+        plan = _explain(conn, statement, parameters)
+        if plan is not None:
+            plan = redact_plan(plan)
+    except Exception as e:
+        plan = f"EXPLAIN failed: {e}"
+    with _plans_lock:
+        _plans[sql] = (now, plan)
+    return plan
+
+def install_slow_query_log(engine: Engine) -> None:
+    """
+    Record statements on ``engine`` that take SLOW_QUERY_THRESHOLD_MS or
+    longer: normalized SQL, parameter shape, duration, calling handler and
+    the query plan, with the values Postgres prints into its condition
+    lines redacted. Statements under the threshold only pay for two clock
+    reads.
+    """
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._slow_query_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _record_slow(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_slow_query_started", None)
+        if started is None:
+            return
+        duration_ms = (time.perf_counter() - started) * 1000
+        if duration_ms < settings.SLOW_QUERY_THRESHOLD_MS:
+            return
+
+        sql = normalize_sql(statement)
+        frames = _calling_frames()
+        _entries.append({
+            "recorded_at": datetime.utcnow().isoformat(),
+            "duration_ms": round(duration_ms, 3),
+            "sql": sql,
+            "params_shape": params_shape(parameters, executemany),
+            "handler": _handler(frames),
+            "stack": [_format_frame(frame) for frame in frames],
+            "plan": None if executemany else _plan_for(conn, sql, statement, parameters),
+        })
+        logger.warning(f"Slow query ({duration_ms:.0f} ms) from {_handler(frames)}: {sql[:200]}")
+
+def get_slow_queries(limit: Optional[int] = None) -> List[dict]:
+    """Recorded slow statements of this worker, newest first"""
+    entries = list(_entries)[::-1]
+    return entries[:limit] if limit is not None else entries
+
+def clear_slow_queries() -> None:
+    _entries.clear()
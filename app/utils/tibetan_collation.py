@@ -0,0 +1,167 @@
+from typing import List, Optional, Tuple
+
+# Traditional alphabetical order of the 30 consonants (the root letter decides first)
+ALPHABET = "ཀཁགངཅཆཇཉཏཐདནཔཕབམཙཚཛཝཞཟའཡརལཤསཧཨ"
+_LETTER_RANK = {letter: rank for rank, letter in enumerate(ALPHABET, start=1)}
+_LETTER_RANK["ཪ"] = _LETTER_RANK["ར"]
+
+# Subjoined form of each letter (U+0F90-U+0FBC mirror U+0F40-U+0F6C), plus the fixed forms
+_SUBJOINED = {chr(ord(letter) + 0x50): letter for letter in ALPHABET}
+_SUBJOINED.update({"ྺ": "ཝ", "ྻ": "ཡ", "ྼ": "ར"})
+
+PREFIXES = "གདབམའ"
+SUPERSCRIPTS = "རལས"
+SUBSCRIPTS = "ཡརལཝཧ"  # ha only as in lha
+SUFFIXES = "གངདནབམའརལས"
+SECOND_SUFFIXES = "སད"
+
+# Vowel signs in dictionary order after the inherent a
+_VOWEL_RANK = {"ི": 1, "ྀ": 1, "ུ": 2, "ེ": 3, "ཻ": 4, "ོ": 5, "ཽ": 6}
+_IGNORED_MARKS = {"ཱ", "ཾ", "ྃ", "ཿ", "྄", "ྂ"}
+
+# Letters each prefix may stand before when no stack shows the root
+_PREFIX_ROOTS = {
+    "ག": set("ཅཉཏདནཙཞཟཡཤས"),
+    "ད": set("ཀགངཔབམ"),
+    "བ": set("ཀགཅཏདཙཞཟཤས"),
+    "མ": set("ཁགངཆཇཉཐདནཚཛ"),
+    "འ": set("ཁགཆཇཐདཕབཚཛ"),
+}
+
+_SEPARATORS = set("་༌།༎༏༐༑༔ \t\n")
+
+# Key for a missing or empty name: after every Tibetan key, so such rows sort
+# last without NULLs and the column stays usable for index-ordered scans
+MISSING_KEY = b"\xff"
+# Marks a syllable that is not a well-formed Tibetan syllable (Sanskrit, Latin, ...)
+_UNPARSED = 0xFE
+
+class _Unit:
+    """One written letter with whatever is stacked under or above it"""
+    __slots__ = ("letter", "subjoined", "vowel")
+
+    def __init__(self, letter: str):
+        self.letter = letter
+        self.subjoined: List[str] = []
+        self.vowel = 0
+
+    @property
+    def marked(self) -> bool:
+        return bool(self.subjoined) or self.vowel > 0
+
+def _units(syllable: str) -> Optional[List[_Unit]]:
+    units: List[_Unit] = []
+    for char in syllable:
+        if char in _LETTER_RANK:
+            units.append(_Unit(char))
+        elif not units:
+            return None
+        elif char in _SUBJOINED:
+            units[-1].subjoined.append(_SUBJOINED[char])
+        elif char in _VOWEL_RANK:
+            units[-1].vowel = _VOWEL_RANK[char]
+        elif char not in _IGNORED_MARKS:
+            return None
+    return units or None
+
+def _syllable_key(syllable: str) -> Optional[Tuple[int, ...]]:
+    """
+    (root, prefix/superscript class, subscripts, vowel, suffix, second suffix)
+    for one syllable, or None if it does not parse as Tibetan.
+    """
+    units = _units(syllable)
+    if units is None:
+        return None
+
+    # Genitive and similar particles written onto the syllable: ཀའི, ཀའོ, ཀའམ
+    particle = 0
+    if len(units) > 1 and units[-1].letter == "འ" and units[-1].vowel:
+        particle = units.pop().vowel
+    elif len(units) > 2 and units[-2].letter == "འ" and units[-1].letter in "མང" and not units[-1].marked:
+        particle = 8 + "མང".index(units[-1].letter)
+        units = units[:-2]
+
+    # The root stack is the first unit with a subscript, superscript or vowel;
+    # otherwise the second letter if the first is a prefix that fits it, else the first
+    stack_index = next((i for i, unit in enumerate(units) if unit.marked), None)
+    if stack_index is None:
+        first = units[0].letter
+        stack_index = 1 if len(units) > 2 and units[1].letter in _PREFIX_ROOTS.get(first, ()) else 0
+    if stack_index > 1 or len(units) - stack_index > 3:
+        return None
+
+    prefix = units[0].letter if stack_index == 1 else None
+    if prefix is not None and prefix not in PREFIXES:
+        return None
+    stack = units[stack_index]
+    letters = [stack.letter] + stack.subjoined
+
+    superscript = None
+    if len(letters) > 1 and letters[0] in SUPERSCRIPTS + "ཪ" and letters[1] not in SUBSCRIPTS:
+        superscript = "ར" if letters[0] == "ཪ" else letters[0]
+        letters = letters[1:]
+    root, subscripts = letters[0], letters[1:]
+    if len(subscripts) > 2 or any(letter not in SUBSCRIPTS for letter in subscripts):
+        return None
+
+    if superscript is None:
+        preroot = PREFIXES.index(prefix) + 1 if prefix else 0
+    elif prefix is None:
+        preroot = 6 + SUPERSCRIPTS.index(superscript)
+    else:
+        preroot = 9 + PREFIXES.index(prefix) * 3 + SUPERSCRIPTS.index(superscript)
+
+    subscript = 0
+    for letter in subscripts:
+        subscript = subscript * 6 + SUBSCRIPTS.index(letter) + 1
+
+    suffixes = units[stack_index + 1:]
+    if any(unit.marked for unit in suffixes):
+        return None
+    suffix = SUFFIXES.index(suffixes[0].letter) + 1 if suffixes and suffixes[0].letter in SUFFIXES else 0
+    second = SECOND_SUFFIXES.index(suffixes[1].letter) + 1 if len(suffixes) > 1 and suffixes[1].letter in SECOND_SUFFIXES else 0
+    if suffixes and not suffix or len(suffixes) > 1 and not second:
+        return None
+    if particle and not suffixes:
+        # ཀའི files right after ཀའ
+        suffix = SUFFIXES.index("འ") + 1
+
+    return (_LETTER_RANK[root], preroot, subscript, stack.vowel, suffix, second * 16 + particle)
+
+def _syllables(text: str) -> List[str]:
+    syllables, current = [], []
+    for char in text:
+        if char in _SEPARATORS or "༄" <= char <= "༒" and char != "་":
+            if current:
+                syllables.append("".join(current))
+                current = []
+        else:
+            current.append(char)
+    if current:
+        syllables.append("".join(current))
+    return syllables
+
+def tibetan_sort_key(text: Optional[str]) -> bytes:
+    """
+    Binary sort key putting Tibetan text in traditional dictionary order:
+    syllable by syllable, by root letter, then bare, prefixed, superscribed
+    and prefixed-superscribed forms, then subscripts, vowel and suffixes
+    (ཀ < ཀྱ < དཀ < བཀྲ < རྐ < སྐ < བསྐ; ཀ < ཀག < ཀི).
+
+    Keys compare bytewise (bytea/BLOB order), so an indexed column holding
+    them gives Tibetan ordering without a database collation. Syllables that
+    are not standard Tibetan (e.g. Sanskrit stacks) sort after regular ones
+    by code point.
+    """
+    if not text or not text.strip():
+        return MISSING_KEY
+    key = bytearray()
+    for syllable in _syllables(text.strip()):
+        parsed = _syllable_key(syllable)
+        if parsed is None:
+            key.append(_UNPARSED)
+            key += syllable.encode("utf-8")
+            key.append(0)
+        else:
+            key += bytes(parsed)
+    return bytes(key) or MISSING_KEY
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark: response serialization cost per endpoint, FastAPI default vs FastJSONRoute
+
+Runs the real handlers once against an in-memory SQLite catalog, then times only
+the step from handler return value to response body: FastAPI's response_model
+validation + jsonable_encoder + JSONResponse, against FastJSONRoute.render
+(validate at most once, orjson).
+
+Usage:
+    python benchmarks/json_rendering.py [--texts 100] [--iterations 300]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import SessionLocal
+from app.models import Base, MainCategory, SubCategory, KagyurText, TextSummary, YesheDESpan, Volume, Sermon, KagyurNews
+from app.schemas import KagyurTextResponse, TextsListResponse, MainCategoryWithSubCategories
+from app.services.text_service.loadingProfiles import text_loading_options
+from app.services.text_service.handleFetchTexts import handle_fetch_texts
+from app.services.category_service.getCategoriesHandler import build_category_tree
+from app.services.news_service.handleGetNews import handle_get_news
+from app.utils.fast_json import FastJSONRoute
+
+def build_database(texts: int):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    SessionLocal.configure(bind=engine)  # Commit hooks (lookup registry refresh) read this database too
+    db = sessionmaker(bind=engine)()
+
+    sermon = Sermon(name_english="First Turning", name_tibetan="ཆོས་འཁོར་དང་པོ།")
+    db.add(sermon)
+    for c in range(10):
+        category = MainCategory(name_english=f"Category {c}", name_tibetan="འདུལ་བ།", description_english="About " * 20)
+        db.add(category)
+        for s in range(5):
+            db.add(SubCategory(name_english=f"Sub {c}.{s}", name_tibetan="གཞི།", main_category=category))
+    db.flush()
+
+    sub_category_id = db.query(SubCategory.id).first()[0]
+    for i in range(texts):
+        text = KagyurText(
+            sub_category_id=sub_category_id, derge_id=f"D{i}", yeshe_de_id=f"Y{i}", order_index=i,
+            tibetan_title="འདུལ་བ་གཞི།", english_title=f"Text {i}", sermon_id=sermon.id
+        )
+        db.add(text)
+        db.flush()
+        db.add(TextSummary(text_id=text.id, purpose_english="Purpose " * 50, purpose_tibetan="དགོས་པ། " * 50))
+        span = YesheDESpan(text_id=text.id)
+        db.add(span)
+        db.flush()
+        for v in range(3):
+            db.add(Volume(yeshe_de_span_id=span.id, volume_number=str(v + 1), start_page="1a", end_page="20b", order_index=v))
+
+    for n in range(20):
+        db.add(KagyurNews(
+            tibetan_title="གསར་འགྱུར།", english_title=f"News {n}", tibetan_content="བོད། " * 200,
+            english_content="Content " * 200, publication_status="published", published_date=datetime(2024, 1, n + 1)
+        ))
+    db.commit()
+    return db, sub_category_id
+
+def endpoint():
+    pass
+
+def run_sync(coroutine):
+    """Drive a coroutine that never suspends, without event loop overhead"""
+    try:
+        coroutine.send(None)
+    except StopIteration as done:
+        return done.value
+    raise RuntimeError("coroutine suspended")
+
+def time_ms(fn, iterations: int) -> float:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--texts", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=300)
+    args = parser.parse_args()
+
+    db, sub_category_id = build_database(args.texts)
+    text_id = db.query(KagyurText.id).first()[0]
+    text = db.query(KagyurText).options(*text_loading_options("detail")).filter(KagyurText.id == text_id).first()
+
+    # (endpoint, handler return value, response_model); /categories/ answers with a
+    # cached, prerendered response, so its case renders the uncached tree instead
+    cases = [
+        ("GET /texts/{id}", text, KagyurTextResponse),
+        ("GET .../texts/ (100)", asyncio.run(handle_fetch_texts(db=db, limit=args.texts, sub_category_id=sub_category_id)), TextsListResponse),
+        ("GET /categories/", build_category_tree(lang="en", db=db), List[MainCategoryWithSubCategories]),
+        ("GET /news", asyncio.run(handle_get_news(page=1, limit=20, lang=None, db=db)), None),
+    ]
+
+    print(f"{'endpoint':<24}{'bytes':>10}{'fastapi ms':>12}{'fast ms':>10}{'speedup':>9}")
+    slower = 0
+    for name, content, response_model in cases:
+        default_route = APIRoute("/", endpoint, response_model=response_model)
+        fast_route = FastJSONRoute("/", endpoint, response_model=response_model)
+
+        def default_render():
+            body = run_sync(serialize_response(field=default_route.response_field, response_content=content, is_coroutine=True))
+            return JSONResponse(body).body
+
+        def fast_render():
+            return fast_route.render(content).body
+
+        baseline = time_ms(default_render, args.iterations)
+        fast = time_ms(fast_render, args.iterations)
+        slower += fast >= baseline
+        print(f"{name:<24}{len(fast_render()):>10}{baseline:>12.3f}{fast:>10.3f}{baseline / fast:>8.1f}x")
+
+    db.close()
+    return 1 if slower else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,25 @@
+"""
+Benchmark: end-to-end load against a synthetic Kangyur-scale catalog
+
+Builds a deterministic dataset (categories, ~1,100 texts by default with
+summaries, Yeshe De spans, volumes and audio, plus news, videos, users and
+audit logs), then replays a fixed, seeded request sequence through the ASGI
+app in-process with concurrent clients, and reports throughput and
+p50/p95/p99 latency per scenario. The same arguments send the same requests
+on every commit, so reports (``--json``) can be compared across commits.
+
+Compare runs with the same arguments only, on the same machine. Keep
+``--concurrency`` within the database pool (pool_size + max_overflow, 15 by
+default): beyond it, an ``async def`` endpoint that queries from the event
+loop can block the loop waiting for a connection that only the loop can
+release, and requests stall until the pool timeout.
+
+The dataset is built once per (texts, seed, migration head) into
+``--data-dir`` and copied for each run, so writes never leak between runs.
+
+Usage:
+    python -m benchmarks.load [--texts 1100] [--requests 3000] [--concurrency 8]
+                              [--warmup 300] [--groups public,admin] [--seed 0]
+                              [--json report.json] [--compare baseline.json]
+                              [--data-dir DIR]
+"""
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Entry point of ``python -m benchmarks.load``; see the package docstring"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.load import __doc__ as usage
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=project_root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def main():
+    parser = argparse.ArgumentParser(description=usage, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--texts", type=int, default=1100, help="Texts in the synthetic catalog")
+    parser.add_argument("--requests", type=int, default=3000, help="Measured requests")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent clients")
+    parser.add_argument("--warmup", type=int, default=300, help="Unmeasured requests sent first")
+    parser.add_argument("--groups", default="public,admin", help="Scenario groups: public, admin, write")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the dataset and the request sequence")
+    parser.add_argument("--json", dest="json_path", help="Also write the report as JSON to this file")
+    parser.add_argument("--compare", help="A previous --json report to show relative changes against")
+    parser.add_argument("--data-dir", default=str(Path(tempfile.gettempdir()) / "kangyur-load-bench"),
+                        help="Where built datasets are kept between runs")
+    args = parser.parse_args()
+    groups = tuple(g.strip() for g in args.groups.split(",") if g.strip())
+
+    # The app (and the dataset module, through the models) reads its configuration
+    # at import, so everything is set up before importing any of it
+    work_dir = Path(tempfile.mkdtemp(prefix="kangyur-load-"))
+    run_db = work_dir / "bench.db"
+    os.environ["DATABASE_URL"] = f"sqlite:///{run_db}"
+    os.environ["SCHEMA_STARTUP_MODE"] = "skip"
+    for name in ("EXPORT_BUNDLE_DIR", "OPENAPI_CACHE_DIR", "PROFILING_DIR", "PRERENDER_DIR"):
+        os.environ[name] = str(work_dir / name.lower())
+
+    from app.utils.schema_startup import expected_heads
+    data_dir = Path(args.data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    cached_db = data_dir / f"kangyur-{args.texts}-{args.seed}-{'+'.join(sorted(expected_heads()))}.db"
+    if cached_db.exists():
+        shutil.copyfile(cached_db, run_db)
+
+    import main as app_main
+    from app.core.security import create_access_token
+    from app.database import SessionLocal, engine
+    from app.models import Base, User
+    from benchmarks.load.dataset import ADMIN_USERNAME, build_dataset, dataset_ids
+    from benchmarks.load.runner import format_comparison, format_report, plan_requests, run_load, summarize
+    from benchmarks.load.scenarios import select_scenarios
+
+    try:
+        scenarios = select_scenarios(groups)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if not cached_db.exists():
+        print(f"Building dataset with {args.texts} texts (seed {args.seed})...")
+        started = time.perf_counter()
+        Base.metadata.create_all(bind=engine)
+        with SessionLocal() as db:
+            counts = build_dataset(db, args.texts, args.seed)
+        engine.dispose()
+        shutil.copyfile(run_db, cached_db)
+        print(f"  {counts} in {time.perf_counter() - started:.1f}s, kept as {cached_db}")
+
+    with SessionLocal() as db:
+        ids = dataset_ids(db)
+        admin = db.query(User).filter(User.username == ADMIN_USERNAME).one()
+        token = create_access_token({"id": admin.id, "username": admin.username, "email": admin.email, "is_admin": True})
+    admin_headers = [(b"authorization", f"Bearer {token}".encode())]
+
+    planned = plan_requests(scenarios, ids, args.warmup + args.requests, args.seed)
+
+    async def run():
+        await app_main.app.router.startup()
+        try:
+            await run_load(app_main.app, planned[:args.warmup], args.concurrency, admin_headers)
+            return await run_load(app_main.app, planned[args.warmup:], args.concurrency, admin_headers)
+        finally:
+            await app_main.app.router.shutdown()
+
+    result = asyncio.run(run())
+    summary = summarize(result)
+    commit = _git_commit()
+
+    print(f"\ncommit {commit}, {args.texts} texts, groups {','.join(groups)}, "
+          f"{args.requests} requests, concurrency {args.concurrency}, {result.wall_seconds:.2f}s")
+    print(format_report(summary))
+    if summary["error_statuses"]:
+        print(f"\nError statuses: {summary['error_statuses']}")
+    if args.compare:
+        print()
+        print(format_comparison(summary, json.loads(Path(args.compare).read_text())))
+
+    if args.json_path:
+        report = {
+            "commit": commit,
+            "python": platform.python_version(),
+            "args": {k: v for k, v in vars(args).items() if k not in ("json_path", "compare", "data_dir")},
+            "wall_seconds": round(result.wall_seconds, 3),
+            **summary,
+        }
+        Path(args.json_path).write_text(json.dumps(report, indent=2))
+        print(f"\nReport written to {args.json_path}")
+
+    engine.dispose()
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
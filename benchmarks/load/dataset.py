@@ -0,0 +1,217 @@
+"""
+Synthetic Kangyur-scale catalog.
+
+Everything goes through the ORM, so the model hooks that fill sort keys,
+catalog numbers, folio positions and the change log run exactly as they do
+for writes through the API; category counters are recomputed at the end.
+The same ``texts`` and ``seed`` always produce the same rows.
+"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.security import hash_password
+from app.models import (
+    MainCategory, SubCategory, Sermon, Yana, TranslationType, KagyurText, TextSummary, YesheDESpan, Volume,
+    KagyurAudio, KagyurNews, KagyurVideo, Edition, User, AuditLog
+)
+from app.utils.counters import recount_counters
+
+# Divisions of the Derge Kangyur, with their relative size
+DIVISIONS = (
+    ("Vinaya", "འདུལ་བ།", 4),
+    ("Prajñāpāramitā", "ཤེར་ཕྱིན།", 7),
+    ("Avataṃsaka", "ཕལ་ཆེན།", 1),
+    ("Ratnakūṭa", "དཀོན་བརྩེགས།", 5),
+    ("Sūtra", "མདོ་སྡེ།", 30),
+    ("Tantra", "རྒྱུད།", 40),
+    ("Nyingma Tantra", "རྙིང་རྒྱུད།", 4),
+    ("Kālacakra", "དུས་འཁོར།", 1),
+    ("Dhāraṇī", "གཟུངས་འདུས།", 8),
+)
+
+SYLLABLES = (
+    "འཕགས", "པ", "ཤེས", "རབ", "ཀྱི", "ཕ", "རོལ", "ཏུ", "ཕྱིན", "མདོ", "རྒྱུད", "ཆེན", "པོ", "གཟུངས", "བཀའ",
+    "དཀོན", "མཆོག", "སྤྲིན", "ཐེག", "ཆོས", "རྒྱལ", "བྱང", "ཆུབ", "སེམས", "དཔའ", "ལུང", "རྣམ", "འབྱེད",
+    "དུས", "འཁོར", "སངས", "རྒྱས", "དམ", "ཚིག", "གསང", "སྔགས", "ཡེ", "དཔལ", "བདེ", "མཆོག", "ཟླ", "འོད",
+)
+
+WORDS = (
+    "teaching", "buddha", "bodhisattva", "wisdom", "compassion", "sutra", "dharani", "tantra", "vow",
+    "discipline", "emptiness", "mind", "liberation", "assembly", "question", "king", "light", "jewel",
+)
+
+ADMIN_USERNAME = "bench-admin"
+ADMIN_PASSWORD = "bench-admin"
+
+@dataclass
+class DatasetIds:
+    """Ids and keys the load scenarios pick from"""
+    sub_categories: List[Tuple[int, int]] = field(default_factory=list)  # (category_id, sub_category_id)
+    texts: List[Tuple[int, int, int]] = field(default_factory=list)  # (category_id, sub_category_id, text_id)
+    derge_ids: List[str] = field(default_factory=list)
+    derge_numbers: List[int] = field(default_factory=list)
+    folios: List[Tuple[int, str]] = field(default_factory=list)  # (volume, page)
+    news: List[int] = field(default_factory=list)
+    audio: List[int] = field(default_factory=list)
+    videos: List[int] = field(default_factory=list)
+    editions: List[int] = field(default_factory=list)
+    sermons: List[int] = field(default_factory=list)
+    title_words: List[str] = field(default_factory=lambda: list(WORDS))
+
+def _tibetan(rng: random.Random, low: int, high: int) -> str:
+    return "་".join(rng.choice(SYLLABLES) for _ in range(rng.randint(low, high))) + "།"
+
+def _english(rng: random.Random, low: int, high: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(low, high))).capitalize()
+
+def _paragraph(rng: random.Random) -> str:
+    return ". ".join(_english(rng, 8, 16) for _ in range(rng.randint(2, 5))) + "."
+
+def build_dataset(db: Session, texts: int, seed: int = 0, batch_size: int = 500) -> Dict[str, int]:
+    """
+    Fill an empty schema with ``texts`` texts (with summaries, Yeshe De
+    spans, volumes and audio) across the Kangyur divisions, plus lookups,
+    news, videos, editions, users and audit logs in proportion.
+
+    Returns:
+        dict: Rows created per kind
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+
+    sermons = [Sermon(name_english=f"{n} Turning", name_tibetan=t, order_index=i)
+               for i, (n, t) in enumerate((("First", "ཆོས་འཁོར་དང་པོ།"), ("Second", "ཆོས་འཁོར་བར་པ།"), ("Third", "ཆོས་འཁོར་ཐ་མ།")))]
+    yanas = [Yana(name_english=n, name_tibetan=t, order_index=i)
+             for i, (n, t) in enumerate((("Śrāvakayāna", "ཉན་ཐོས་ཀྱི་ཐེག་པ།"), ("Mahāyāna", "ཐེག་པ་ཆེན་པོ།"), ("Vajrayāna", "རྡོ་རྗེ་ཐེག་པ།")))]
+    translation_types = [TranslationType(name_english=n, name_tibetan=t, order_index=i)
+                         for i, (n, t) in enumerate((("Early", "སྔ་འགྱུར།"), ("Later", "ཕྱི་འགྱུར།"), ("Revised", "བཅོས་བསྒྱུར།")))]
+    db.add_all(sermons + yanas + translation_types)
+
+    sub_categories = []
+    total_weight = sum(weight for _, _, weight in DIVISIONS)
+    for order, (name, tibetan, weight) in enumerate(DIVISIONS):
+        category = MainCategory(
+            name_english=name, name_tibetan=tibetan, order_index=order,
+            description_english=_paragraph(rng), description_tibetan=_tibetan(rng, 20, 40)
+        )
+        db.add(category)
+        for s in range(max(1, round(12 * weight / total_weight))):
+            sub_category = SubCategory(
+                main_category=category, name_english=f"{name} {s + 1}", name_tibetan=_tibetan(rng, 2, 4),
+                order_index=s, description_english=_paragraph(rng)
+            )
+            db.add(sub_category)
+            sub_categories.append((sub_category, weight))
+    db.flush()
+    lookup_ids = ([s.id for s in sermons], [y.id for y in yanas], [t.id for t in translation_types])
+
+    # Texts in Derge order; the divisions' weights decide how many land in each
+    assignments = sorted(rng.choices([s.id for s, _ in sub_categories], weights=[w for _, w in sub_categories], k=texts))
+    volume, folio = 1, 1
+    counts = {"texts": 0, "spans": 0, "volumes": 0, "audio": 0}
+    for number, sub_category_id in enumerate(assignments, start=1):
+        derge_id = f"D{number}" + ("a" if rng.random() < 0.03 else "")
+        text = KagyurText(
+            sub_category_id=sub_category_id, derge_id=derge_id, yeshe_de_id=str(number),
+            tibetan_title=_tibetan(rng, 3, 12), english_title=_english(rng, 3, 9),
+            sanskrit_title=_english(rng, 2, 6), chinese_title=None, order_index=number,
+            sermon_id=rng.choice(lookup_ids[0]), yana_id=rng.choice(lookup_ids[1]),
+            translation_type_id=rng.choice(lookup_ids[2]), is_active=rng.random() > 0.02
+        )
+        text.text_summary = TextSummary(
+            translator_homage_english=_paragraph(rng), purpose_english=_paragraph(rng),
+            text_summary_english=_paragraph(rng), text_summary_tibetan=_tibetan(rng, 30, 80),
+            keyword_and_meaning_english=_paragraph(rng), relation_english=_paragraph(rng),
+            question_and_answer_english=_paragraph(rng), translator_notes_english=_paragraph(rng)
+        )
+        for _ in range(1 if rng.random() < 0.8 else 2):
+            span = YesheDESpan()
+            text.yeshe_de_spans.append(span)
+            counts["spans"] += 1
+            for _ in range(rng.randint(1, 3)):
+                length = rng.randint(1, 60)
+                span.volumes.append(Volume(
+                    volume_number=str(volume), start_page=f"{folio}{'ab'[rng.randint(0, 1)]}",
+                    end_page=f"{folio + length}{'ab'[rng.randint(0, 1)]}"
+                ))
+                counts["volumes"] += 1
+                folio += length + 1
+                if folio > 300:
+                    volume, folio = volume + 1, 1
+        if rng.random() < 0.3:
+            for order in range(rng.randint(1, 2)):
+                text.audio_files.append(KagyurAudio(
+                    audio_url=f"https://example.org/audio/{number}-{order}.mp3", file_name=f"{number}-{order}.mp3",
+                    file_size=rng.randint(2, 80) * 10**6, duration=rng.randint(300, 7200),
+                    narrator_name_english=_english(rng, 2, 3), audio_language=rng.choice(("bo", "en")),
+                    order_index=order, created_at=now, updated_at=now
+                ))
+                counts["audio"] += 1
+        db.add(text)
+        counts["texts"] += 1
+        if number % batch_size == 0:
+            db.commit()
+            db.expunge_all()
+    db.commit()
+
+    for i in range(max(50, texts // 5)):
+        published = rng.random() < 0.8
+        db.add(KagyurNews(
+            english_title=_english(rng, 4, 10), tibetan_title=_tibetan(rng, 4, 10),
+            english_content=_paragraph(rng) * 3, tibetan_content=_tibetan(rng, 60, 200),
+            publication_status="published" if published else "draft",
+            published_date=now - timedelta(days=i) if published else None
+        ))
+    for i in range(max(20, texts // 20)):
+        db.add(KagyurVideo(
+            english_title=_english(rng, 4, 10), tibetan_title=_tibetan(rng, 4, 10),
+            english_description=_paragraph(rng), video_url=f"https://example.org/video/{i}",
+            publication_status="published", published_date=now - timedelta(days=i)
+        ))
+    for i, name in enumerate(("Derge", "Lhasa", "Narthang", "Peking", "Cone", "Urga")):
+        db.add(Edition(name_english=name, name_tibetan=_tibetan(rng, 1, 3), abbreviation=name[0],
+                       publication_year=1700 + 20 * i, total_volumes=100 + i, order_index=i))
+
+    admin = User(username=ADMIN_USERNAME, email="bench-admin@example.org",
+                 hashed_password=hash_password(ADMIN_PASSWORD), is_admin=True, is_active=True)
+    db.add(admin)
+    users = [admin] + [
+        User(username=f"user{i}", email=f"user{i}@example.org", hashed_password=admin.hashed_password, is_active=True)
+        for i in range(50)
+    ]
+    db.add_all(users[1:])
+    db.flush()
+    for i in range(max(1000, texts)):
+        db.add(AuditLog(
+            user_id=rng.choice(users).id, table_name=rng.choice(("kagyur_texts", "kagyur_news", "kagyur_audio")),
+            record_id=rng.randint(1, texts), action=rng.choice(("CREATE", "UPDATE", "DELETE")),
+            new_values="{}", timestamp=now - timedelta(minutes=i), ip_address="127.0.0.1"
+        ))
+    recount_counters(db)
+    db.commit()
+    return counts
+
+def dataset_ids(db: Session) -> DatasetIds:
+    """Read back what the scenarios need from a built dataset"""
+    ids = DatasetIds()
+    ids.sub_categories = [
+        tuple(row) for row in db.query(SubCategory.main_category_id, SubCategory.id).filter(SubCategory.is_active == True)
+    ]
+    ids.texts = [
+        tuple(row) for row in db.query(SubCategory.main_category_id, KagyurText.sub_category_id, KagyurText.id)
+            .join(SubCategory, SubCategory.id == KagyurText.sub_category_id).filter(KagyurText.is_active == True)
+    ]
+    ids.derge_ids = [row[0] for row in db.query(KagyurText.derge_id).filter(KagyurText.is_active == True)]
+    ids.derge_numbers = [row[0] for row in db.query(KagyurText.derge_no).filter(KagyurText.derge_no.isnot(None))]
+    ids.folios = [(row[0], row[1]) for row in db.query(Volume.volume_no, Volume.start_page).limit(5000)]
+    ids.news = [row[0] for row in db.query(KagyurNews.id).filter(KagyurNews.publication_status == "published")]
+    ids.audio = [row[0] for row in db.query(KagyurAudio.id)]
+    ids.videos = [row[0] for row in db.query(KagyurVideo.id)]
+    ids.editions = [row[0] for row in db.query(Edition.id)]
+    ids.sermons = [row[0] for row in db.query(Sermon.id)]
+    return ids
@@ -0,0 +1,156 @@
+"""
+Concurrent in-process load: simulated clients call the ASGI app directly
+(no sockets, no HTTP client library), so the numbers measure the app, its
+middleware and the database, and nothing else.
+"""
+
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from benchmarks.load.dataset import DatasetIds
+from benchmarks.load.scenarios import Request, Scenario
+
+@dataclass
+class Sample:
+    scenario: str
+    status: int
+    seconds: float
+
+@dataclass
+class LoadResult:
+    samples: List[Sample] = field(default_factory=list)
+    wall_seconds: float = 0.0
+    concurrency: int = 0
+
+async def call_asgi(app, method: str, url: str, body: Optional[dict] = None, headers: Sequence[Tuple[bytes, bytes]] = ()) -> Tuple[int, bytes]:
+    """Run one HTTP request through ``app`` and return (status, body)"""
+    parts = urlsplit(url)
+    payload = json.dumps(body).encode() if body is not None else b""
+    request_headers = [(b"host", b"bench"), *headers]
+    if body is not None:
+        request_headers += [(b"content-type", b"application/json"), (b"content-length", str(len(payload)).encode())]
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method, "scheme": "http",
+        "path": parts.path, "raw_path": parts.path.encode(), "query_string": parts.query.encode(), "root_path": "",
+        "headers": request_headers, "client": ("127.0.0.1", 50000), "server": ("bench", 80),
+    }
+    response_complete = asyncio.Event()
+    request_sent = False
+    status = 500
+    chunks: List[bytes] = []
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": payload, "more_body": False}
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_complete.set()
+
+    await app(scope, receive, send)
+    return status, b"".join(chunks)
+
+def plan_requests(scenarios: Sequence[Scenario], ids: DatasetIds, count: int, seed: int) -> List[Tuple[str, Request]]:
+    """The whole request sequence, fixed by ``seed`` so runs on different commits send the same requests"""
+    rng = random.Random(seed)
+    picks = rng.choices(scenarios, weights=[s.weight for s in scenarios], k=count)
+    return [(scenario.name, scenario.build(rng, ids)) for scenario in picks]
+
+async def run_load(
+    app,
+    planned: List[Tuple[str, Request]],
+    concurrency: int,
+    admin_headers: Sequence[Tuple[bytes, bytes]] = (),
+    accept_encoding: bytes = b"gzip, br"
+) -> LoadResult:
+    """Send ``planned`` through ``concurrency`` clients that each take the next request as soon as they are free"""
+    headers = [(b"accept-encoding", accept_encoding), *admin_headers]
+    queue = iter(planned)
+    result = LoadResult(concurrency=concurrency)
+
+    async def client():
+        for name, (method, url, body) in queue:
+            started = time.perf_counter()
+            try:
+                status, _ = await call_asgi(app, method, url, body, headers)
+            except Exception:
+                status = 599  # Raised out of the app instead of becoming a response
+            result.samples.append(Sample(name, status, time.perf_counter() - started))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    result.wall_seconds = time.perf_counter() - started
+    return result
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+def _summary(samples: Sequence[Sample], wall_seconds: float) -> Dict[str, float]:
+    latencies = sorted(s.seconds * 1000 for s in samples)
+    return {
+        "requests": len(samples),
+        "errors": sum(1 for s in samples if s.status >= 400),
+        "throughput_rps": round(len(samples) / wall_seconds, 1) if wall_seconds else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p95_ms": round(percentile(latencies, 0.95), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+        "max_ms": round(latencies[-1], 3) if latencies else 0.0,
+    }
+
+def summarize(result: LoadResult) -> Dict[str, object]:
+    """Overall and per-scenario request counts, errors, throughput and latency percentiles"""
+    by_scenario: Dict[str, List[Sample]] = {}
+    for sample in result.samples:
+        by_scenario.setdefault(sample.scenario, []).append(sample)
+    return {
+        "overall": _summary(result.samples, result.wall_seconds),
+        # Per-scenario throughput is its share of the run's requests per second
+        "scenarios": {name: _summary(samples, result.wall_seconds) for name, samples in sorted(by_scenario.items())},
+        "error_statuses": sorted({s.status for s in result.samples if s.status >= 400}),
+    }
+
+def format_report(summary: Dict[str, object]) -> str:
+    lines = [f"{'scenario':<22}{'requests':>9}{'errors':>8}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"]
+    rows = list(summary["scenarios"].items()) + [("TOTAL", summary["overall"])]
+    for name, stats in rows:
+        lines.append(
+            f"{name:<22}{stats['requests']:>9}{stats['errors']:>8}{stats['throughput_rps']:>9.1f}"
+            f"{stats['p50_ms']:>9.2f}{stats['p95_ms']:>9.2f}{stats['p99_ms']:>9.2f}"
+        )
+    return "\n".join(lines)
+
+def format_comparison(summary: Dict[str, object], baseline: Dict[str, object]) -> str:
+    """Throughput and latency of ``summary`` next to a previous ``--json`` report, as relative change"""
+    def change(new: float, old: float) -> str:
+        return f"{(new - old) / old * 100:+7.1f}%" if old else "      -"
+
+    lines = [f"Against commit {baseline.get('commit', 'unknown')}:",
+             f"{'scenario':<22}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}"]
+    rows = list(summary["scenarios"].items()) + [("TOTAL", summary["overall"])]
+    for name, stats in rows:
+        old = baseline["overall"] if name == "TOTAL" else baseline["scenarios"].get(name)
+        if old is None:
+            continue
+        lines.append(
+            f"{name:<22} {change(stats['throughput_rps'], old['throughput_rps'])} {change(stats['p50_ms'], old['p50_ms'])}"
+            f" {change(stats['p95_ms'], old['p95_ms'])} {change(stats['p99_ms'], old['p99_ms'])}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,82 @@
+"""
+The request mix: what each simulated client sends, and how often.
+
+Weights roughly follow a reader session (category tree, a text list, a few
+text details, search) for "public"; "admin" is the CMS reading its lists and
+dashboard; "write" edits texts, which also invalidates the public caches.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+from benchmarks.load.dataset import DatasetIds
+
+# (method, url, json body)
+Request = Tuple[str, str, Optional[dict]]
+
+GROUPS = ("public", "admin", "write")
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    group: str
+    weight: int
+    build: Callable[[random.Random, DatasetIds], Request]
+
+def _get(url: str) -> Request:
+    return "GET", url, None
+
+def _text_list(rng: random.Random, ids: DatasetIds) -> Request:
+    category_id, sub_category_id = rng.choice(ids.sub_categories)
+    lang = rng.choice(("en", "tb"))
+    sort = "&sort=tibetan" if rng.random() < 0.2 else ""
+    return _get(f"/categories/{category_id}/subcategories/{sub_category_id}/texts/?lang={lang}&page={rng.randint(1, 3)}&limit=20{sort}")
+
+def _derge_range(rng: random.Random, ids: DatasetIds) -> Request:
+    start = rng.choice(ids.derge_numbers)
+    return _get(f"/texts/by-derge?start=D{start}-{start + rng.randint(5, 50)}")
+
+def _locate(rng: random.Random, ids: DatasetIds) -> Request:
+    volume, page = rng.choice(ids.folios)
+    return _get(f"/locate?volume={volume}&page={page}")
+
+def _update_text(rng: random.Random, ids: DatasetIds) -> Request:
+    _, _, text_id = rng.choice(ids.texts)
+    return "PUT", f"/texts/{text_id}", {"english_title": f"Revised title {rng.randint(1, 10**6)}"}
+
+SCENARIOS = (
+    # Public
+    Scenario("categories", "public", 10, lambda rng, ids: _get(f"/categories/?lang={rng.choice(('en', 'tb'))}")),
+    Scenario("subcategories", "public", 8, lambda rng, ids: _get(f"/categories/{rng.choice(ids.sub_categories)[0]}/subcategories?lang=en")),
+    Scenario("text_list", "public", 20, _text_list),
+    Scenario("text_detail", "public", 25, lambda rng, ids: _get(f"/texts/{rng.choice(ids.texts)[2]}")),
+    Scenario("text_by_derge", "public", 4, lambda rng, ids: _get(f"/texts/by-derge/{rng.choice(ids.derge_ids)}")),
+    Scenario("derge_range", "public", 3, _derge_range),
+    Scenario("locate", "public", 3, _locate),
+    Scenario("search", "public", 8, lambda rng, ids: _get(f"/search?q={rng.choice(ids.title_words)}&limit=10")),
+    Scenario("search_filters", "public", 2, lambda rng, ids: _get("/search/filters?lang=en")),
+    Scenario("news", "public", 5, lambda rng, ids: _get(f"/news?page={rng.randint(1, 3)}&limit=20")),
+    Scenario("news_detail", "public", 3, lambda rng, ids: _get(f"/news/{rng.choice(ids.news)}")),
+    Scenario("text_audio", "public", 3, lambda rng, ids: _get("/texts/{}/{}/{}/audio".format(*rng.choice(ids.texts)))),
+    Scenario("audio_list", "public", 2, lambda rng, ids: _get(f"/audio?page={rng.randint(1, 3)}&limit=20")),
+    Scenario("videos", "public", 2, lambda rng, ids: _get("/videos")),
+    Scenario("editions", "public", 1, lambda rng, ids: _get("/editions")),
+    Scenario("sermons", "public", 1, lambda rng, ids: _get("/sermons?lang=en")),
+    Scenario("changes", "public", 1, lambda rng, ids: _get(f"/changes?since={rng.randint(0, 1000)}&limit=500")),
+    # Admin (CMS)
+    Scenario("admin_texts", "admin", 4, lambda rng, ids: _get(f"/texts?page={rng.randint(1, 20)}&limit=50")),
+    Scenario("admin_text_search", "admin", 2, lambda rng, ids: _get(f"/texts?search={rng.choice(ids.title_words)}&limit=20")),
+    Scenario("admin_audio", "admin", 1, lambda rng, ids: _get(f"/audio/{rng.choice(ids.audio)}")),
+    Scenario("dashboard_stats", "admin", 2, lambda rng, ids: _get("/dashboard/stats")),
+    Scenario("dashboard_activity", "admin", 1, lambda rng, ids: _get("/dashboard/activity?limit=50")),
+    Scenario("audit_logs", "admin", 2, lambda rng, ids: _get(f"/audit/logs?page={rng.randint(1, 20)}&limit=50")),
+    # Writes
+    Scenario("update_text", "write", 1, _update_text),
+)
+
+def select_scenarios(groups) -> Tuple[Scenario, ...]:
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        raise ValueError(f"Unknown scenario groups: {', '.join(sorted(unknown))} (choose from {', '.join(GROUPS)})")
+    return tuple(s for s in SCENARIOS if s.group in groups)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold start cost, import of main and startup per SCHEMA_STARTUP_MODE
+
+Every measurement runs in a fresh interpreter against a scratch SQLite file
+that already holds the full schema stamped at the Alembic head, so "create"
+(create_all's per-table existence checks) and "check" (one read of
+alembic_version) do the same job. Also lists the slowest imports as reported
+by ``python -X importtime``.
+
+Usage:
+    python benchmarks/startup_time.py [--runs 5] [--top 15]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+IMPORT_MAIN = """
+import time
+start = time.perf_counter()
+import main
+print((time.perf_counter() - start) * 1000)
+"""
+
+IMPORT_AND_START = """
+import time
+start = time.perf_counter()
+import main
+from fastapi.testclient import TestClient
+with TestClient(main.app):
+    print((time.perf_counter() - start) * 1000)
+"""
+
+def build_database(directory: str) -> str:
+    url = f"sqlite:///{directory}/startup.db"
+    os.environ["DATABASE_URL"] = url  # Read by app.database and alembic/env.py, inherited by the children
+    from alembic import command
+    from alembic.config import Config
+    from app.database import engine
+    from app.models import Base
+    from app.utils.schema_startup import ALEMBIC_INI
+    Base.metadata.create_all(bind=engine)
+    command.stamp(Config(str(ALEMBIC_INI)), "head")
+    return url
+
+def run_ms(script: str, runs: int, **env) -> float:
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", script], cwd=project_root, env={**os.environ, **env},
+            capture_output=True, text=True, check=True
+        )
+        timings.append(float(result.stdout.strip().splitlines()[-1]))
+    return statistics.median(timings)
+
+def slowest_imports(top: int):
+    """(cumulative ms, module) of the slowest imports under main"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"], cwd=project_root,
+        capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Only first-level imports of each package, so numbers do not nest
+        if name.startswith(" " * 2) and not name.startswith(" " * 5):
+            rows.append((int(cumulative) / 1000, name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        build_database(directory)
+
+        print(f"{'measurement':<32}{'median ms':>12}")
+        print(f"{'import main':<32}{run_ms(IMPORT_MAIN, args.runs):>12.1f}")
+        for mode in ("create", "check", "skip"):
+            elapsed = run_ms(IMPORT_AND_START, args.runs, SCHEMA_STARTUP_MODE=mode)
+            print(f"{'import + startup (' + mode + ')':<32}{elapsed:>12.1f}")
+
+        print(f"\n{'slowest imports (cumulative)':<32}{'ms':>12}")
+        for elapsed, name in slowest_imports(args.top):
+            print(f"{name:<32}{elapsed:>12.1f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark: text detail loading, legacy joinedload chain vs the "detail" profile
+
+Builds one text with many Yeshe De spans x volumes and a fully populated
+summary in an in-memory SQLite database, then loads it both ways and reports
+statements, result rows, bytes returned by the database and latency.
+
+Usage:
+    python benchmarks/text_detail_loading.py [--spans 20] [--volumes 10] [--iterations 200]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine, event, text as sql_text
+from sqlalchemy.orm import sessionmaker, joinedload
+from sqlalchemy.pool import StaticPool
+
+from app.models import Base, MainCategory, SubCategory, KagyurText, TextSummary, YesheDESpan, Volume, Sermon, Yana, TranslationType
+from app.schemas import KagyurTextResponse
+from app.services.text_service.loadingProfiles import text_loading_options
+
+SUMMARY_FIELDS = [c.name for c in TextSummary.__table__.columns if c.name.endswith(("_english", "_tibetan"))]
+
+def legacy_options():
+    """The joinedload chain GET /texts/{id} used before loading profiles"""
+    return (
+        joinedload(KagyurText.text_summary),
+        joinedload(KagyurText.sermon),
+        joinedload(KagyurText.yana),
+        joinedload(KagyurText.translation_type),
+        joinedload(KagyurText.yeshe_de_spans).joinedload(YesheDESpan.volumes),
+        joinedload(KagyurText.sub_category),
+    )
+
+def build_database(spans: int, volumes: int):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+
+    category = MainCategory(name_english="Discipline", name_tibetan="འདུལ་བ།")
+    sub_category = SubCategory(name_english="Vinaya", name_tibetan="འདུལ་བ་གཞི།", main_category=category)
+    sermon = Sermon(name_english="First Turning", name_tibetan="ཆོས་འཁོར་དང་པོ།")
+    yana = Yana(name_english="Hinayana", name_tibetan="ཐེག་དམན།")
+    translation_type = TranslationType(name_english="Early", name_tibetan="སྔ་འགྱུར།")
+    db.add_all([category, sub_category, sermon, yana, translation_type])
+    db.flush()
+
+    text = KagyurText(
+        sub_category_id=sub_category.id, derge_id="D1", yeshe_de_id="Y1",
+        tibetan_title="འདུལ་བ་གཞི།", english_title="The Chapters on Monastic Discipline",
+        sermon_id=sermon.id, yana_id=yana.id, translation_type_id=translation_type.id
+    )
+    db.add(text)
+    db.flush()
+
+    # ~2 KB per summary field; Tibetan is 3 bytes per character in UTF-8
+    filler = {"english": "Lorem ipsum dolor sit amet. " * 75, "tibetan": "བཀའ་འགྱུར་གྱི་དཀར་ཆག " * 35}
+    db.add(TextSummary(text_id=text.id, **{f: filler[f.rsplit("_", 1)[1]] for f in SUMMARY_FIELDS}))
+
+    for s in range(spans):
+        span = YesheDESpan(text_id=text.id)
+        db.add(span)
+        db.flush()
+        for v in range(volumes):
+            db.add(Volume(yeshe_de_span_id=span.id, volume_number=str(v + 1), start_page=f"{v}a", end_page=f"{v}b", order_index=v))
+    text_id = text.id
+    db.commit()
+    db.close()
+    return engine, Session, text_id
+
+def measure_transfer(engine, Session, text_id: int, options) -> dict:
+    """Run one load, then replay its statements to count rows and bytes returned"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    db = Session()
+    try:
+        db.query(KagyurText).options(*options).filter(KagyurText.id == text_id).first()
+    finally:
+        db.close()
+        event.remove(engine, "before_cursor_execute", capture)
+
+    rows = 0
+    payload_bytes = 0
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            for row in conn.exec_driver_sql(statement, parameters):
+                rows += 1
+                payload_bytes += sum(len(str(value).encode("utf-8")) for value in row if value is not None)
+    return {"statements": len(statements), "rows": rows, "bytes": payload_bytes}
+
+def measure_latency(Session, text_id: int, options, iterations: int) -> float:
+    """Median milliseconds to load and serialize the text with a fresh session"""
+    timings = []
+    for _ in range(iterations):
+        db = Session()
+        start = time.perf_counter()
+        text = db.query(KagyurText).options(*options).filter(KagyurText.id == text_id).first()
+        KagyurTextResponse.model_validate(text)
+        timings.append((time.perf_counter() - start) * 1000)
+        db.close()
+    return statistics.median(timings)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--spans", type=int, default=20)
+    parser.add_argument("--volumes", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    engine, Session, text_id = build_database(args.spans, args.volumes)
+    strategies = {"legacy joinedload": legacy_options(), "detail profile": text_loading_options("detail")}
+
+    print(f"Text with {args.spans} spans x {args.volumes} volumes, full summary\n")
+    print(f"{'strategy':<20}{'statements':>12}{'rows':>8}{'bytes':>12}{'median ms':>12}")
+    results = {}
+    for name, options in strategies.items():
+        result = measure_transfer(engine, Session, text_id, options)
+        result["ms"] = measure_latency(Session, text_id, options, args.iterations)
+        results[name] = result
+        print(f"{name:<20}{result['statements']:>12}{result['rows']:>8}{result['bytes']:>12}{result['ms']:>12.2f}")
+
+    legacy, detail = results["legacy joinedload"], results["detail profile"]
+    print(f"\nBytes: {legacy['bytes'] / detail['bytes']:.1f}x fewer, latency: {legacy['ms'] / detail['ms']:.1f}x faster")
+    return 0 if detail["bytes"] < legacy["bytes"] and detail["ms"] < legacy["ms"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Generate the OpenAPI document into OPENAPI_CACHE_DIR ahead of deployment.
+
+Workers serve /openapi.json from these files; one that finds them missing or
+built from different source generates them at startup instead. Run this at
+build time so no worker has to:
+    python build_openapi.py
+"""
+import sys
+from pathlib import Path
+
+# Add the current directory to Python path
+current_dir = Path(__file__).parent
+sys.path.insert(0, str(current_dir))
+
+from app.core.config import settings
+from app.utils.openapi_cache import build_openapi_cache
+from main import app
+
+def main():
+    manifest = build_openapi_cache(app)
+    print(f"OpenAPI document: {Path(settings.OPENAPI_CACHE_DIR) / manifest['file_name']} ({manifest['size']} bytes)")
+    print(f"ETag: {manifest['etag']}")
+
+if __name__ == "__main__":
+    main()
@@ -12,14 +12,21 @@ sys.path.insert(0, str(current_dir))
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.database import engine
-from app.models import Base
-from app.routers import categories, subcategories, news, audio, videos, auth, editions, texts, users
+from fastapi.staticfiles import StaticFiles
+from app.database import engine, SessionLocal
+from app.routers import mount_routers
+from app.routers import categories, subcategories, news, audio, videos, auth, editions, texts, users, changes, export
 from app.routers.lookups import sermons, translation_types, yanas
-from app.routers.utils import search, dashboard, audit
-
-# Create tables
-Base.metadata.create_all(bind=engine)
+from app.routers.utils import search, dashboard, audit, metrics, profiles, health
+from app.core.config import settings
+from app.utils.compression import CompressionMiddleware
+from app.utils.lookup_registry import get_lookup_registry
+from app.utils.metrics import MetricsMiddleware, instrument_engine, mark_worker_stopped
+from app.utils.openapi_cache import load_openapi_cache, serve_cached_openapi
+from app.utils.profiling import ProfilingMiddleware
+from app.utils.schema_startup import prepare_schema
+from app.utils.slow_query_log import install_slow_query_log
+from app.services.prerender_service.catalogPrerender import prerender_job
 
 # FastAPI app
 app = FastAPI(
@@ -39,22 +46,88 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# gzip/brotli compression; never for auth and user endpoints, whose tokens and
+# personal data must not be exposed to compression side channels (BREACH).
+# The auth routes have no common prefix, so each of their paths is listed.
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MIN_SIZE,
+    path_thresholds={**{route.path: None for route in auth.router.routes}, "/users": None},
+)
+
+# On-demand request profiling (sampled, or X-Profile-Token); see PROFILING_SAMPLE_RATE
+app.add_middleware(ProfilingMiddleware)
+
+# Prometheus metrics; added last so request timings include every other middleware
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    instrument_engine(engine)
+    mount_routers(app, [metrics.router])
+
+# Slow-query log with query plans; see SLOW_QUERY_THRESHOLD_MS
+if settings.SLOW_QUERY_THRESHOLD_MS > 0:
+    install_slow_query_log(engine)
+
 # Include routers
-app.include_router(auth.router)
-app.include_router(categories.router)
-app.include_router(subcategories.router)
-app.include_router(texts.router)
-app.include_router(news.router)
-app.include_router(audio.router)
-app.include_router(videos.router)
-app.include_router(editions.router)
-app.include_router(users.router)
-app.include_router(search.router)
-app.include_router(dashboard.router)
-app.include_router(audit.router)
-app.include_router(sermons.router)
-app.include_router(translation_types.router)
-app.include_router(yanas.router)
+mount_routers(app, [
+    auth.router,
+    categories.router,
+    subcategories.router,
+    texts.router,
+    news.router,
+    audio.router,
+    videos.router,
+    editions.router,
+    users.router,
+    search.router,
+    dashboard.router,
+    audit.router,
+    sermons.router,
+    translation_types.router,
+    yanas.router,
+    changes.router,
+    export.router,
+    profiles.router,
+    health.router,
+])
+
+# /openapi.json from the precomputed document on disk
+serve_cached_openapi(app)
+
+# Pre-rendered public catalog files (also servable straight from a CDN or web server)
+if settings.PRERENDER_ENABLED:
+    Path(settings.PRERENDER_DIR).mkdir(parents=True, exist_ok=True)
+    app.mount("/prerendered", StaticFiles(directory=settings.PRERENDER_DIR), name="prerendered")
+
+@app.on_event("startup")
+async def check_database_schema():
+    """Verify (or, for local SQLite, create) the schema before anything queries it; see SCHEMA_STARTUP_MODE"""
+    prepare_schema(engine)
+
+@app.on_event("startup")
+async def load_lookup_registry():
+    """Load categories and lookup tables into memory before serving"""
+    db = SessionLocal()
+    try:
+        get_lookup_registry(db)
+    finally:
+        db.close()
+
+@app.on_event("startup")
+async def load_openapi_document():
+    """Read the precomputed OpenAPI document (generating it if the code changed since)"""
+    load_openapi_cache(app)
+
+@app.on_event("startup")
+async def refresh_prerendered_catalog():
+    """Bring the pre-rendered catalog up to date in the background (a full render the first time)"""
+    if settings.PRERENDER_ENABLED:
+        prerender_job.schedule()
+
+@app.on_event("shutdown")
+async def stop_worker_metrics():
+    """Remove this worker's live gauges from the merged metrics"""
+    mark_worker_stopped()
 
 @app.get("/")
 async def root():
@@ -67,6 +140,7 @@ async def root():
 
 @app.get("/health")
 async def health_check():
+    """Constant answer kept for existing checks; load balancers should use /health/ready"""
     return {"status": "healthy"}
 
 if __name__ == "__main__":
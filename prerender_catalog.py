@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Render the whole public catalog to PRERENDER_DIR as static JSON files.
+
+The API keeps the files current after writes when PRERENDER_ENABLED=true;
+run this for the first build or to rebuild from scratch:
+    python prerender_catalog.py
+"""
+import sys
+from pathlib import Path
+
+# Add the current directory to Python path
+current_dir = Path(__file__).parent
+sys.path.insert(0, str(current_dir))
+
+from app.core.config import settings
+from app.database import SessionLocal
+from app.services.prerender_service.catalogPrerender import CatalogPrerenderer
+
+def main():
+    db = SessionLocal()
+    try:
+        prerenderer = CatalogPrerenderer(db)
+        prerenderer.render_all()
+        print(f"Files written: {prerenderer.written}")
+        print(f"Output directory: {settings.PRERENDER_DIR}")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Recompute the denormalized text/audio counters on categories and sub-categories.
+
+Run after manual SQL edits or any import that bypassed the API services:
+    python recount_counters.py
+"""
+import sys
+from pathlib import Path
+
+# Add the current directory to Python path
+current_dir = Path(__file__).parent
+sys.path.insert(0, str(current_dir))
+
+from app.database import SessionLocal
+from app.utils.counters import recount_counters
+
+def main():
+    db = SessionLocal()
+    try:
+        result = recount_counters(db)
+        db.commit()
+        print(f"Sub-categories fixed: {result['sub_categories_fixed']}")
+        print(f"Main categories fixed: {result['main_categories_fixed']}")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Compression exclusions: token-bearing auth responses are never compressed
+(BREACH), while ordinary JSON responses are.
+
+Runs the app in-process against a scratch SQLite database. The user names
+are long enough that the token responses pass the compression threshold.
+
+Usage:
+    python tests/test_auth_compression.py
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+_scratch = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{_scratch.name}/compression.db"
+os.environ["OPENAPI_CACHE_DIR"] = f"{_scratch.name}/openapi_cache"
+
+from fastapi.testclient import TestClient
+
+import main as app_main
+from app.core.config import settings
+from app.core.security import hash_password
+from app.database import Base, SessionLocal, engine
+from app.models import User
+
+GZIP = {"Accept-Encoding": "gzip, br"}
+
+# Echoed in the login and signup responses, so both exceed COMPRESSION_MIN_SIZE
+USERNAME = "reader-" + "x" * 2048
+
+def _client() -> TestClient:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        if not db.query(User).filter(User.username == USERNAME).first():
+            db.add(User(username=USERNAME, email="reader@example.org", hashed_password=hash_password("secret"), is_active=True))
+            db.commit()
+    finally:
+        db.close()
+    return TestClient(app_main.app)
+
+def test_login_not_compressed():
+    """/login returns tokens, so it is sent uncompressed"""
+    with _client() as client:
+        response = client.post("/login", json={"username": USERNAME, "password": "secret"}, headers=GZIP)
+        assert response.status_code == 200, response.text
+        assert "access_token" in response.text and len(response.content) >= settings.COMPRESSION_MIN_SIZE
+        assert "content-encoding" not in response.headers, response.headers
+    print("✅ PASS /login is never compressed")
+
+def test_signup_not_compressed():
+    """/signup returns tokens too"""
+    with _client() as client:
+        response = client.post("/signup", json={"username": "newcomer-" + "y" * 2048, "password": "secret"}, headers=GZIP)
+        assert response.status_code == 200, response.text
+        assert len(response.content) >= settings.COMPRESSION_MIN_SIZE
+        assert "content-encoding" not in response.headers, response.headers
+    print("✅ PASS /signup is never compressed")
+
+def test_public_json_compressed():
+    """Other JSON responses over the threshold are still compressed"""
+    with _client() as client:
+        response = client.get("/openapi.json", headers=GZIP)
+        assert response.status_code == 200
+        assert response.headers.get("content-encoding") in ("gzip", "br"), response.headers
+    print("✅ PASS public JSON is compressed")
+
+def main():
+    """Run the compression exclusion tests"""
+    print("🧪 AUTH COMPRESSION TESTS")
+    print("=" * 50)
+    test_login_not_compressed()
+    test_signup_not_compressed()
+    test_public_json_compressed()
+
+if __name__ == "__main__":
+    main()
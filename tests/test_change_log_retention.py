@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Change-log retention: compaction keeps the latest entry per record and
+drops old tombstones, and /changes answers tokens from before the retention
+horizon with 410 instead of silently skipping compacted deletes.
+
+Usage:
+    python tests/test_change_log_retention.py
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+_scratch = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{_scratch.name}/retention.db"
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.database import SessionLocal, engine
+from app.models import Base, ChangeLog
+from app.services.sync_service.changeLogRetention import compact_change_log, oldest_valid_token
+from app.services.sync_service.handleGetChanges import handle_get_changes
+
+def _seed(db):
+    """Entries for three records: two edited long ago and recently, one deleted long ago"""
+    old = datetime.utcnow() - timedelta(days=settings.CHANGES_RETENTION_DAYS + 5)
+    recent = datetime.utcnow() - timedelta(hours=1)
+    db.query(ChangeLog).delete()
+    for table_name, record_id, action, changed_at in (
+        ("sermons", 1, "upsert", old),
+        ("sermons", 1, "upsert", old),
+        ("sermons", 2, "upsert", old),
+        ("sermons", 3, "upsert", old),
+        ("sermons", 3, "delete", old),
+        ("sermons", 1, "upsert", recent),
+        ("sermons", 4, "upsert", recent),
+    ):
+        db.add(ChangeLog(table_name=table_name, record_id=record_id, action=action, changed_at=changed_at))
+    db.commit()
+    return [entry.id for entry in db.query(ChangeLog).order_by(ChangeLog.id)]
+
+def test_compaction_keeps_latest_entry_per_record():
+    """Old superseded entries and old tombstones go; the rest stays"""
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        ids = _seed(db)
+        assert compact_change_log(db) == 4
+        remaining = [(entry.id, entry.record_id) for entry in db.query(ChangeLog).order_by(ChangeLog.id)]
+    assert remaining == [(ids[2], 2), (ids[5], 1), (ids[6], 4)]
+    print("✅ PASS compaction keeps the latest entry per record")
+
+def test_expired_token_gets_410():
+    """A token from before the horizon must resync; 0 and recent tokens are served"""
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        ids = _seed(db)
+        assert oldest_valid_token(db) == ids[5] - 1
+        try:
+            asyncio.run(handle_get_changes(since=ids[1], limit=100, db=db))
+            raise AssertionError("expected 410 for an expired token")
+        except HTTPException as e:
+            assert e.status_code == 410
+        assert asyncio.run(handle_get_changes(since=ids[4], limit=100, db=db)).next_token == ids[6]
+        assert asyncio.run(handle_get_changes(since=0, limit=100, db=db)).next_token == ids[6]
+    print("✅ PASS expired sync tokens get 410")
+
+def main():
+    """Run the change-log retention tests"""
+    print("🧪 CHANGE LOG RETENTION TESTS")
+    print("=" * 50)
+    test_compaction_keeps_latest_entry_per_record()
+    test_expired_token_gets_410()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Dependency overrides: routes added with mount_routers must honour
+``app.dependency_overrides`` like routes added with ``include_router``, so
+tests can stand in for authentication and the database.
+
+Usage:
+    python tests/test_dependency_overrides.py
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+_scratch = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{_scratch.name}/overrides.db"
+os.environ["OPENAPI_CACHE_DIR"] = f"{_scratch.name}/openapi_cache"
+
+from fastapi.testclient import TestClient
+
+import main as app_main
+from app.dependencies.auth import require_admin
+
+FAKE_ADMIN = SimpleNamespace(id=1, username="override", email="override@example.org", is_admin=True, is_active=True)
+
+def test_require_admin_override():
+    """An overridden require_admin lets an admin-only route through without a token"""
+    app = app_main.app
+    with TestClient(app) as client:
+        assert client.get("/texts").status_code in (401, 403)
+        app.dependency_overrides[require_admin] = lambda: FAKE_ADMIN
+        try:
+            response = client.get("/texts")
+            assert response.status_code == 200, response.text
+        finally:
+            app.dependency_overrides.clear()
+        assert client.get("/texts").status_code in (401, 403)
+    print("✅ PASS dependency_overrides apply to mounted routes")
+
+def main():
+    """Run the dependency override tests"""
+    print("🧪 DEPENDENCY OVERRIDE TESTS")
+    print("=" * 50)
+    test_require_admin_override()
+
+if __name__ == "__main__":
+    main()
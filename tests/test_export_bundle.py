@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Catalog bundle: the first GET /export/bundle builds the bundle off the event
+loop, and concurrent requests share that one build.
+
+Usage:
+    python tests/test_export_bundle.py
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+_scratch = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{_scratch.name}/bundle.db"
+os.environ["EXPORT_BUNDLE_DIR"] = f"{_scratch.name}/exports"
+os.environ["OPENAPI_CACHE_DIR"] = f"{_scratch.name}/openapi_cache"
+
+import httpx
+
+import main as app_main
+from app.core.config import settings
+from app.services.export_service import catalogBundle
+from app.utils.single_flight import get_single_flight_stats
+
+def test_first_build_is_shared_and_off_the_loop():
+    """Concurrent first requests get the same bundle from one threadpool build"""
+    loop_thread = threading.get_ident()
+    builds = []
+    build = catalogBundle.build_catalog_bundle
+
+    def recording_build(db):
+        builds.append(threading.get_ident())
+        return build(db)
+
+    async def run():
+        await app_main.app.router.startup()
+        transport = httpx.ASGITransport(app=app_main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(*(client.get("/export/bundle") for _ in range(5)))
+
+    # Settings may already have been read by another test module
+    settings.EXPORT_BUNDLE_DIR = os.environ["EXPORT_BUNDLE_DIR"]
+    catalogBundle.build_catalog_bundle = recording_build
+    try:
+        responses = asyncio.run(run())
+    finally:
+        catalogBundle.build_catalog_bundle = build
+
+    assert [r.status_code for r in responses] == [200] * 5
+    assert len({r.headers["etag"] for r in responses}) == 1
+    assert len(builds) == 1 and builds[0] != loop_thread
+    assert get_single_flight_stats()["catalog_bundle"]["calls"] == 1
+    print("✅ PASS the first bundle is built once, in the threadpool")
+
+def main():
+    """Run the catalog bundle tests"""
+    print("🧪 CATALOG BUNDLE TESTS")
+    print("=" * 50)
+    test_first_build_is_shared_and_off_the_loop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+FastJSONRoute: a handler's return value must be filtered by the response
+model exactly as FastAPI would, so fields the schema does not declare (a
+password hash on a richer model, a subclass's extra field) are never sent.
+
+Usage:
+    python tests/test_fast_json.py
+"""
+
+import sys
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.utils.fast_json import FastJSONRoute
+
+class Public(BaseModel):
+    id: int
+
+class Private(BaseModel):
+    id: int
+    hashed_password: str
+
+class Derived(Public):
+    secret: str
+
+def _client() -> TestClient:
+    router = APIRouter(route_class=FastJSONRoute)
+
+    @router.get("/list-other", response_model=List[Public])
+    def list_other():
+        return [Private(id=1, hashed_password="x")]
+
+    @router.get("/list-derived", response_model=List[Public])
+    def list_derived():
+        return [Public(id=1), Derived(id=2, secret="s")]
+
+    @router.get("/derived", response_model=Public)
+    async def derived():
+        return Derived(id=1, secret="s")
+
+    @router.get("/exact", response_model=List[Public])
+    def exact():
+        return [Public(id=1), Public(id=2)]
+
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+def test_undeclared_fields_are_dropped():
+    """Models other than the response model are filtered down to its fields"""
+    client = _client()
+    assert client.get("/list-other").json() == [{"id": 1}]
+    assert client.get("/list-derived").json() == [{"id": 1}, {"id": 2}]
+    assert client.get("/derived").json() == {"id": 1}
+    print("✅ PASS fields outside the response model are dropped")
+
+def test_exact_models_are_sent():
+    """Instances of exactly the response model are sent as they are"""
+    assert _client().get("/exact").json() == [{"id": 1}, {"id": 2}]
+    print("✅ PASS instances of the response model are sent")
+
+def main():
+    """Run the FastJSONRoute tests"""
+    print("🧪 FAST JSON ROUTE TESTS")
+    print("=" * 50)
+    test_undeclared_fields_are_dropped()
+    test_exact_models_are_sent()
+
+if __name__ == "__main__":
+    main()
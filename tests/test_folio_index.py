@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Folio index: lookups must return exactly the overlapping ranges, in folio
+order, however long or deeply nested the ranges of a volume are.
+
+Usage:
+    python tests/test_folio_index.py
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.utils.folio_index import FolioIndex, FolioRange
+
+def _brute_force(ranges, start, end):
+    return sorted(r for r in ranges if r.start <= end and r.end >= start)
+
+def test_matches_brute_force():
+    """Random volumes with short, long and nested ranges agree with a linear scan"""
+    rng = random.Random(0)
+    for volume in range(50):
+        ranges = []
+        for i in range(rng.randint(0, 80)):
+            start = rng.randint(2, 600)
+            length = rng.choice((0, 1, 3, 10, rng.randint(0, 600)))
+            ranges.append(FolioRange(start, start + length, i, volume * 1000 + i))
+        index = FolioIndex({volume: ranges})
+        for _ in range(100):
+            start = rng.randint(0, 1300)
+            end = start + rng.choice((0, 0, 1, 5, 50))
+            assert index.locate(volume, start, end) == _brute_force(ranges, start, end), (volume, start, end)
+    print("✅ PASS lookups match a linear scan")
+
+def test_long_early_range():
+    """A range spanning the whole volume is found with the short ones it contains"""
+    ranges = [FolioRange(2, 10_000, 1, 1)] + [FolioRange(p, p + 1, p, p) for p in range(10, 10_000, 4)]
+    index = FolioIndex({1: ranges})
+    assert index.locate(1, 5000) == [FolioRange(2, 10_000, 1, 1)]
+    assert index.locate(1, 5002) == [FolioRange(2, 10_000, 1, 1), FolioRange(5002, 5003, 5002, 5002)]
+    assert index.locate(2, 5000) == []
+    print("✅ PASS long ranges are found alongside nested ones")
+
+def main():
+    """Run the folio index tests"""
+    print("🧪 FOLIO INDEX TESTS")
+    print("=" * 50)
+    test_matches_brute_force()
+    test_long_early_range()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Request coalescing tests: concurrent identical calls share one computation,
+and a cancelled leader hands the work to a waiter instead of failing them.
+
+Usage:
+    python tests/test_single_flight.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.utils.single_flight import single_flight, get_single_flight_stats
+
+def test_followers_share_result():
+    """Waiters arriving during the computation get the leader's result"""
+    calls = []
+
+    @single_flight("test_shared")
+    async def load(key):
+        calls.append(key)
+        await asyncio.sleep(0.05)
+        return {"key": key}
+
+    async def run():
+        return await asyncio.gather(*(load("a") for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert results == [{"key": "a"}] * 5, results
+    assert calls == ["a"], calls
+    print("✅ PASS concurrent calls share one computation")
+
+def test_cancelled_leader_hands_over():
+    """Cancelling the leader (client gone) must not cancel its followers"""
+    calls = []
+
+    @single_flight("test_takeover")
+    async def load(key):
+        calls.append(key)
+        await asyncio.sleep(0.05)
+        return {"key": key}
+
+    async def run():
+        leader = asyncio.create_task(load("a"))
+        await asyncio.sleep(0.01)
+        followers = [asyncio.create_task(load("a")) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+        try:
+            await leader
+        except asyncio.CancelledError:
+            pass
+        else:
+            raise AssertionError("leader was not cancelled")
+        return results
+
+    results = asyncio.run(run())
+    assert results == [{"key": "a"}] * 3, results
+    assert calls == ["a", "a"], calls  # The cancelled run and one takeover
+    stats = get_single_flight_stats()["test_takeover"]
+    assert stats["takeovers"] == 3 and stats["calls"] == 2, stats
+    print("✅ PASS followers take over from a cancelled leader")
+
+def main():
+    """Run the request coalescing tests"""
+    print("🧪 SINGLE-FLIGHT TESTS")
+    print("=" * 50)
+    test_followers_share_result()
+    test_cancelled_leader_hands_over()
+
+if __name__ == "__main__":
+    main()